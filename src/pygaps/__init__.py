@@ -62,6 +62,7 @@ from pygaps.core.adsorbate import Adsorbate
 from pygaps.core.material import Material
 from pygaps.core.pointisotherm import PointIsotherm
 from pygaps.core.modelisotherm import ModelIsotherm
+from pygaps.core.isothermcollection import IsothermCollection
 
 # Data load
 load_data()
@@ -5,6 +5,8 @@ from .alphas_plots import alpha_s
 from .alphas_plots import alpha_s_raw
 from .area_bet import area_BET
 from .area_bet import area_BET_raw
+from .area_bet import area_BET_windows
+from .area_bet import area_BET_windows_raw
 from .area_lang import area_langmuir
 from .area_lang import area_langmuir_raw
 from .dr_da_plots import da_plot
@@ -4,6 +4,7 @@ import textwrap
 from typing import TYPE_CHECKING
 
 import numpy
+import pandas
 from scipy import constants
 from scipy import stats
 
@@ -348,6 +349,250 @@ def area_BET_raw(
     )
 
 
+def area_BET_windows(
+    isotherm: "PointIsotherm | ModelIsotherm",
+    branch: str = 'ads',
+    min_points: int = 3,
+    verbose: bool = False,
+):
+    r"""
+    Calculate BET area from an isotherm, trying every pressure range.
+
+    Rather than selecting a single pressure range, the BET fit is done on
+    every range of at least ``min_points`` consecutive points. The ranges
+    which satisfy the Rouquerol criteria are kept, and the one with the most
+    points (then the best correlation) is chosen. The spread of the areas
+    of all valid ranges shows how much the area depends on the chosen range.
+
+    Parameters
+    ----------
+    isotherm : PointIsotherm, ModelIsotherm
+        The isotherm of which to calculate the BET surface area.
+    branch : {'ads', 'des'}, optional
+        Branch of the isotherm to use. It defaults to adsorption.
+    min_points : int, optional
+        Smallest number of points in a pressure range, at least 3.
+    verbose : bool, optional
+        Prints extra information and plots graphs of the chosen range.
+
+    Returns
+    -------
+    dict
+        A dictionary of results with the same components as
+        :meth:`~pygaps.characterisation.area_bet.area_BET`, for the
+        chosen pressure range, and the following:
+
+        - ``candidates`` (DataFrame) : fits of every pressure range,
+          see :meth:`~pygaps.characterisation.area_bet.area_BET_windows_raw`
+        - ``area_distribution`` (array) : areas of all valid pressure ranges
+
+    Raises
+    ------
+    ParameterError
+        When something is wrong with the function parameters.
+    CalculationError
+        When no pressure range satisfies the Rouquerol criteria.
+
+    See Also
+    --------
+    pygaps.characterisation.area_bet.area_BET : single range calculation
+    pygaps.characterisation.area_bet.area_BET_windows_raw : low level method
+
+    """
+    # get adsorbate properties
+    adsorbate = Adsorbate.find(isotherm.adsorbate)
+    cross_section = adsorbate.get_prop("cross_sectional_area")
+
+    # Read data in
+    pressure, loading = get_iso_loading_and_pressure_ordered(
+        isotherm, branch, {
+            "loading_basis": "molar",
+            "loading_unit": "mol"
+        }, {"pressure_mode": "relative"}
+    )
+
+    candidates, chosen = area_BET_windows_raw(
+        pressure,
+        loading,
+        cross_section,
+        min_points,
+    )
+    if chosen is None:
+        raise CalculationError(
+            "No pressure range satisfies the Rouquerol criteria. "
+            "Unable to calculate BET area."
+        )
+    result = candidates.loc[chosen]
+    minimum, maximum = int(result['minimum']), int(result['maximum'])
+    areas = candidates.loc[candidates['valid'], 'area'].to_numpy()
+
+    if verbose:
+        logger.info(
+            textwrap.dedent(
+                f"""\
+            Valid BET pressure ranges: {len(areas)} out of {len(candidates)}
+            BET areas of valid ranges: {areas.min():.4g} to {areas.max():.4g} m2/{isotherm.material_unit}
+            BET area: a = {result['area']:.4g} m2/{isotherm.material_unit}
+            The BET constant is: C = {result['c_const']:.1f}
+            Minimum pressure point is {pressure[minimum]:.3g} and maximum is {pressure[maximum]:.3g}
+            Statistical monolayer at: n = {result['n_monolayer']:.3g} mol/{isotherm.material_unit}
+            """
+            )
+        )
+
+        # Generate plot of the BET points chosen
+        from pygaps.graphing.calc_graphs import bet_plot
+        bet_plot(
+            pressure,
+            bet_transform(pressure, loading),
+            minimum,
+            maximum,
+            result['slope'],
+            result['intercept'],
+            result['p_monolayer'],
+            bet_transform(result['p_monolayer'], result['n_monolayer']),
+        )
+
+        # Generate plot of the Rouquerol points chosen
+        from pygaps.graphing.calc_graphs import roq_plot
+        roq_plot(
+            pressure,
+            roq_transform(pressure, loading),
+            minimum,
+            maximum,
+            result['p_monolayer'],
+            roq_transform(result['p_monolayer'], result['n_monolayer']),
+        )
+
+    return {
+        'area': result['area'],
+        'c_const': result['c_const'],
+        'n_monolayer': result['n_monolayer'],
+        'p_monolayer': result['p_monolayer'],
+        'bet_slope': result['slope'],
+        'bet_intercept': result['intercept'],
+        'corr_coef': result['corr_coef'],
+        'p_limit_indices': (minimum, maximum),
+        'candidates': candidates,
+        'area_distribution': areas,
+    }
+
+
+def area_BET_windows_raw(
+    pressure: "list[float]",
+    loading: "list[float]",
+    cross_section: float,
+    min_points: int = 3,
+):
+    """
+    Calculate BET-determined surface area on every pressure range.
+
+    A linear regression of the BET plot is done on each range of
+    consecutive points, all at once, from cumulative sums of the points.
+    Each range is then checked against the Rouquerol criteria.
+
+    Parameters
+    ----------
+    pressure : list[float]
+        Pressures, relative.
+    loading : list[float]
+        Loadings, in mol/basis.
+    cross_section : float
+        Adsorbed cross-section of the molecule of the adsorbate, in nm.
+    min_points : int, optional
+        Smallest number of points in a pressure range, at least 3.
+
+    Returns
+    -------
+    candidates : DataFrame
+        Fit of each pressure range, with the indices of its first and last
+        points (``minimum``, ``maximum``), its pressures (``p_min``, ``p_max``),
+        number of ``points``, BET ``area``, ``c_const``, ``n_monolayer``,
+        ``p_monolayer``, ``slope``, ``intercept`` and ``corr_coef``,
+        whether the Rouquerol transform does not decrease (``rouquerol``),
+        the C constant is positive (``c_positive``), the monolayer is
+        in the range (``monolayer_in_range``), and all three (``valid``).
+    chosen : int or None
+        Index of the valid pressure range with the most points, then
+        the best correlation, or None if no range is valid.
+
+    """
+    # Check lengths
+    if len(pressure) == 0:
+        raise ParameterError("Empty input values!")
+    if len(pressure) != len(loading):
+        raise ParameterError("The length of the pressure and loading arrays do not match.")
+    if min_points < 3:
+        raise ParameterError("Pressure ranges need at least 3 points.")
+    if len(pressure) < min_points:
+        raise CalculationError(
+            f"The isotherm does not have enough points (at least {min_points}) "
+            "in the BET region. Unable to calculate BET area."
+        )
+
+    # Ensure numpy arrays, if not already
+    loading = numpy.asarray(loading, dtype=float)
+    pressure = numpy.asarray(pressure, dtype=float)
+
+    # first and last point of every range
+    minimum, maximum = numpy.triu_indices(len(pressure), k=min_points - 1)
+    points = maximum - minimum + 1
+
+    # sums over each range from cumulative sums, centred to limit round-off
+    bet_t_array = bet_transform(pressure, loading)
+    x = pressure - pressure.mean()
+    y = bet_t_array - bet_t_array.mean()
+
+    def range_sum(values):
+        cumulative = numpy.concatenate(([0], numpy.cumsum(values)))
+        return cumulative[maximum + 1] - cumulative[minimum]
+
+    sum_x, sum_y = range_sum(x), range_sum(y)
+    sxx = range_sum(x * x) - sum_x**2 / points
+    syy = range_sum(y * y) - sum_y**2 / points
+    sxy = range_sum(x * y) - sum_x * sum_y / points
+
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        slope = sxy / sxx
+        intercept = (sum_y / points + bet_t_array.mean()) - slope * (sum_x / points + pressure.mean())
+        corr_coef = sxy / numpy.sqrt(sxx * syy)
+        n_monolayer, p_monolayer, c_const, area = bet_parameters(slope, intercept, cross_section)
+
+    # the Rouquerol transform must not decrease over the whole range, as in area_BET_raw
+    decreasing = numpy.concatenate(([0], numpy.cumsum(numpy.diff(roq_transform(pressure, loading)) < 0)))
+    rouquerol = decreasing[maximum] == decreasing[minimum]
+    c_positive = c_const > 0
+    monolayer_in_range = (loading[minimum] < n_monolayer) & (n_monolayer < loading[maximum])
+    valid = rouquerol & c_positive & monolayer_in_range
+
+    candidates = pandas.DataFrame({
+        'minimum': minimum,
+        'maximum': maximum,
+        'p_min': pressure[minimum],
+        'p_max': pressure[maximum],
+        'points': points,
+        'area': area,
+        'c_const': c_const,
+        'n_monolayer': n_monolayer,
+        'p_monolayer': p_monolayer,
+        'slope': slope,
+        'intercept': intercept,
+        'corr_coef': corr_coef,
+        'rouquerol': rouquerol,
+        'c_positive': c_positive,
+        'monolayer_in_range': monolayer_in_range,
+        'valid': valid,
+    })
+
+    chosen = None
+    if valid.any():
+        chosen = candidates[valid].sort_values(['points', 'corr_coef'], ascending=False).index[0]
+    else:
+        logger.warning("No pressure range satisfies the Rouquerol criteria.")
+
+    return candidates, chosen
+
+
 def roq_transform(pressure, loading):
     """Rouquerol transform function."""
     return loading * (1 - pressure)
@@ -161,6 +161,13 @@ class Adsorbate():
             return self.name == other.name
         return other.lower() in self.alias
 
+    def __getstate__(self):
+        """Drop the CoolProp state when pickled, it is regenerated when called."""
+        state = self.__dict__.copy()
+        state['_state'] = None
+        state['_backend_mode'] = None
+        return state
+
     def __add__(self, other):
         """Overload addition operator to use name."""
         return self.name + other
@@ -13,6 +13,7 @@ from pygaps.units.converter_unit import _PRESSURE_UNITS
 from pygaps.units.converter_unit import _TEMPERATURE_UNITS
 from pygaps.utilities.exceptions import ParameterError
 from pygaps.utilities.hashgen import isotherm_to_hash
+from pygaps.utilities.python_utilities import ObservedDict
 
 SHORTHANDS = {
     'm': "material",
@@ -94,6 +95,13 @@ class BaseIsotherm():
         "m",
         "t",
         "a",
+        "_iso_id",
+    ]
+    # attributes which are not part of the isotherm hash
+    # and can be set without invalidating the cached id
+    # subclasses extend this
+    _hash_exempt_params = [
+        "_iso_id",
     ]
 
     ##########################################################
@@ -125,7 +133,7 @@ class BaseIsotherm():
         # Must-have properties of the isotherm
         #
         # Basic checks
-        if None in [material, adsorbate, temperature]:
+        if any(param is None for param in [material, adsorbate, temperature]):
             raise ParameterError(
                 f"Isotherm MUST have the following properties: {self._required_params}"
             )
@@ -215,10 +223,40 @@ class BaseIsotherm():
     ##########################################################
     #   Overloaded and own functions
 
+    def __setattr__(self, name, value):
+        """Invalidate the cached isotherm id whenever an attribute changes."""
+        if name == "properties":
+            value = ObservedDict(value, on_change=self._reset_iso_id)
+        if name not in self._hash_exempt_params:
+            self._reset_iso_id()
+        super().__setattr__(name, value)
+
+    def _reset_iso_id(self):
+        """Discard the cached isotherm id."""
+        self.__dict__.pop("_iso_id", None)
+
     @property
     def iso_id(self) -> str:
-        """Return an unique identifier of the isotherm."""
-        return isotherm_to_hash(self)
+        """
+        Return an unique identifier of the isotherm.
+
+        The hash is computed once and stored on the instance. It is
+        recomputed only when the isotherm is modified: when any attribute
+        (units, data, material, adsorbate, temperature) is set, or when
+        the ``properties`` dictionary, the material or the model change.
+        In-place edits of the underlying data must be followed by an assignment
+        (e.g. ``isotherm.data_raw = data``) to be picked up.
+        """
+        version = self._iso_id_version()
+        cached = self.__dict__.get("_iso_id")
+        if cached is None or cached[0] != version:
+            cached = (version, isotherm_to_hash(self))
+            self.__dict__["_iso_id"] = cached
+        return cached[1]
+
+    def _iso_id_version(self) -> tuple:
+        """Return the change counters of the objects the isotherm id depends on."""
+        return (self._material.__dict__.get("_version"), )
 
     @property
     def material(self) -> Material:
@@ -228,6 +266,7 @@ class BaseIsotherm():
     @material.setter
     def material(self, value: t.Union[str, dict, Material]):
         if isinstance(value, dict):
+            value = dict(value)
             name = value.pop('name', None)
             try:
                 self._material = Material.find(name)
@@ -0,0 +1,742 @@
+"""
+This module contains a container which holds many point isotherms in columnar form.
+"""
+
+import typing as t
+
+import numpy
+import pandas
+
+from pygaps.core.adsorbate import Adsorbate
+from pygaps.core.baseisotherm import BaseIsotherm
+from pygaps.core.material import Material
+from pygaps.core.pointisotherm import PointIsotherm
+from pygaps.units.converter_mode import c_loading
+from pygaps.units.converter_mode import c_material
+from pygaps.units.converter_mode import c_pressure
+from pygaps.units.converter_mode import c_temperature
+from pygaps.utilities.exceptions import CalculationError
+from pygaps.utilities.exceptions import ParameterError
+from pygaps.utilities.exceptions import pgError
+
+_BRANCHES = {'ads': 0, 'des': 1}
+
+
+class IsothermCollection():
+    """
+    Class which holds the points of many isotherms in shared arrays.
+
+    The pressure, loading and branch of every datapoint are stored as
+    contiguous (ragged) columns, where the points of isotherm ``i`` are
+    found between ``offsets[i]`` and ``offsets[i + 1]``. The isotherm
+    parameters are kept in a ``metadata`` DataFrame, with one row per isotherm,
+    while materials and adsorbates are shared between all isotherms which use
+    them.
+
+    Batch operations (conversion, interpolation and spreading pressure) are
+    performed on the entire collection at once, without creating individual
+    isotherm objects. A single ``PointIsotherm`` can be obtained by indexing
+    the collection: its data columns are views on the collection arrays.
+
+    Parameters
+    ----------
+    isotherms : iterable of PointIsotherm
+        The isotherms to store in the collection.
+
+    Notes
+    -----
+    Only the pressure, loading and branch columns of each isotherm are stored,
+    with any other data columns being discarded.
+
+    Isotherm views are created with 'array' storage and share memory with
+    the collection. Converting a view does not modify the collection, as
+    converted data is stored in new arrays. Conversely, any conversion of the
+    collection is not reflected in previously created views.
+
+    Interpolation and spreading pressure are computed in the units of each
+    isotherm. Use ``convert`` to bring all isotherms to the same units first.
+
+    """
+
+    # columns of the metadata table
+    _metadata_columns = ['material', 'adsorbate', 'temperature'] + list(BaseIsotherm._unit_params)
+
+    ##########################################################
+    #   Instantiation and classmethods
+
+    def __init__(self, isotherms: t.Iterable[PointIsotherm] = ()):
+        """Gather the data and parameters of each isotherm."""
+        pressures, loadings, branches = [], [], []
+        metadata, properties = [], []
+        materials, adsorbates = {}, {}
+
+        for isotherm in isotherms:
+            if not isinstance(isotherm, PointIsotherm):
+                raise ParameterError(
+                    "An IsothermCollection can only be created from PointIsotherms."
+                )
+            pressures.append(isotherm._column(isotherm.pressure_key, indexed=False))
+            loadings.append(isotherm._column(isotherm.loading_key, indexed=False))
+            branches.append(isotherm._column('branch', indexed=False))
+
+            material = materials.setdefault(str(isotherm.material), isotherm.material)
+            adsorbate = adsorbates.setdefault(str(isotherm.adsorbate), isotherm.adsorbate)
+            metadata.append({
+                'material': str(material),
+                'adsorbate': str(adsorbate),
+                'temperature': isotherm.temperature,
+                **isotherm.units,
+            })
+            properties.append(dict(isotherm.properties))
+
+        lengths = [len(pressure) for pressure in pressures]
+        self.offsets = numpy.concatenate(([0], numpy.cumsum(lengths, dtype=int)))
+        self.columns = {
+            'pressure': _concatenate(pressures, float),
+            'loading': _concatenate(loadings, float),
+            'branch': _concatenate(branches, numpy.int8),
+        }
+        self.metadata = pandas.DataFrame(metadata, columns=self._metadata_columns)
+        self.materials = materials
+        self.adsorbates = adsorbates
+        self._properties = properties
+
+        # Sorted interpolation and spreading pressure tables, per branch
+        self._tables = {}
+
+    @classmethod
+    def _from_columns(
+        cls,
+        columns: dict,
+        offsets: numpy.ndarray,
+        metadata: pandas.DataFrame,
+        properties: t.List[dict],
+        materials: dict,
+        adsorbates: dict,
+    ):
+        """Create a collection directly from its internal data."""
+        collection = cls()
+        collection.columns = columns
+        collection.offsets = offsets
+        collection.metadata = metadata.reset_index(drop=True)
+        collection._properties = properties
+        collection.materials = {
+            name: materials[name]
+            for name in collection.metadata['material'].unique()
+        }
+        collection.adsorbates = {
+            name: adsorbates[name]
+            for name in collection.metadata['adsorbate'].unique()
+        }
+        return collection
+
+    ##########################################################
+    #   Overloaded and own functions
+
+    def __len__(self) -> int:
+        """Return the number of isotherms in the collection."""
+        return len(self.metadata)
+
+    def __iter__(self) -> t.Iterator[PointIsotherm]:
+        """Iterate over isotherm views."""
+        for index in range(len(self)):
+            yield self[index]
+
+    def __getitem__(self, index: int) -> PointIsotherm:
+        """
+        Return a PointIsotherm from the collection. The isotherm
+        data columns are views on the collection arrays.
+        """
+        index = range(len(self))[index]
+        rows = slice(self.offsets[index], self.offsets[index + 1])
+        params = self.metadata.iloc[index].to_dict()
+        material = self.materials[params.pop('material')]
+        adsorbate = self.adsorbates[params.pop('adsorbate')]
+        temperature = params.pop('temperature')
+        if params['temperature_unit'] != "K":
+            temperature = c_temperature(temperature, "K", params['temperature_unit'])
+
+        return PointIsotherm(
+            pressure=self.columns['pressure'][rows],
+            loading=self.columns['loading'][rows],
+            branch=self.columns['branch'][rows],
+            storage='array',
+            material=material,
+            adsorbate=adsorbate,
+            temperature=temperature,
+            **params,
+            **self._properties[index],
+        )
+
+    def __repr__(self) -> str:
+        """Print key collection parameters."""
+        return (
+            f"<{type(self).__name__}>: {len(self)} isotherms, "
+            f"{len(self.columns['pressure'])} points"
+        )
+
+    @property
+    def lengths(self) -> numpy.ndarray:
+        """Return the number of points of each isotherm."""
+        return numpy.diff(self.offsets)
+
+    ##########################################################
+    #   Selection functions
+
+    def select(self, indices: t.Union[t.List[int], numpy.ndarray]) -> "IsothermCollection":
+        """
+        Return a new collection with the isotherms at the given positions.
+
+        Parameters
+        ----------
+        indices : array of int or array of bool
+            The positions of the isotherms to select, or a boolean mask.
+
+        Returns
+        -------
+        IsothermCollection
+            A collection with a copy of the selected data.
+
+        """
+        indices = numpy.arange(len(self))[numpy.asarray(indices)]
+        lengths = self.lengths[indices]
+        offsets = numpy.concatenate(([0], numpy.cumsum(lengths, dtype=int)))
+        # position of every selected point in the current columns
+        rows = numpy.arange(offsets[-1]) + numpy.repeat(self.offsets[indices] - offsets[:-1], lengths)
+
+        return self._from_columns(
+            columns={key: val[rows]
+                     for key, val in self.columns.items()},
+            offsets=offsets,
+            metadata=self.metadata.iloc[indices],
+            properties=[self._properties[index] for index in indices],
+            materials=self.materials,
+            adsorbates=self.adsorbates,
+        )
+
+    def filter(
+        self,
+        material: t.Union[str, t.List[str]] = None,
+        adsorbate: t.Union[str, t.List[str]] = None,
+        temperature: t.Union[float, t.Tuple[float, float]] = None,
+    ) -> "IsothermCollection":
+        """
+        Return a new collection of the isotherms which match all criteria.
+
+        Parameters
+        ----------
+        material : str or list of str, optional
+            Material name(s) to select.
+        adsorbate : str or list of str, optional
+            Adsorbate name(s) to select. Any adsorbate alias can be used.
+        temperature : float or (float, float), optional
+            Temperature to select, or an inclusive range of temperatures, in K.
+
+        Returns
+        -------
+        IsothermCollection
+            A collection with a copy of the selected data.
+
+        """
+        mask = numpy.ones(len(self), dtype=bool)
+
+        if material is not None:
+            if isinstance(material, (str, Material)):
+                material = [material]
+            names = [name for name, mat in self.materials.items() if any(mat == m for m in material)]
+            mask &= self.metadata['material'].isin(names).values
+
+        if adsorbate is not None:
+            if isinstance(adsorbate, (str, Adsorbate)):
+                adsorbate = [adsorbate]
+            names = [
+                name for name, ads in self.adsorbates.items() if any(ads == a for a in adsorbate)
+            ]
+            mask &= self.metadata['adsorbate'].isin(names).values
+
+        if temperature is not None:
+            temperatures = self.metadata['temperature'].values
+            if isinstance(temperature, (tuple, list)):
+                mask &= (temperatures >= temperature[0]) & (temperatures <= temperature[1])
+            else:
+                mask &= numpy.isclose(temperatures, temperature)
+
+        return self.select(mask)
+
+    ##########################################################
+    #   Conversion functions
+
+    def convert(
+        self,
+        pressure_mode: str = None,
+        pressure_unit: str = None,
+        loading_basis: str = None,
+        loading_unit: str = None,
+        material_basis: str = None,
+        material_unit: str = None,
+    ):
+        """
+        Convert the mode/basis/units of all isotherms in the collection.
+
+        Parameters
+        ----------
+        pressure_mode : {'absolute', 'relative', 'relative%'}
+            The mode in which the isotherms should be converted.
+        pressure_unit : str
+            The unit into which the internal pressure should be converted to.
+            Only makes sense if converting to absolute pressure.
+        loading_basis : {'mass', 'molar', 'volume_gas', 'volume_liquid', 'percent', 'fraction'}
+            The basis in which the isotherms should be converted.
+        loading_unit : str
+            The unit into which the internal loading should be converted to.
+        material_basis : {'mass', 'molar', 'volume'}
+            The basis in which the isotherms should be converted.
+        material_unit : str
+            The unit into which the material should be converted to.
+
+        """
+        if pressure_mode or pressure_unit:
+            self.convert_pressure(mode_to=pressure_mode, unit_to=pressure_unit)
+        if material_basis or material_unit:
+            self.convert_material(basis_to=material_basis, unit_to=material_unit)
+        if loading_basis or loading_unit:
+            self.convert_loading(basis_to=loading_basis, unit_to=loading_unit)
+
+    def convert_pressure(self, mode_to: str = None, unit_to: str = None):
+        """
+        Convert the pressure of all isotherms, as in
+        ``PointIsotherm.convert_pressure``.
+
+        Parameters
+        ----------
+        mode_to : {'absolute', 'relative', 'relative%'}
+            The mode in which the isotherms should be converted.
+        unit_to : str
+            The unit into which the internal pressure should be converted to.
+            Only makes sense if converting to absolute pressure.
+
+        """
+        def factor(params):
+            _mode_to = mode_to or params['pressure_mode']
+            if _mode_to == params['pressure_mode'] and unit_to == params['pressure_unit']:
+                return 1, {}
+            try:
+                value = c_pressure(
+                    1.0,
+                    mode_from=params['pressure_mode'],
+                    mode_to=_mode_to,
+                    unit_from=params['pressure_unit'],
+                    unit_to=unit_to,
+                    adsorbate=self.adsorbates[params['adsorbate']],
+                    temp=params['temperature'],
+                )
+            except pgError as err:
+                raise CalculationError(
+                    f"The isotherms of {params['adsorbate']} at {params['temperature']} K "
+                    f"cannot be converted to a {_mode_to} basis ({unit_to}). "
+                    "Is the adsorbate supercritical? "
+                    "Does the adsorbate have a thermodynamical backend?"
+                ) from err
+            if _mode_to == 'absolute':
+                unit = unit_to or params['pressure_unit']
+            else:
+                unit = None
+            return value, {'pressure_mode': _mode_to, 'pressure_unit': unit}
+
+        self._convert('pressure', ['adsorbate', 'temperature', 'pressure_mode', 'pressure_unit'], factor)
+
+    def convert_loading(self, basis_to: str = None, unit_to: str = None):
+        """
+        Convert the loading of all isotherms, as in
+        ``PointIsotherm.convert_loading``.
+
+        Parameters
+        ----------
+        basis_to : {'mass', 'molar', 'volume_gas', 'volume_liquid', 'percent', 'fraction'}
+            The basis in which the isotherms should be converted.
+        unit_to : str
+            The unit into which the internal loading should be converted to.
+
+        """
+        def factor(params):
+            _basis_to = basis_to or params['loading_basis']
+            if _basis_to == params['loading_basis'] and unit_to == params['loading_unit']:
+                return 1, {}
+            if params['loading_basis'] in ['percent', 'fraction'] and \
+                    _basis_to == params['loading_basis']:
+                return 1, {}
+            value = c_loading(
+                1.0,
+                basis_from=params['loading_basis'],
+                basis_to=_basis_to,
+                unit_from=params['loading_unit'],
+                unit_to=unit_to,
+                adsorbate=self.adsorbates[params['adsorbate']],
+                temp=params['temperature'],
+                basis_material=params['material_basis'],
+                unit_material=params['material_unit'],
+            )
+            unit = None if _basis_to in ['percent', 'fraction'] else unit_to
+            return value, {'loading_basis': _basis_to, 'loading_unit': unit}
+
+        self._convert(
+            'loading',
+            ['adsorbate', 'temperature', 'loading_basis', 'loading_unit', 'material_basis', 'material_unit'],
+            factor,
+        )
+
+    def convert_material(self, basis_to: str = None, unit_to: str = None):
+        """
+        Convert the material basis of all isotherms, as in
+        ``PointIsotherm.convert_material``.
+
+        Parameters
+        ----------
+        basis_to : {'mass', 'molar', 'volume'}
+            The basis in which the isotherms should be converted.
+        unit_to : str
+            The unit into which the material should be converted to.
+
+        """
+        def factor(params):
+            _basis_to = basis_to or params['material_basis']
+            if _basis_to == params['material_basis'] and unit_to == params['material_unit']:
+                return 1, {}
+            fractional = params['loading_basis'] in ['percent', 'fraction']
+            if fractional and _basis_to == params['material_basis']:
+                return 1, {'material_unit': unit_to}
+
+            value = c_material(
+                1.0,
+                basis_from=params['material_basis'],
+                basis_to=_basis_to,
+                unit_from=params['material_unit'],
+                unit_to=unit_to,
+                material=self.materials[params['material']],
+            )
+            if fractional:
+                # loading must be simultaneously converted
+                value = c_loading(
+                    value,
+                    basis_from='volume_liquid'
+                    if params['material_basis'] == 'volume' else params['material_basis'],
+                    basis_to='volume_liquid' if _basis_to == 'volume' else _basis_to,
+                    unit_from=params['material_unit'],
+                    unit_to=unit_to,
+                    adsorbate=self.adsorbates[params['adsorbate']],
+                    temp=params['temperature'],
+                )
+            return value, {'material_basis': _basis_to, 'material_unit': unit_to}
+
+        self._convert('loading', self._metadata_columns, factor)
+
+    def _convert(self, column: str, depends: t.List[str], factor: t.Callable):
+        """
+        Multiply a data column by a factor computed for every unique
+        set of isotherm parameters, and update the metadata.
+        """
+        if not len(self):
+            return
+
+        groups = self.metadata.groupby(depends, dropna=False, sort=False).indices
+        factors = numpy.ones(len(self))
+        metadata = self.metadata.copy()
+        for rows in groups.values():
+            value, updates = factor(self.metadata.iloc[rows[0]].to_dict())
+            factors[rows] = value
+            for key, val in updates.items():
+                metadata.iloc[rows, metadata.columns.get_loc(key)] = val
+
+        self.columns = {
+            **self.columns,
+            column: self.columns[column] * numpy.repeat(factors, self.lengths),
+        }
+        self.metadata = metadata
+
+        # Reset interpolation and spreading pressure tables
+        self._tables = {}
+
+    ##########################################################
+    #   Batch calculations
+
+    def loading_at(
+        self,
+        pressure: t.Union[float, numpy.ndarray],
+        branch: str = 'ads',
+        interp_fill: t.Union[float, t.Tuple[float, float], str] = None,
+    ) -> numpy.ndarray:
+        """
+        Linearly interpolate all isotherms to compute loading at any pressure given.
+
+        Parameters
+        ----------
+        pressure : float or array
+            Pressure at which to compute loading. A scalar or a 1D array
+            is used for all isotherms, while a 2D array with one row
+            per isotherm gives the pressures for each isotherm.
+        branch : {'ads', 'des'}
+            The branch the interpolation takes into account.
+        interp_fill : float or (float, float) or “extrapolate”, optional
+            What to do outside data bounds, as in ``PointIsotherm.loading_at``.
+            If blank, interpolation will not predict outside the bounds of data.
+
+        Returns
+        -------
+        array
+            Predicted loading, with one row per isotherm. Isotherms with
+            fewer than two points on the branch return NaN.
+
+        """
+        return self._interpolate('pressure', 'loading', pressure, branch, interp_fill)
+
+    def pressure_at(
+        self,
+        loading: t.Union[float, numpy.ndarray],
+        branch: str = 'ads',
+        interp_fill: t.Union[float, t.Tuple[float, float], str] = None,
+    ) -> numpy.ndarray:
+        """
+        Linearly interpolate all isotherms to compute pressure at any loading given.
+
+        Parameters
+        ----------
+        loading : float or array
+            Loading at which to compute pressure. A scalar or a 1D array
+            is used for all isotherms, while a 2D array with one row
+            per isotherm gives the loadings for each isotherm.
+        branch : {'ads', 'des'}
+            The branch the interpolation takes into account.
+        interp_fill : float or (float, float) or “extrapolate”, optional
+            What to do outside data bounds, as in ``PointIsotherm.pressure_at``.
+            If blank, interpolation will not predict outside the bounds of data.
+
+        Returns
+        -------
+        array
+            Predicted pressure, with one row per isotherm. Isotherms with
+            fewer than two points on the branch return NaN.
+
+        """
+        return self._interpolate('loading', 'pressure', loading, branch, interp_fill)
+
+    def spreading_pressure_at(
+        self,
+        pressure: t.Union[float, numpy.ndarray],
+        branch: str = 'ads',
+        interp_fill: t.Union[float, t.Tuple[float, float], str] = None,
+    ) -> numpy.ndarray:
+        r"""
+        Calculate reduced spreading pressure of all isotherms at a bulk adsorbate pressure P.
+
+        The integral is computed in the same way as
+        ``PointIsotherm.spreading_pressure_at``, from a linear
+        interpolation of the isotherm data:
+
+        .. math::
+
+            \Pi(p) = \int_0^p \frac{q(\hat{p})}{ \hat{p}} d\hat{p}.
+
+        Parameters
+        ----------
+        pressure : float or array
+            Pressure at which to compute the spreading pressure. A scalar
+            or a 1D array is used for all isotherms, while a 2D array with
+            one row per isotherm gives the pressures for each isotherm.
+        branch : {'ads', 'des'}
+            The branch of the use for calculation. Defaults to adsorption.
+        interp_fill : float or (float, float) or “extrapolate”, optional
+            Loading to assume beyond the highest pressure in the data.
+            If blank, an error is raised in this case.
+
+        Returns
+        -------
+        array
+            Spreading pressure, :math:`\Pi`, with one row per isotherm.
+            Isotherms with fewer than two points on the branch return NaN.
+
+        """
+        pressures, loadings, areas, starts, counts = self._table('pressure', branch)
+        iso, query, shape = self._queries(pressure)
+
+        valid = counts[iso] > 1
+        if not valid.any():
+            return numpy.full(shape, numpy.nan)
+        first = numpy.where(valid, starts[iso], 0)
+
+        if interp_fill is None:
+            last = numpy.where(valid, starts[iso] + counts[iso] - 1, 0)
+            outside = valid & (query > pressures[last])
+            if outside.any():
+                raise CalculationError(
+                    f"To compute the spreading pressure of {len(numpy.unique(iso[outside]))} "
+                    f"isotherm(s) (first: {iso[outside][0]}), "
+                    "the isotherm data would need to be extrapolated. "
+                    "Pass an `interp_fill`, or fit an analytical model to the isotherms."
+                )
+
+        n_points = self._count_below(pressures, starts, counts, iso, query)
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            last = first + numpy.where(valid, numpy.maximum(n_points - 1, 0), 0)
+            henry_const = loadings[first] / pressures[first]
+
+            loading_at_p = self.loading_at(
+                numpy.maximum(query, pressures[first]).reshape(shape),
+                branch=branch,
+                interp_fill=interp_fill,
+            ).ravel()
+            slope = (loading_at_p - loadings[last]) / (query - pressures[last])
+            intercept = loadings[last] - slope * pressures[last]
+            area = areas[last] + slope * (query - pressures[last]) + \
+                intercept * numpy.log(query / pressures[last])
+
+            # the integral simplifies to henry_const * P before the first point
+            area = numpy.where(n_points == 0, henry_const * query, area)
+            area = numpy.where(valid, area, numpy.nan)
+
+        return area.reshape(shape)
+
+    def _interpolate(
+        self,
+        known: str,
+        interp: str,
+        values: t.Union[float, numpy.ndarray],
+        branch: str,
+        interp_fill: t.Union[float, t.Tuple[float, float], str],
+    ) -> numpy.ndarray:
+        """Linear interpolation of all isotherms, segment by segment."""
+        if isinstance(interp_fill, str) and interp_fill != "extrapolate":
+            raise ParameterError(f"Unknown fill value '{interp_fill}'.")
+
+        x, y, _, starts, counts = self._table(known, branch)
+        iso, query, shape = self._queries(values)
+
+        valid = counts[iso] > 1
+        if not valid.any():
+            return numpy.full(shape, numpy.nan)
+        first = numpy.where(valid, starts[iso], 0)
+        last = numpy.where(valid, starts[iso] + counts[iso] - 1, 0)
+        below = valid & (query < x[first])
+        above = valid & (query > x[last])
+        if interp_fill is None and (below.any() or above.any()):
+            raise CalculationError(
+                f"The {known} values requested for {len(numpy.unique(iso[below | above]))} "
+                f"isotherm(s) (first: {iso[below | above][0]}) "
+                "are outside the range of the isotherm data. "
+                "Pass an `interp_fill` to predict outside the data bounds."
+            )
+
+        # same segment selection as interp1d
+        hi = numpy.clip(self._count_below(x, starts, counts, iso, query), 1, counts[iso] - 1)
+        hi = numpy.where(valid, starts[iso] + hi, 1)
+        lo = hi - 1
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            ret = y[lo] + (y[hi] - y[lo]) / (x[hi] - x[lo]) * (query - x[lo])
+        ret = numpy.where(valid, ret, numpy.nan)
+
+        if interp_fill is not None and not isinstance(interp_fill, str):
+            if isinstance(interp_fill, tuple) and len(interp_fill) == 2:
+                fill_below, fill_above = interp_fill
+            else:
+                fill_below = fill_above = interp_fill
+            ret = numpy.where(below, fill_below, ret)
+            ret = numpy.where(above, fill_above, ret)
+
+        return ret.reshape(shape)
+
+    def _queries(self, values) -> t.Tuple[numpy.ndarray, numpy.ndarray, tuple]:
+        """
+        Broadcast requested values to every isotherm, returning the flat
+        isotherm index and value of each query, and the result shape.
+        """
+        values = numpy.asarray(values, dtype=float)
+        n_iso = len(self)
+        if values.ndim == 0:
+            shape = (n_iso, )
+        elif values.ndim == 1:
+            shape = (n_iso, values.size)
+        elif values.ndim == 2 and values.shape[0] == n_iso:
+            shape = values.shape
+        else:
+            raise ParameterError(
+                "Pass a scalar, a 1D array or a 2D array with a row for each isotherm."
+            )
+        query = numpy.broadcast_to(values, shape).ravel()
+        iso = numpy.repeat(numpy.arange(n_iso), query.size // max(n_iso, 1))
+        return iso, query, shape
+
+    @staticmethod
+    def _count_below(x, starts, counts, iso, query) -> numpy.ndarray:
+        """
+        Count the points of each isotherm which are strictly below each
+        query value, equivalent to a per-isotherm ``searchsorted``.
+        """
+        # Data and queries are sorted together by isotherm and value,
+        # queries being placed before data points with the same value.
+        x_iso = numpy.repeat(numpy.arange(len(starts)), counts)
+        keys_iso = numpy.concatenate((x_iso, iso))
+        keys_val = numpy.concatenate((x, query))
+        is_data = numpy.concatenate((numpy.ones(len(x), dtype=int), numpy.zeros(len(query), dtype=int)))
+        order = numpy.lexsort((is_data, keys_val, keys_iso))
+
+        data_before = numpy.cumsum(is_data[order]) - is_data[order]
+        position = numpy.empty_like(order)
+        position[order] = numpy.arange(len(order))
+        return data_before[position[len(x):]] - starts[iso]
+
+    def _table(self, known: str, branch: str) -> tuple:
+        """
+        Return the data of a branch, sorted by the ``known`` column within each
+        isotherm, with the spreading pressure integral up to each point
+        if sorted by pressure. Tables are cached until conversion.
+        """
+        key = (known, branch)
+        table = self._tables.get(key)
+        if table is not None:
+            return table
+
+        if branch not in _BRANCHES:
+            raise ParameterError('Bad branch specification.')
+        other = 'loading' if known == 'pressure' else 'pressure'
+
+        iso = numpy.repeat(numpy.arange(len(self)), self.lengths)
+        rows = numpy.flatnonzero(self.columns['branch'] == _BRANCHES[branch])
+        rows = rows[numpy.lexsort((self.columns[known][rows], iso[rows]))]
+        x = self.columns[known][rows]
+        y = self.columns[other][rows]
+        counts = numpy.bincount(iso[rows], minlength=len(self))
+        starts = numpy.concatenate(([0], numpy.cumsum(counts)[:-1])).astype(int)
+
+        areas = None
+        if known == 'pressure' and len(x):
+            # Same piecewise integral as PointIsotherm: the first point of
+            # each isotherm contributes its loading, the others the area of
+            # the linear segment from the previous point.
+            with numpy.errstate(divide='ignore', invalid='ignore'):
+                slopes = numpy.diff(y) / numpy.diff(x)
+                intercepts = y[:-1] - slopes * x[:-1]
+                segments = slopes * numpy.diff(x) + intercepts * numpy.log(x[1:] / x[:-1])
+            contributions = numpy.concatenate(([y[0]], segments))
+            first = starts[counts > 0]
+            contributions[first] = y[first]
+
+            # A single cumulative sum is used for all isotherms, so
+            # invalid values are excluded and restored afterwards
+            invalid = ~numpy.isfinite(contributions)
+            contributions[invalid] = 0
+            areas = numpy.cumsum(contributions)
+            areas -= numpy.repeat(areas[first] - y[first], counts[counts > 0])
+            invalid_iso = numpy.repeat(
+                numpy.logical_or.reduceat(invalid, first), counts[counts > 0]
+            )
+            areas[invalid_iso] = numpy.nan
+
+        table = (x, y, areas, starts, counts)
+        self._tables[key] = table
+        return table
+
+
+def _concatenate(arrays: t.List[numpy.ndarray], dtype) -> numpy.ndarray:
+    """Join the columns of all isotherms."""
+    if not arrays:
+        return numpy.empty(0, dtype=dtype)
+    return numpy.concatenate(arrays).astype(dtype, copy=False)
@@ -2,6 +2,7 @@
 
 from pygaps.data import MATERIAL_LIST
 from pygaps.utilities.exceptions import ParameterError
+from pygaps.utilities.python_utilities import ObservedDict
 
 
 class Material():
@@ -52,6 +53,17 @@ class Material():
             if self not in MATERIAL_LIST:
                 MATERIAL_LIST.append(self)
 
+    def __setattr__(self, name, value):
+        """Count changes of the material, including its properties."""
+        if name == "properties":
+            value = ObservedDict(value, on_change=self._changed)
+        super().__setattr__(name, value)
+        self._changed()
+
+    def _changed(self):
+        """Record a change of the material."""
+        self.__dict__["_version"] = self.__dict__.get("_version", 0) + 1
+
     def __repr__(self):
         """Print material id."""
         return f"<pygaps.Material '{self.name}'>"
@@ -1,6 +1,8 @@
 """Class representing a model of and isotherm."""
 
 import typing as t
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
 
 import numpy
 import pandas
@@ -8,6 +10,8 @@ import pandas
 from pygaps import logger
 from pygaps.core.baseisotherm import BaseIsotherm
 from pygaps.modelling import _GUESS_MODELS
+from pygaps.modelling import FitCache
+from pygaps.modelling import fit_batch
 from pygaps.modelling import get_isotherm_model
 from pygaps.modelling import is_model
 from pygaps.modelling import is_model_class
@@ -63,6 +67,8 @@ class ModelIsotherm(BaseIsotherm):
         Dictionary to be passed to the minimization function to use in fitting model to data.
         See `here
         <https://docs.scipy.org/doc/scipy/reference/generated/scipy.optimize.least_squares.html>`__.
+    fit_cache : FitCache, optional
+        A cache of fits to reuse, and to which new fits are added.
     pressure_mode : str, optional
         The pressure mode, either 'absolute' pressure or 'relative'
         ('relative%') in the form of p/p0.
@@ -106,6 +112,7 @@ class ModelIsotherm(BaseIsotherm):
         param_bounds: dict = None,
         optimization_params: dict = None,
         verbose: bool = False,
+        fit_cache: FitCache = None,
         **other_properties
     ):
         """
@@ -124,6 +131,65 @@ class ModelIsotherm(BaseIsotherm):
                 " isotherm data. e.g. model=\"Langmuir\""
             )
 
+        if isotherm_data is not None or pressure is not None or loading is not None:
+
+            pressure, loading = self._branch_data(
+                pressure, loading, isotherm_data, pressure_key, loading_key, branch
+            )
+
+            # Branch the isotherm model is based on.
+            self.branch = branch
+
+            # Name of analytical model to fit to pure-component isotherm data
+            # adsorption isotherm.
+            fit_args = {
+                "model": model,
+                "pressure": pressure,
+                "loading": loading,
+                "param_guess": param_guess,
+                "param_bounds": param_bounds,
+                "optimization_params": optimization_params,
+                "verbose": verbose,
+                "properties": other_properties,
+            }
+            if fit_cache is None:
+                self.model = _fit_model(**fit_args)
+            else:
+                key, result = _cache_lookup(fit_cache, branch, fit_args)
+                if result is None:
+                    result = _guess_attempt(fit_args)
+                    _cache_store(fit_cache, key, fit_args, result)
+                if result[1] is not None:
+                    raise result[1]
+                self.model = result[0]
+
+        elif is_model_class(model):
+            self.model = model
+            self.branch = branch
+
+        else:
+            raise ParameterError(
+                "Pass isotherm data to fit in a pandas.DataFrame as ``isotherm_data``"
+                " or directly ``pressure`` and ``loading`` as arrays."
+                "Alternatively, pass an isotherm model instance."
+            )
+
+        # Plot fit if verbose
+        if verbose and other_properties.pop('plot_fit', True):
+            from pygaps.graphing.model_graphs import plot_model_guesses
+            plot_model_guesses([self], pressure, loading)
+
+    @classmethod
+    def _branch_data(
+        cls,
+        pressure: t.List[float],
+        loading: t.List[float],
+        isotherm_data: pandas.DataFrame,
+        pressure_key: str,
+        loading_key: str,
+        branch: str,
+    ) -> t.Tuple[numpy.ndarray, numpy.ndarray]:
+        """Get the pressure and loading arrays of the branch to fit."""
         if isotherm_data is not None:
             if None in [pressure_key, loading_key]:
                 raise ParameterError(
@@ -134,7 +200,7 @@ class ModelIsotherm(BaseIsotherm):
             data = isotherm_data.copy()
             # If branch column is already set
             if 'branch' not in isotherm_data.columns:
-                data['branch'] = self._splitdata(data, pressure_key)
+                data['branch'] = cls._splitdata(data, pressure_key)
 
             if branch == 'ads':
                 data = data.loc[data['branch'] == 0]
@@ -147,80 +213,18 @@ class ModelIsotherm(BaseIsotherm):
                 raise ParameterError("The required isotherm branch does not contain any points.")
 
             # Get just the pressure and loading columns
-            pressure = data[pressure_key].values
-            loading = data[loading_key].values
-
-            process = True
-
-        elif pressure is not None or loading is not None:
-            if pressure is None or loading is None:
-                raise ParameterError(
-                    "If you've chosen to pass loading and pressure directly as"
-                    " arrays, make sure both are specified!"
-                )
-            if len(pressure) != len(loading):
-                raise ParameterError("Pressure and loading arrays are not equal!")
-
-            # Ensure we are dealing with numpy arrays
-            pressure = numpy.asarray(pressure)
-            loading = numpy.asarray(loading)
-
-            process = True
-
-        elif is_model_class(model):
-            self.model = model
-            self.branch = branch
-
-            process = False
+            return data[pressure_key].values, data[loading_key].values
 
-        else:
+        if pressure is None or loading is None:
             raise ParameterError(
-                "Pass isotherm data to fit in a pandas.DataFrame as ``isotherm_data``"
-                " or directly ``pressure`` and ``loading`` as arrays."
-                "Alternatively, pass an isotherm model instance."
-            )
-
-        if process:
-
-            # Branch the isotherm model is based on.
-            self.branch = branch
-
-            # Name of analytical model to fit to pure-component isotherm data
-            # adsorption isotherm.
-            self.model = get_isotherm_model(
-                model,
-                pressure_range=(min(pressure), max(pressure)),
-                loading_range=(min(loading), max(loading)),
-                param_bounds=param_bounds,
-            )
-
-            # Pass odd parameters
-            self.model.__init_parameters__(other_properties)
-
-            # Dictionary of parameters as a starting point for data fitting.
-            if param_guess:
-                for param in param_guess.keys():
-                    if param not in self.model.param_names:
-                        raise ParameterError(
-                            f"'{param}' is not a valid parameter"
-                            f" in the '{model}' model."
-                        )
-            else:
-                param_guess = self.model.initial_guess(pressure, loading)
-
-            # fit model to isotherm data
-            self.model.fit(
-                pressure,
-                loading,
-                param_guess,
-                optimization_params,
-                verbose,
+                "If you've chosen to pass loading and pressure directly as"
+                " arrays, make sure both are specified!"
             )
+        if len(pressure) != len(loading):
+            raise ParameterError("Pressure and loading arrays are not equal!")
 
-        # Plot fit if verbose
-        if verbose and other_properties.pop('plot_fit', True):
-            from pygaps.graphing.model_graphs import plot_model_guesses
-            plot_model_guesses([self], pressure, loading)
+        # Ensure we are dealing with numpy arrays
+        return numpy.asarray(pressure), numpy.asarray(loading)
 
     @classmethod
     def from_isotherm(
@@ -302,7 +306,11 @@ class ModelIsotherm(BaseIsotherm):
         param_guess: dict = None,
         param_bounds: dict = None,
         optimization_params: dict = None,
-        verbose: bool = False
+        verbose: bool = False,
+        n_jobs: int = None,
+        executor: Executor = None,
+        rmse_threshold: float = None,
+        fit_cache: FitCache = None,
     ):
         """
         Constructs a ModelIsotherm using data from a PointIsotherm and all its
@@ -329,6 +337,15 @@ class ModelIsotherm(BaseIsotherm):
             <https://docs.scipy.org/doc/scipy/reference/optimize.html#module-scipy.optimize>`__.
         verbose : bool
             Prints out extra information about steps taken.
+        n_jobs : int, optional
+            Number of processes used to fit models, if more than one is tried.
+        executor : concurrent.futures.Executor, optional
+            An executor to fit models on, if more than one is tried.
+        rmse_threshold : float, optional
+            Return the first model with an RMSE at or below this value,
+            if more than one is tried.
+        fit_cache : FitCache, optional
+            A cache of fits to reuse, and to which new fits are added.
         """
         if not model:
             raise ParameterError("Provide a model name (or a list of them) to fit.")
@@ -347,6 +364,7 @@ class ModelIsotherm(BaseIsotherm):
                     param_bounds=param_bounds,
                     optimization_params=optimization_params,
                     verbose=verbose,
+                    fit_cache=fit_cache,
                     **iso_params
                 )
 
@@ -355,9 +373,154 @@ class ModelIsotherm(BaseIsotherm):
             models=model,
             optimization_params=optimization_params,
             verbose=verbose,
+            n_jobs=n_jobs,
+            executor=executor,
+            rmse_threshold=rmse_threshold,
+            fit_cache=fit_cache,
             **iso_params
         )
 
+    @classmethod
+    def from_pointisotherms(
+        cls,
+        isotherms: t.Iterable,
+        branch: str = 'ads',
+        model: t.Union[str, t.List[str]] = None,
+        param_guess: dict = None,
+        param_bounds: dict = None,
+        optimization_params: dict = None,
+        verbose: bool = False,
+        n_jobs: int = None,
+        executor: Executor = None,
+        rmse_threshold: float = None,
+        fit_cache: FitCache = None,
+    ) -> t.List["ModelIsotherm"]:
+        """
+        Constructs ModelIsotherms from many PointIsotherms.
+
+        With a single model, all isotherms are fit together with
+        ``pygaps.modelling.fit_batch``. Otherwise, the best model
+        is guessed for each isotherm in turn.
+
+        Parameters
+        ----------
+        isotherms : iterable of PointIsotherm
+            The isotherms to model, such as a list or an IsothermCollection.
+        branch : [None, 'ads', 'des'], optional
+            Branch of isotherm to model. Defaults to adsorption branch.
+        model : str, list, 'guess'
+            The model to be used to describe the isotherms, as in
+            ``from_pointisotherm``.
+        param_guess : dict, optional
+            Starting guess for model parameters in the data fitting routine.
+        param_bounds : dict
+            Bounds for model parameters in the data fitting routine.
+        optimization_params : dict, optional
+            Dictionary to be passed to the minimization function to use in fitting model to data.
+        verbose : bool
+            Prints out extra information about steps taken.
+        n_jobs : int, optional
+            Number of processes used to fit models, if more than one is tried.
+        executor : concurrent.futures.Executor, optional
+            An executor to fit models on, if more than one is tried.
+        rmse_threshold : float, optional
+            Return the first model with an RMSE at or below this value,
+            if more than one is tried.
+        fit_cache : FitCache, optional
+            A cache of fits to reuse, and to which new fits are added.
+
+        Returns
+        -------
+        list
+            A ModelIsotherm for each isotherm. When fitting a single model,
+            isotherms on which the fit failed are None.
+        """
+        isotherms = list(isotherms)
+        if not isinstance(model, str) or model == 'guess':
+            return [
+                cls.from_pointisotherm(
+                    isotherm,
+                    branch=branch,
+                    model=model,
+                    param_guess=param_guess,
+                    param_bounds=param_bounds,
+                    optimization_params=optimization_params,
+                    verbose=verbose,
+                    n_jobs=n_jobs,
+                    executor=executor,
+                    rmse_threshold=rmse_threshold,
+                    fit_cache=fit_cache,
+                ) for isotherm in isotherms
+            ]
+
+        iso_params, fit_args = [], []
+        for isotherm in isotherms:
+            properties = isotherm.to_dict()
+            pressure, loading = cls._branch_data(
+                None,
+                None,
+                isotherm.data(branch=branch),
+                isotherm.pressure_key,
+                isotherm.loading_key,
+                branch,
+            )
+            iso_params.append(properties)
+            fit_args.append({
+                "model": model,
+                "pressure": pressure,
+                "loading": loading,
+                "param_guess": param_guess,
+                "param_bounds": param_bounds,
+                "optimization_params": optimization_params,
+                "verbose": verbose,
+                "properties": properties,
+            })
+
+        keys = [None] * len(fit_args)
+        results = [None] * len(fit_args)
+        if fit_cache is not None:
+            for index, args in enumerate(fit_args):
+                keys[index], results[index] = _cache_lookup(fit_cache, branch, args)
+
+        to_fit = [index for index, result in enumerate(results) if result is None]
+        if to_fit:
+            batch = fit_batch(
+                model,
+                [fit_args[index]["pressure"] for index in to_fit],
+                [fit_args[index]["loading"] for index in to_fit],
+                param_guess=[
+                    fit_args[index]["param_guess"] or fit_args[index].get("warm_start")
+                    for index in to_fit
+                ],
+                param_bounds=param_bounds,
+                optimization_params=optimization_params,
+                temperature=[iso_params[index].get("temperature") for index in to_fit],
+                verbose=verbose,
+            )
+            for position, index in enumerate(to_fit):
+                if batch.converged[position]:
+                    fit_model = batch[position]
+                    fit_model.param_bounds = dict(batch.model.param_bounds)
+                    results[index] = (fit_model, None)
+                else:
+                    results[index] = (
+                        None,
+                        CalculationError(f"Fitting routine for {model} did not converge.")
+                    )
+                if fit_cache is not None:
+                    _cache_store(fit_cache, keys[index], fit_args[index], results[index])
+
+        fits = []
+        for (fit_model, err), properties in zip(results, iso_params):
+            if fit_model is None:
+                logger.info(f"Modelling using {model} failed.")
+                if verbose:
+                    logger.info(f"\n{err}")
+                fits.append(None)
+            else:
+                fits.append(cls(model=fit_model, branch=branch, **properties))
+        return fits
+
     @classmethod
     def guess(
         cls,
@@ -371,6 +534,10 @@ class ModelIsotherm(BaseIsotherm):
         optimization_params: dict = None,
         param_bounds: dict = None,
         verbose: bool = False,
+        n_jobs: int = None,
+        executor: Executor = None,
+        rmse_threshold: float = None,
+        fit_cache: FitCache = None,
         **other_properties
     ):
         """
@@ -378,6 +545,16 @@ class ModelIsotherm(BaseIsotherm):
         then return the one with the best RMS fit.
 
         May take a long time depending on the number of datapoints.
+        The models can be fit concurrently, by passing a number of
+        processes in ``n_jobs`` or an existing ``executor``.
+        The best model does not depend on the order in which fits
+        complete: if several models have the same RMSE, the first
+        one in the list of models is returned.
+
+        Only the models are fit on each attempt, and the isotherm
+        is created for the best one. If an ``rmse_threshold`` is given,
+        the first model in the list to fit at least as well is returned
+        without trying the rest.
 
         Parameters
         ----------
@@ -409,10 +586,20 @@ class ModelIsotherm(BaseIsotherm):
             set to desorption as well.
         verbose : bool, optional
             Prints out extra information about steps taken.
+        n_jobs : int, optional
+            Number of processes used to fit the models. Defaults to fitting
+            them sequentially. Set to -1 to use all processors.
+        executor : concurrent.futures.Executor, optional
+            An executor (process or thread pool) to fit the models on.
+            Takes precedence over ``n_jobs``.
+        rmse_threshold : float, optional
+            Stop trying models once one fits with an RMSE
+            at or below this value.
+        fit_cache : FitCache, optional
+            A cache of fits to reuse, and to which new fits are added.
         other_properties:
             Any other parameters of the isotherm which should be stored internally.
         """
-        attempts = []
         if models == 'guess':
             guess_models = _GUESS_MODELS
         else:
@@ -427,50 +614,58 @@ class ModelIsotherm(BaseIsotherm):
                     f'Not all models correspond to internal models. Possible models are f{models}'
                 )
 
+        pressure, loading = cls._branch_data(
+            pressure, loading, isotherm_data, pressure_key, loading_key, branch
+        )
+
+        fit_args = []
         for model in guess_models:
+            model_bounds = param_bounds
             if param_bounds is not None:
                 params = get_isotherm_model(model).params.keys()
-                param_bounds = {key: param_bounds[key] for key in param_bounds if key in params}
-            try:
-                isotherm = cls(
-                    pressure=pressure,
-                    loading=loading,
-                    isotherm_data=isotherm_data,
-                    pressure_key=pressure_key,
-                    loading_key=loading_key,
-                    model=model,
-                    param_guess=None,
-                    param_bounds=param_bounds,
-                    optimization_params=optimization_params,
-                    branch=branch,
-                    verbose=verbose,
-                    plot_fit=False,  # we don't want to plot at this stage
-                    **other_properties
-                )
-
-                attempts.append(isotherm)
-
-            except CalculationError as err:
-                logger.info(f"Modelling using {model} failed.")
-                if verbose:
-                    logger.info(f"\n{err}")
+                model_bounds = {key: param_bounds[key] for key in param_bounds if key in params}
+            fit_args.append({
+                "model": model,
+                "pressure": pressure,
+                "loading": loading,
+                "param_guess": None,
+                "param_bounds": model_bounds,
+                "optimization_params": optimization_params,
+                "verbose": verbose,
+                "properties": other_properties,
+            })
+
+        if executor is None and n_jobs is not None and n_jobs != 1:
+            with ProcessPoolExecutor(max_workers=n_jobs if n_jobs > 0 else None) as pool:
+                attempts = _guess_attempts(fit_args, branch, pool, rmse_threshold, fit_cache, verbose)
+        else:
+            attempts = _guess_attempts(fit_args, branch, executor, rmse_threshold, fit_cache, verbose)
 
         if not attempts:
             raise CalculationError("No model could be reliably fit on the isotherm.")
 
-        errors = [x.model.rmse for x in attempts]
-        best_fit = attempts[errors.index(min(errors))]
+        # the first of any equally good fits is chosen
+        errors = [x.rmse if numpy.isfinite(x.rmse) else numpy.inf for x in attempts]
+        best_model = attempts[errors.index(min(errors))]
+
+        # only the best model becomes an isotherm
+        best_fit = cls(model=best_model, branch=branch, **other_properties)
 
         if verbose:
-            if loading is None:
-                pressure = isotherm_data[pressure_key]
-                loading = isotherm_data[loading_key]
             from pygaps.graphing.model_graphs import plot_model_guesses
-            plot_model_guesses(attempts, pressure, loading)
-            logger.info(f"Best model fit is {best_fit.model.name}.")
+            plot_model_guesses(
+                [cls(model=x, branch=branch, **other_properties) for x in attempts],
+                pressure,
+                loading,
+            )
+            logger.info(f"Best model fit is {best_model.name}.")
 
         return best_fit
 
+    def _iso_id_version(self) -> tuple:
+        """Changes of the fitted model also change the isotherm id."""
+        return super()._iso_id_version() + (self.model.__dict__.get("_version"), )
+
     ###########################################################
     #   Info function
 
@@ -1099,3 +1294,186 @@ class ModelIsotherm(BaseIsotherm):
         """
 
         return self.model.toth_correction(pressure)
+
+
+def _fit_model(
+    model: str,
+    pressure: numpy.ndarray,
+    loading: numpy.ndarray,
+    param_guess: dict = None,
+    param_bounds: dict = None,
+    optimization_params: dict = None,
+    verbose: bool = False,
+    properties: dict = None,
+    warm_start: dict = None,
+):
+    """
+    Create an isotherm model and fit it on the pressure and loading arrays.
+    Unless a guess is given, the fit starts from the ``warm_start`` parameters,
+    if any, or from the initial guess of the model.
+    """
+    fit_model = get_isotherm_model(
+        model,
+        pressure_range=(min(pressure), max(pressure)),
+        loading_range=(min(loading), max(loading)),
+        param_bounds=param_bounds,
+    )
+
+    # Pass odd parameters
+    fit_model.__init_parameters__(properties or {})
+
+    # Dictionary of parameters as a starting point for data fitting.
+    if param_guess:
+        for param in param_guess.keys():
+            if param not in fit_model.param_names:
+                raise ParameterError(
+                    f"'{param}' is not a valid parameter"
+                    f" in the '{model}' model."
+                )
+    elif warm_start:
+        param_guess = fit_model.initial_guess_bounds(dict(warm_start))
+    else:
+        param_guess = fit_model.initial_guess(pressure, loading)
+
+    # fit model to isotherm data
+    fit_model.fit(
+        pressure,
+        loading,
+        param_guess,
+        optimization_params,
+        verbose,
+    )
+    return fit_model
+
+
+def _guess_attempt(fit_args: dict):
+    """Fit a single model for ``ModelIsotherm.guess``, returning the error if it fails."""
+    try:
+        return _fit_model(**fit_args), None
+    except CalculationError as err:
+        return None, err
+
+
+def _guess_attempts(
+    fit_args: t.List[dict],
+    branch: str,
+    executor: Executor = None,
+    rmse_threshold: float = None,
+    fit_cache: FitCache = None,
+    verbose: bool = False,
+):
+    """
+    Fit each model for ``ModelIsotherm.guess``, sequentially or on an executor,
+    and return the successful ones. Results are always processed in the order
+    of the models, stopping at the first one with an RMSE below the threshold.
+    The cache is only used here, so that it is never sent to other processes.
+    """
+    keys = [None] * len(fit_args)
+    results = [None] * len(fit_args)
+    if fit_cache is not None:
+        for index, args in enumerate(fit_args):
+            keys[index], results[index] = _cache_lookup(fit_cache, branch, args)
+
+    futures = {}
+    if executor is not None:
+        futures = {
+            index: executor.submit(_guess_attempt, args)
+            for index, args in enumerate(fit_args) if results[index] is None
+        }
+
+    attempts = []
+    for index, args in enumerate(fit_args):
+        if results[index] is None:
+            if index in futures:
+                results[index] = futures[index].result()
+            else:
+                results[index] = _guess_attempt(args)
+            if fit_cache is not None:
+                _cache_store(fit_cache, keys[index], args, results[index])
+
+        model, err = results[index]
+        if model is None:
+            logger.info(f"Modelling using {args['model']} failed.")
+            if verbose:
+                logger.info(f"\n{err}")
+            continue
+        attempts.append(model)
+        if rmse_threshold is not None and model.rmse <= rmse_threshold:
+            break
+
+    # fits not yet started are no longer needed
+    for future in futures.values():
+        future.cancel()
+
+    return attempts
+
+
+def _cache_properties(fit_args: dict) -> t.Tuple[str, str, float]:
+    """Material, adsorbate and temperature of a fit, as stored in the cache."""
+    properties = fit_args.get("properties") or {}
+    material = properties.get("material")
+    # materials with properties are passed as their dictionary
+    if isinstance(material, dict):
+        material = material.get("name")
+    adsorbate = properties.get("adsorbate")
+    temperature = properties.get("temperature")
+    return (
+        str(material) if material is not None else None,
+        str(adsorbate) if adsorbate is not None else None,
+        float(temperature) if temperature is not None else None,
+    )
+
+
+def _cache_lookup(fit_cache: FitCache, branch: str, fit_args: dict):
+    """
+    Find a fit in the cache, returning its key and the (model, error) result,
+    or None if it is not stored. Fits which are not stored start from the
+    nearest cached fit, which is added to the fit arguments as a warm start.
+    """
+    material, adsorbate, temperature = _cache_properties(fit_args)
+    key = fit_cache.key(
+        fit_args["model"],
+        fit_args["pressure"],
+        fit_args["loading"],
+        branch=branch,
+        param_guess=fit_args.get("param_guess"),
+        param_bounds=fit_args.get("param_bounds"),
+        optimization_params=fit_args.get("optimization_params"),
+        temperature=temperature,
+    )
+    entry = fit_cache.get(key)
+    if entry is None:
+        if not fit_args.get("param_guess"):
+            fit_args["warm_start"] = fit_cache.nearest(
+                fit_args["model"], material, adsorbate, temperature
+            )
+        return key, None
+
+    fit = entry["fit"]
+    if "error" in fit:
+        return key, (None, CalculationError(fit["error"]))
+
+    fit_model = get_isotherm_model(
+        fit["name"],
+        parameters=fit["parameters"],
+        rmse=fit["rmse"],
+        pressure_range=tuple(fit["pressure_range"]),
+        loading_range=tuple(fit["loading_range"]),
+        param_bounds=fit_args.get("param_bounds"),
+    )
+    fit_model.__init_parameters__(fit_args.get("properties") or {})
+    return key, (fit_model, None)
+
+
+def _cache_store(fit_cache: FitCache, key: str, fit_args: dict, result: tuple):
+    """Store the (model, error) result of a fit in the cache."""
+    model, err = result
+    material, adsorbate, temperature = _cache_properties(fit_args)
+    fit_cache.set(
+        key,
+        fit_args["model"],
+        model.to_dict() if model is not None else {"error": str(err)},
+        material=material,
+        adsorbate=adsorbate,
+        temperature=temperature,
+    )
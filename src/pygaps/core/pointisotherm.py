@@ -17,6 +17,7 @@ from pygaps.utilities.exceptions import CalculationError
 from pygaps.utilities.exceptions import ParameterError
 from pygaps.utilities.exceptions import pgError
 from pygaps.utilities.isotherm_interpolator import IsothermInterpolator
+from pygaps.utilities.python_utilities import LRUCache
 
 
 class PointIsotherm(BaseIsotherm):
@@ -57,6 +58,13 @@ class PointIsotherm(BaseIsotherm):
         detailed info for each data point if adsorption points ('False')
         or desorption points ('True'). eg: [False, False, True, True...]
         or as a column of the isotherm_data.
+    storage : {'pandas', 'array'}, optional
+        How the isotherm data is held internally. The default, 'pandas',
+        keeps a DataFrame. With 'array', each column is kept as a contiguous
+        numpy array and the adsorption/desorption rows are located once,
+        so that ``pressure()``, ``loading()`` and interpolation avoid any
+        pandas overhead. A DataFrame is only built when ``data()`` or
+        ``data_raw`` are requested.
     material : str
         Name of the material on which the isotherm is measured.
     adsorbate : str
@@ -88,16 +96,36 @@ class PointIsotherm(BaseIsotherm):
     Detection of adsorption/desorption branches will not work if
     data is noisy.
 
+    When using 'array' storage, the DataFrame returned by ``data()`` is
+    built on request: modifications to it are not stored in the isotherm
+    unless it is assigned back to ``data_raw``.
+
     """
 
     _reserved_params = BaseIsotherm._reserved_params + [
         'data_raw',
-        'l_interpolator',
-        'p_interpolator',
+        '_data_raw',
+        '_data_columns',
+        '_data_index',
+        '_branch_rows',
+        '_spreading_tables',
+        '_interpolators',
+        'storage',
         'loading_key',
         'pressure_key',
         'other_keys',
     ]
+    _hash_exempt_params = BaseIsotherm._hash_exempt_params + [
+        '_branch_rows',
+        '_spreading_tables',
+        '_interpolators',
+        'l_interpolator',
+        'p_interpolator',
+        'storage',
+    ]
+    _storage_types = ('pandas', 'array')
+    # Maximum number of interpolators kept by each isotherm
+    _interpolator_cache_size = 16
 
     ##########################################################
     #   Instantiation and classmethods
@@ -110,6 +138,7 @@ class PointIsotherm(BaseIsotherm):
         pressure_key: str = None,
         loading_key: str = None,
         branch: t.Union[str, t.List[bool]] = 'guess',
+        storage: str = 'pandas',
         **other_properties
     ):
         """
@@ -120,6 +149,12 @@ class PointIsotherm(BaseIsotherm):
         # Run base class constructor
         super().__init__(**other_properties)
 
+        if storage not in self._storage_types:
+            raise ParameterError(
+                f"Isotherm storage must be one of {self._storage_types}, not '{storage}'."
+            )
+        self.storage = storage
+
         # Checks
         if isotherm_data is not None:
             if None in [pressure_key, loading_key]:
@@ -147,7 +182,7 @@ class PointIsotherm(BaseIsotherm):
                 columns.append('branch')
             other_keys = [c for c in isotherm_data.columns if c not in columns]
             columns = columns + sorted(other_keys)
-            self.data_raw = isotherm_data.reindex(columns=columns)
+            data = isotherm_data.reindex(columns=columns)
 
         elif pressure is not None or loading is not None:
             if pressure is None or loading is None:
@@ -162,11 +197,15 @@ class PointIsotherm(BaseIsotherm):
             self.pressure_key = 'pressure'
             self.loading_key = 'loading'
 
-            # DataFrame creation
-            self.data_raw = pandas.DataFrame({
+            # DataFrame creation, or just the columns if stored as arrays
+            data = {
                 self.pressure_key: pressure,
-                self.loading_key: loading
-            })
+                self.loading_key: loading,
+            }
+            if storage == 'array':
+                data = {key: numpy.asarray(val) for key, val in data.items()}
+            else:
+                data = pandas.DataFrame(data)
         else:
             raise ParameterError(
                 "Pass either the isotherm data in a pandas.DataFrame as ``isotherm_data``"
@@ -179,11 +218,11 @@ class PointIsotherm(BaseIsotherm):
         elif isinstance(branch, str):
             if branch == 'guess':
                 # Split the data in adsorption/desorption
-                self.data_raw['branch'] = self._splitdata(self.data_raw, self.pressure_key)
+                data['branch'] = self._splitdata(data, self.pressure_key)
             elif branch == 'ads':
-                self.data_raw['branch'] = 0
+                data['branch'] = numpy.zeros(len(data[self.pressure_key]), dtype=int)
             elif branch == 'des':
-                self.data_raw['branch'] = 1
+                data['branch'] = numpy.ones(len(data[self.pressure_key]), dtype=int)
             else:
                 raise ParameterError(
                     "Isotherm branch parameter must be 'guess ,'ads' or 'des'"
@@ -191,15 +230,15 @@ class PointIsotherm(BaseIsotherm):
                 )
         else:
             try:
-                self.data_raw['branch'] = branch
+                if isinstance(data, dict):
+                    branch = numpy.asarray(branch)
+                    if branch.shape != data[self.pressure_key].shape:
+                        raise ValueError("Length of branch does not match length of data.")
+                data['branch'] = branch
             except Exception as e_info:
                 raise ParameterError(e_info)
 
-        # The internal interpolator for loading given pressure.
-        self.l_interpolator = None
-
-        # The internal interpolator for pressure given loading.
-        self.p_interpolator = None
+        self.data_raw = data
 
     @classmethod
     def from_isotherm(
@@ -404,8 +443,8 @@ class PointIsotherm(BaseIsotherm):
             return
 
         try:
-            self.data_raw[self.pressure_key] = c_pressure(
-                self.data_raw[self.pressure_key],
+            pressure = c_pressure(
+                self._column(self.pressure_key),
                 mode_from=self.pressure_mode,
                 mode_to=mode_to,
                 unit_from=self.pressure_unit,
@@ -420,6 +459,7 @@ class PointIsotherm(BaseIsotherm):
                 "Is your isotherm supercritical? "
                 "Does the adsorbate have a thermodynamical backend?"
             ) from err
+        self._set_column(self.pressure_key, pressure)
 
         if mode_to != self.pressure_mode:
             self.pressure_mode = mode_to
@@ -428,9 +468,9 @@ class PointIsotherm(BaseIsotherm):
         else:
             self.pressure_unit = None
 
-        # Reset interpolators
-        self.l_interpolator = None
-        self.p_interpolator = None
+        # Reset interpolators and spreading pressure tables
+        self._interpolators.clear()
+        self._spreading_tables = {}
 
         if verbose:
             logger.info(f"Changed pressure to mode '{mode_to}', unit '{unit_to}'.")
@@ -471,16 +511,19 @@ class PointIsotherm(BaseIsotherm):
                     logger.info("There are no loading units in this mode.")
                 return
 
-        self.data_raw[self.loading_key] = c_loading(
-            self.data_raw[self.loading_key],
-            basis_from=self.loading_basis,
-            basis_to=basis_to,
-            unit_from=self.loading_unit,
-            unit_to=unit_to,
-            adsorbate=self.adsorbate,
-            temp=self.temperature,
-            basis_material=self.material_basis,
-            unit_material=self.material_unit,
+        self._set_column(
+            self.loading_key,
+            c_loading(
+                self._column(self.loading_key),
+                basis_from=self.loading_basis,
+                basis_to=basis_to,
+                unit_from=self.loading_unit,
+                unit_to=unit_to,
+                adsorbate=self.adsorbate,
+                temp=self.temperature,
+                basis_material=self.material_basis,
+                unit_material=self.material_unit,
+            )
         )
 
         if basis_to != self.loading_basis:
@@ -490,9 +533,9 @@ class PointIsotherm(BaseIsotherm):
         else:
             self.loading_unit = unit_to
 
-        # Reset interpolators
-        self.l_interpolator = None
-        self.p_interpolator = None
+        # Reset interpolators and spreading pressure tables
+        self._interpolators.clear()
+        self._spreading_tables = {}
 
         if verbose:
             logger.info(f"Changed loading to basis '{basis_to}', unit '{unit_to}'.")
@@ -539,13 +582,16 @@ class PointIsotherm(BaseIsotherm):
                 logger.info("There are no material units in this mode.")
             return
 
-        self.data_raw[self.loading_key] = c_material(
-            self.data_raw[self.loading_key],
-            basis_from=self.material_basis,
-            basis_to=basis_to,
-            unit_from=self.material_unit,
-            unit_to=unit_to,
-            material=self.material
+        self._set_column(
+            self.loading_key,
+            c_material(
+                self._column(self.loading_key),
+                basis_from=self.material_basis,
+                basis_to=basis_to,
+                unit_from=self.material_unit,
+                unit_to=unit_to,
+                material=self.material
+            )
         )
 
         # A special case is when conversion is performed from
@@ -561,14 +607,17 @@ class PointIsotherm(BaseIsotherm):
                 _basis_from = 'volume_liquid'
             else:
                 _basis_from = self.material_basis
-            self.data_raw[self.loading_key] = c_loading(
-                self.data_raw[self.loading_key],
-                basis_from=_basis_from,
-                basis_to=_basis_to,
-                unit_from=self.material_unit,
-                unit_to=unit_to,
-                adsorbate=self.adsorbate,
-                temp=self.temperature,
+            self._set_column(
+                self.loading_key,
+                c_loading(
+                    self._column(self.loading_key),
+                    basis_from=_basis_from,
+                    basis_to=_basis_to,
+                    unit_from=self.material_unit,
+                    unit_to=unit_to,
+                    adsorbate=self.adsorbate,
+                    temp=self.temperature,
+                )
             )
             if verbose:
                 logger.info(f"Changed loading to basis '{basis_to}', unit '{unit_to}'.")
@@ -578,9 +627,9 @@ class PointIsotherm(BaseIsotherm):
         if basis_to != self.material_basis:
             self.material_basis = basis_to
 
-        # Reset interpolators
-        self.l_interpolator = None
-        self.p_interpolator = None
+        # Reset interpolators and spreading pressure tables
+        self._interpolators.clear()
+        self._spreading_tables = {}
 
         if verbose:
             logger.info(f"Changed material to basis '{basis_to}', unit '{unit_to}'.")
@@ -646,6 +695,66 @@ class PointIsotherm(BaseIsotherm):
     ##########################################################
     #   Functions that return part of the isotherm data
 
+    @property
+    def data_raw(self) -> pandas.DataFrame:
+        """Return the entire isotherm data as a DataFrame."""
+        if self.storage == 'array':
+            return pandas.DataFrame(self._data_columns, index=self._data_index)
+        return self._data_raw
+
+    @data_raw.setter
+    def data_raw(self, data: t.Union[pandas.DataFrame, dict]):
+        if self.storage == 'array':
+            if isinstance(data, pandas.DataFrame):
+                self._data_index = data.index.values
+                data = {col: data[col].values for col in data.columns}
+            else:
+                self._data_index = numpy.arange(len(data[self.pressure_key]))
+            self._data_columns = data
+            branch = data['branch']
+            self._branch_rows = {
+                'ads': _rows_to_slice(numpy.flatnonzero(branch == 0)),
+                'des': _rows_to_slice(numpy.flatnonzero(branch == 1)),
+            }
+        else:
+            self._data_raw = data
+
+        # The internal interpolators, for loading given pressure
+        # and pressure given loading, per branch and interpolation options.
+        self._interpolators = LRUCache(maxsize=self._interpolator_cache_size)
+
+        # Cumulative spreading pressure integrals, per branch and units.
+        self._spreading_tables = {}
+
+    def _rows(self, branch: str = None) -> t.Union[slice, numpy.ndarray]:
+        """Return the rows of a branch when stored as arrays."""
+        if branch is None or branch.startswith('all'):
+            return slice(None)
+        if branch in ('ads', 'des'):
+            return self._branch_rows[branch]
+        raise ParameterError('Bad branch specification.')
+
+    def _column(self, key: str, branch: str = None, indexed: bool = True):
+        """
+        Return a single data column, as a Series if indexed
+        or, if possible, directly as the underlying array.
+        """
+        if self.storage == 'array':
+            rows = self._rows(branch)
+            ret = self._data_columns[key][rows]
+            if indexed:
+                return pandas.Series(ret, index=self._data_index[rows], name=key)
+            return ret
+        return self.data(branch=branch).loc[:, key]
+
+    def _set_column(self, key: str, values: t.Union[pandas.Series, numpy.ndarray]):
+        """Overwrite a data column in place."""
+        if self.storage == 'array':
+            # assignment of a new dictionary also invalidates the isotherm id
+            self._data_columns = {**self._data_columns, key: numpy.asarray(values)}
+        else:
+            self._data_raw[key] = values
+
     def data(self, branch: str = None) -> pandas.DataFrame:
         """
         Return underlying isotherm data.
@@ -662,6 +771,13 @@ class PointIsotherm(BaseIsotherm):
             The pandas DataFrame containing all isotherm data.
 
         """
+        if self.storage == 'array':
+            rows = self._rows(branch)
+            return pandas.DataFrame(
+                {key: val[rows]
+                 for key, val in self._data_columns.items()},
+                index=self._data_index[rows],
+            )
         if branch is None or branch.startswith('all'):
             return self.data_raw
         if branch == 'ads':
@@ -705,9 +821,9 @@ class PointIsotherm(BaseIsotherm):
             The pressure slice corresponding to the parameters passed.
 
         """
-        ret = self.data(branch=branch).loc[:, self.pressure_key]
+        ret = self._column(self.pressure_key, branch=branch, indexed=indexed)
 
-        if not ret.empty:
+        if len(ret) > 0:
             # Convert if needed
             if pressure_mode or pressure_unit:
                 # If pressure mode not given, try current
@@ -736,14 +852,11 @@ class PointIsotherm(BaseIsotherm):
 
             # Select required points
             if limits and any(limits):
-                ret = ret.loc[ret.between(
-                    -numpy.inf if limits[0] is None else limits[0],
-                    numpy.inf if limits[1] is None else limits[1]
-                )]
+                ret = ret[_between(ret, limits)]
 
         if indexed:
             return ret
-        return ret.values
+        return _values(ret)
 
     def loading(
         self,
@@ -788,9 +901,9 @@ class PointIsotherm(BaseIsotherm):
             The loading slice corresponding to the parameters passed.
 
         """
-        ret = self.data(branch=branch).loc[:, self.loading_key]
+        ret = self._column(self.loading_key, branch=branch, indexed=indexed)
 
-        if not ret.empty:
+        if len(ret) > 0:
             # Convert if needed
 
             # First adsorbent is converted
@@ -833,24 +946,19 @@ class PointIsotherm(BaseIsotherm):
 
             # Select required points
             if limits and any(limits):
-                ret = ret.loc[ret.between(
-                    -numpy.inf if limits[0] is None else limits[0],
-                    numpy.inf if limits[1] is None else limits[1]
-                )]
+                ret = ret[_between(ret, limits)]
 
         if indexed:
             return ret
-        return ret.values
+        return _values(ret)
 
     @property
     def other_keys(self):
         """
         Return column names of any supplementary data points.
         """
-        return [
-            c for c in self.data_raw.columns
-            if c not in (self.pressure_key, self.loading_key, 'branch')
-        ]
+        columns = self._data_columns if self.storage == 'array' else self.data_raw.columns
+        return [c for c in columns if c not in (self.pressure_key, self.loading_key, 'branch')]
 
     def other_data(
         self,
@@ -883,19 +991,16 @@ class PointIsotherm(BaseIsotherm):
 
         """
         if key in self.other_keys:
-            ret = self.data(branch=branch).loc[:, key]
+            ret = self._column(key, branch=branch, indexed=indexed)
 
-            if not ret.empty:
+            if len(ret) > 0:
                 # Select required points
                 if limits and any(limits):
-                    ret = ret.loc[ret.between(
-                        -numpy.inf if limits[0] is None else limits[0],
-                        numpy.inf if limits[1] is None else limits[1]
-                    )]
+                    ret = ret[_between(ret, limits)]
 
             if indexed:
                 return ret
-            return ret.values
+            return _values(ret)
 
         raise ParameterError(f"Isotherm does not contain any {key} data.")
 
@@ -914,11 +1019,107 @@ class PointIsotherm(BaseIsotherm):
             Whether the data exists or not.
 
         """
+        if self.storage == 'array':
+            return len(self._data_index[self._rows(branch)]) > 0
         return not self.data(branch=branch).empty
 
     ##########################################################
     #   Functions that interpolate values of the isotherm data
 
+    @property
+    def interpolator_cache(self) -> LRUCache:
+        """
+        Return the cache of interpolators used by ``pressure_at``/``loading_at``.
+
+        Its ``info()`` method reports the number of hits and misses.
+        """
+        return self._interpolators
+
+    @property
+    def l_interpolator(self) -> t.Optional[IsothermInterpolator]:
+        """
+        Return the most recently used interpolator of loading given pressure,
+        or None if no loading has been interpolated.
+
+        An interpolator assigned here is used by ``loading_at`` calls
+        with the same branch and options. Assigning None discards
+        all interpolators of loading.
+        """
+        return self._last_interpolator('loading')
+
+    @l_interpolator.setter
+    def l_interpolator(self, interpolator: t.Optional[IsothermInterpolator]):
+        self._set_interpolator('loading', interpolator)
+
+    @property
+    def p_interpolator(self) -> t.Optional[IsothermInterpolator]:
+        """
+        Return the most recently used interpolator of pressure given loading,
+        or None if no pressure has been interpolated.
+
+        An interpolator assigned here is used by ``pressure_at`` calls
+        with the same branch and options. Assigning None discards
+        all interpolators of pressure.
+        """
+        return self._last_interpolator('pressure')
+
+    @p_interpolator.setter
+    def p_interpolator(self, interpolator: t.Optional[IsothermInterpolator]):
+        self._set_interpolator('pressure', interpolator)
+
+    def _last_interpolator(self, interp_to: str) -> t.Optional[IsothermInterpolator]:
+        """Return the most recently used interpolator to pressure or loading."""
+        for key, interpolator in reversed(self._interpolators.items()):
+            if key[0] == interp_to:
+                return interpolator
+        return None
+
+    def _set_interpolator(self, interp_to: str, interpolator: t.Optional[IsothermInterpolator]):
+        """Store an interpolator to pressure or loading, or discard them all if None."""
+        if interpolator is None:
+            for key, _ in self._interpolators.items():
+                if key[0] == interp_to:
+                    self._interpolators.pop(key)
+            return
+        key = (
+            interp_to,
+            interpolator.interp_branch,
+            interpolator.interp_kind,
+            _hashable(interpolator.interp_fill),
+        )
+        self._interpolators[key] = interpolator
+
+    def _interpolator(
+        self,
+        interp_to: str,
+        branch: str,
+        interpolation_type: str,
+        interp_fill: t.Union[float, t.Tuple[float, float], str],
+    ) -> IsothermInterpolator:
+        """
+        Return an interpolator of loading given pressure (``interp_to='loading'``)
+        or of pressure given loading (``interp_to='pressure'``), creating it
+        only if none exists for the branch and interpolation options.
+        """
+        key = (interp_to, branch, interpolation_type, _hashable(interp_fill))
+        interpolator = self._interpolators.get(key)
+        if interpolator is None:
+            pressure = self.pressure(branch=branch)
+            loading = self.loading(branch=branch)
+            if interp_to == 'pressure':
+                known_data, interp_data = loading, pressure
+            else:
+                known_data, interp_data = pressure, loading
+            interpolator = IsothermInterpolator(
+                known_data,
+                interp_data,
+                interp_branch=branch,
+                interp_kind=interpolation_type,
+                interp_fill=interp_fill
+            )
+            self._interpolators[key] = interpolator
+        return interpolator
+
     def pressure_at(
         self,
         loading: t.List[float],
@@ -978,19 +1179,8 @@ class PointIsotherm(BaseIsotherm):
         # Convert to numpy array just in case
         loading = numpy.asarray(loading)
 
-        # Check if interpolator is applicable
-        if (
-            self.p_interpolator is None or self.p_interpolator.interp_branch != branch
-            or self.p_interpolator.interp_kind != interpolation_type
-            or self.p_interpolator.interp_fill != interp_fill
-        ):
-            self.p_interpolator = IsothermInterpolator(
-                self.loading(branch=branch),
-                self.pressure(branch=branch),
-                interp_branch=branch,
-                interp_kind=interpolation_type,
-                interp_fill=interp_fill
-            )
+        # Get an applicable interpolator
+        interpolator = self._interpolator('pressure', branch, interpolation_type, interp_fill)
 
         # Ensure loading is in correct units and basis for the internal model
         if material_basis or material_unit:
@@ -1031,7 +1221,7 @@ class PointIsotherm(BaseIsotherm):
             )
 
         # Interpolate using the internal interpolator
-        pressure = self.p_interpolator(loading)
+        pressure = interpolator(loading)
 
         # Ensure pressure is in correct units and mode requested
         if pressure_mode or pressure_unit:
@@ -1109,19 +1299,8 @@ class PointIsotherm(BaseIsotherm):
         # Convert to a numpy array just in case
         pressure = numpy.asarray(pressure)
 
-        # Check if interpolator is applicable
-        if (
-            self.l_interpolator is None or self.l_interpolator.interp_branch != branch
-            or self.l_interpolator.interp_kind != interpolation_type
-            or self.l_interpolator.interp_fill != interp_fill
-        ):
-            self.l_interpolator = IsothermInterpolator(
-                self.pressure(branch=branch),
-                self.loading(branch=branch),
-                interp_branch=branch,
-                interp_kind=interpolation_type,
-                interp_fill=interp_fill
-            )
+        # Get an applicable interpolator
+        interpolator = self._interpolator('loading', branch, interpolation_type, interp_fill)
 
         # Ensure pressure is in correct units and mode for the internal model
         if pressure_mode or pressure_unit:
@@ -1143,7 +1322,7 @@ class PointIsotherm(BaseIsotherm):
             )
 
         # Interpolate using the internal interpolator
-        loading = self.l_interpolator(pressure)
+        loading = interpolator(pressure)
 
         # Ensure loading is in correct units and basis requested
         if material_basis or material_unit:
@@ -1203,11 +1382,20 @@ class PointIsotherm(BaseIsotherm):
         In this integral, the isotherm :math:`q(\hat{p})` is represented by a
         linear interpolation of the data.
 
+        The integral up to each data point is computed once for every branch
+        and set of units, and stored until the isotherm is converted. Each
+        pressure requested then only requires the area of the last, partial
+        segment.
+
+        The points of a branch are integrated in order of increasing pressure.
+        Previous versions used the order of the data, which gave incorrect
+        results for the desorption branch, recorded from high to low pressure.
+
         For in-detail explanations, check reference [#]_.
 
         Parameters
         ----------
-        pressure : float
+        pressure : float or array
             Pressure (in corresponding units as data in instantiation).
         branch : {'ads', 'des'}
             The branch of the use for calculation. Defaults to adsorption.
@@ -1230,7 +1418,7 @@ class PointIsotherm(BaseIsotherm):
 
         Returns
         -------
-        float
+        float or array
             Spreading pressure, :math:`\Pi`.
 
         References
@@ -1239,28 +1427,29 @@ class PointIsotherm(BaseIsotherm):
            Theory (IAST) Python Package. Computer Physics Communications.
 
         """
-        # Get all data points
-        pressures = self.pressure(
-            branch=branch, pressure_unit=pressure_unit, pressure_mode=pressure_mode
-        )
-        loadings = self.loading(
+        # Convert to a numpy array just in case
+        pressure = numpy.asarray(pressure, dtype=float)
+
+        # Get the (cached) integral at all data points
+        pressures, loadings, areas = self._spreading_pressure_table(
             branch=branch,
+            pressure_unit=pressure_unit,
+            pressure_mode=pressure_mode,
             loading_unit=loading_unit,
             loading_basis=loading_basis,
             material_unit=material_unit,
-            material_basis=material_basis
+            material_basis=material_basis,
         )
 
         # Check if we need to extrapolate beyond available data
-        if (self.l_interpolator is not None and self.l_interpolator.interp_fill is None) & \
-                (pressure > pressures.max() or pressure < pressures.min()):
+        if interp_fill is None and numpy.any(pressure > pressures[-1]):
             raise CalculationError(
                 textwrap.dedent(
                     f"""
                 To compute the spreading pressure at this bulk adsorbate pressure,
-                we would need to extrapolate the isotherm since this pressure ({pressure:.3g} {self.pressure_unit})
+                we would need to extrapolate the isotherm since this pressure ({numpy.max(pressure):.3g} {self.pressure_unit})
                 is outside the range of the highest pressure in your pure-component
-                isotherm data ({pressures.max()} {self.pressure_unit}).
+                isotherm data ({pressures[-1]} {self.pressure_unit}).
 
                 At present, the PointIsotherm class is set to throw an exception
                 when this occurs, as we do not have data outside this pressure range
@@ -1269,7 +1458,7 @@ class PointIsotherm(BaseIsotherm):
                 Option 1: fit an analytical model to extrapolate the isotherm
                 Option 2: pass a `interp_fill` to the spreading pressure function of the
                     PointIsotherm object. Then, that PointIsotherm will
-                    assume that the uptake beyond {pressures.max()} {self.pressure_unit} is given by
+                    assume that the uptake beyond {pressures[-1]} {self.pressure_unit} is given by
                     `interp_fill`. This is reasonable if your isotherm data exhibits
                     a plateau at the highest pressures.
                 Option 3: Go back to the lab or computer to collect isotherm data
@@ -1278,35 +1467,18 @@ class PointIsotherm(BaseIsotherm):
                 )
             )
 
-        # Step 1: Approximate loading up to first pressure point with Henry's law
+        # Approximate loading up to first pressure point with Henry's law
         # loading = henry_const * P where henry_const is the initial slope
         henry_const = loadings[0] / pressures[0]
 
-        # Step 2: Find how many points are less than target pressure P
-        n_points = numpy.sum(pressures < pressure)
-
-        if n_points == 0:
-            # Step 3a: If P is between 0 and first pressure point
-            # The integral simplifies to henry_const * P
-            return henry_const * pressure
-
-        # Step 3b: P > first pressure point - calculate the total area
-        # Area of first segment from 0 to P_1
-        area = loadings[0]
-
-        # Step 4: Calculate area between P_1 and P_k where P_k < P < P_{k+1}
-        # using linear interpolation of isotherm data
-        for i in range(n_points - 1):
-            slope = (loadings[i + 1] - loadings[i]) / (pressures[i + 1] - pressures[i])
-            intercept = loadings[i] - slope * pressures[i]
-            # Add area of this segment
-            area += slope * (pressures[i + 1] - pressures[i]) + intercept * \
-                numpy.log(pressures[i + 1] / pressures[i])
-
-        # Step 5: Calculate area of final segment from P_k to P
-        # Get the loading at pressure P using interpolation
+        # Find how many points are less than each target pressure P
+        n_points = numpy.searchsorted(pressures, pressure, side='left')
+        last = numpy.maximum(n_points - 1, 0)
+
+        # Area of final segment from P_k to P, with the loading at P
+        # obtained using interpolation (and filling, if requested)
         loading_at_p = self.loading_at(
-            pressure,
+            numpy.maximum(pressure, pressures[0]),
             branch=branch,
             pressure_unit=pressure_unit,
             pressure_mode=pressure_mode,
@@ -1316,13 +1488,91 @@ class PointIsotherm(BaseIsotherm):
             material_basis=material_basis,
             interp_fill=interp_fill
         )
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            slope = (loading_at_p - loadings[last]) / (pressure - pressures[last])
+            intercept = loadings[last] - slope * pressures[last]
+            area = areas[last] + slope * (pressure - pressures[last]) + \
+                intercept * numpy.log(pressure / pressures[last])
+
+        # If P is between 0 and first pressure point
+        # the integral simplifies to henry_const * P
+        area = numpy.where(n_points == 0, henry_const * pressure, area)
+
+        if area.ndim == 0:
+            return area[()]
+        return area
 
-        # Calculate the slope of the final segment
-        slope = (loading_at_p - loadings[n_points - 1]) / (pressure - pressures[n_points - 1])
-        intercept = loadings[n_points - 1] - slope * pressures[n_points - 1]
-
-        # Add the area of the final segment
-        area += slope * (pressure - pressures[n_points - 1]) + intercept * \
-            numpy.log(pressure / pressures[n_points - 1])
+    def _spreading_pressure_table(
+        self,
+        branch: str,
+        **units,
+    ) -> t.Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+        """
+        Return the pressure and loading points of a branch, sorted by
+        pressure, together with the spreading pressure integral at each
+        point. Tables are cached per branch and units requested.
+        """
+        key = (branch, ) + tuple(units.items())
+        table = self._spreading_tables.get(key)
+        if table is not None:
+            return table
 
-        return area
+        pressures = self.pressure(
+            branch=branch,
+            pressure_unit=units['pressure_unit'],
+            pressure_mode=units['pressure_mode'],
+        )
+        loadings = self.loading(
+            branch=branch,
+            loading_unit=units['loading_unit'],
+            loading_basis=units['loading_basis'],
+            material_unit=units['material_unit'],
+            material_basis=units['material_basis'],
+        )
+        order = numpy.argsort(pressures, kind='stable')
+        pressures = numpy.asarray(pressures[order], dtype=float)
+        loadings = numpy.asarray(loadings[order], dtype=float)
+
+        # The first segment, from 0 to P_1, has an area equal to the first
+        # loading. Each further segment between P_i and P_(i+1) is a linear
+        # interpolation of the isotherm data, which integrates analytically.
+        slopes = numpy.diff(loadings) / numpy.diff(pressures)
+        intercepts = loadings[:-1] - slopes * pressures[:-1]
+        segments = slopes * numpy.diff(pressures) + \
+            intercepts * numpy.log(pressures[1:] / pressures[:-1])
+        areas = numpy.concatenate(([loadings[0]], loadings[0] + numpy.cumsum(segments)))
+
+        table = (pressures, loadings, areas)
+        self._spreading_tables[key] = table
+        return table
+
+
+def _rows_to_slice(rows: numpy.ndarray) -> t.Union[slice, numpy.ndarray]:
+    """Use a slice (a view on the data) if the selected rows are contiguous."""
+    if rows.size == 0:
+        return slice(0, 0)
+    if rows[-1] - rows[0] + 1 == rows.size:
+        return slice(rows[0], rows[-1] + 1)
+    return rows
+
+
+def _between(data: t.Union[pandas.Series, numpy.ndarray], limits: t.Tuple[float, float]):
+    """Return a mask of the data within the (inclusive) limits."""
+    return (data >= (-numpy.inf if limits[0] is None else limits[0])) & \
+        (data <= (numpy.inf if limits[1] is None else limits[1]))
+
+
+def _values(data: t.Union[pandas.Series, numpy.ndarray]) -> numpy.ndarray:
+    """Return the underlying array of a Series."""
+    if isinstance(data, pandas.Series):
+        return data.values
+    return data
+
+
+def _hashable(value):
+    """Convert a fill value, which may be array-like, into a dictionary key."""
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return repr(numpy.asarray(value).tolist())
@@ -11,6 +11,7 @@ import importlib
 
 from pygaps.utilities.exceptions import ParameterError
 from pygaps.modelling.base_model import IsothermBaseModel
+from pygaps.modelling.fit_cache import FitCache
 
 # This list has all the available models
 _MODELS = [
@@ -63,6 +64,7 @@ _IAST_MODELS = [
     "TemkinApprox",
     "Toth",
     "JensenSeaton",
+    "Virial",
 ]
 
 
@@ -256,14 +258,22 @@ def model_iso(
     param_bounds: dict = None,
     optimization_params: dict = None,
     verbose: bool = False,
+    n_jobs: int = None,
+    executor=None,
+    rmse_threshold: float = None,
+    fit_cache: FitCache = None,
 ):
     """
     Fits a PointIsotherm with a model.
 
+    Many isotherms can be passed at once: with a single model,
+    they are fit together (see ``fit_batch``).
+
     Parameters
     ----------
-    isotherm : PointIsotherm
-        The isotherm to model.
+    isotherm : PointIsotherm or iterable of PointIsotherm
+        The isotherm to model, or many isotherms, such as
+        a list or an IsothermCollection.
     branch : [None, 'ads', 'des'], optional
         Branch of isotherm to model. Defaults to adsorption branch.
     model : str, list, 'guess'
@@ -281,8 +291,38 @@ def model_iso(
         <https://docs.scipy.org/doc/scipy/reference/optimize.html#module-scipy.optimize>`__.
     verbose : bool
         Prints out extra information about steps taken.
+    n_jobs : int, optional
+        Number of processes used to fit models, if more than one is tried.
+    executor : concurrent.futures.Executor, optional
+        An executor to fit models on, if more than one is tried.
+    rmse_threshold : float, optional
+        Return the first model with an RMSE at or below this value,
+        if more than one is tried.
+    fit_cache : FitCache, optional
+        A cache of fits to reuse, and to which new fits are added.
+
+    Returns
+    -------
+    ModelIsotherm or list
+        The model isotherm, or a list with a model isotherm for each
+        of many isotherms (None where a single model failed to fit).
     """
+    from pygaps.core.baseisotherm import BaseIsotherm
     from pygaps.core.modelisotherm import ModelIsotherm
+    if not isinstance(isotherm, BaseIsotherm):
+        return ModelIsotherm.from_pointisotherms(
+            isotherm,
+            branch=branch,
+            model=model,
+            param_guess=param_guess,
+            param_bounds=param_bounds,
+            optimization_params=optimization_params,
+            verbose=verbose,
+            n_jobs=n_jobs,
+            executor=executor,
+            rmse_threshold=rmse_threshold,
+            fit_cache=fit_cache,
+        )
     return ModelIsotherm.from_pointisotherm(
         isotherm,
         branch=branch,
@@ -291,4 +331,13 @@ def model_iso(
         param_bounds=param_bounds,
         optimization_params=optimization_params,
         verbose=verbose,
+        n_jobs=n_jobs,
+        executor=executor,
+        rmse_threshold=rmse_threshold,
+        fit_cache=fit_cache,
     )
+
+
+# imported last, as it requires the functions above
+from pygaps.modelling.model_batch import ModelBatch  # noqa: E402
+from pygaps.modelling.model_batch import fit_batch  # noqa: E402
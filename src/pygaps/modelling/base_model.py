@@ -6,8 +6,11 @@ import numpy
 from scipy import optimize
 
 from pygaps import logger
+from pygaps.modelling.solvers import LogPressureIntegral
+from pygaps.modelling.solvers import invert_monotonic
 from pygaps.utilities.exceptions import CalculationError
 from pygaps.utilities.exceptions import ParameterError
+from pygaps.utilities.python_utilities import ObservedDict
 
 
 class IsothermBaseModel():
@@ -35,6 +38,18 @@ class IsothermBaseModel():
     loading_range: "tuple[float,float]" = None
     # Model fit on the provided data
     rmse: float = None
+    # Relative tolerance of spreading pressure, if numerically integrated
+    spreading_pressure_tol: float = 1e-8
+    # Methods computed numerically, which only take a single set of parameters
+    numerical_methods: "tuple[str]" = ()
+    # Attributes other than parameters the loading depends on
+    _loading_state: "tuple[str]" = ()
+    # Attributes stored by to_dict, whose changes are counted
+    _stored_attributes: "tuple[str]" = ("params", "rmse", "pressure_range", "loading_range")
+    # Tabulated spreading pressure integral, if numerically integrated
+    _spreading_integral: "tuple[tuple, LogPressureIntegral]" = None
+    # Tabulated spreading pressure, used to invert it
+    _spreading_inverse: "tuple[tuple, tuple[numpy.ndarray, numpy.ndarray]]" = None
 
     def __init__(self, **params):
         """Populate instance-specific parameters."""
@@ -55,8 +70,9 @@ class IsothermBaseModel():
 
         # Bounds for the parameters
         parameter_bounds = params.pop('param_bounds', None)
+        self.param_bounds = dict(zip(self.param_names, self.param_default_bounds))
         if parameter_bounds:
-            self.param_bounds = {}
+            # bounds not given are kept as default
             for param, bound in parameter_bounds.items():
                 if param not in self.param_names:
                     raise ParameterError(
@@ -64,14 +80,24 @@ class IsothermBaseModel():
                         f" in the '{self.name}' model."
                     )
                 self.param_bounds[param] = bound
-        else:
-            self.param_bounds = dict(zip(self.param_names, self.param_default_bounds))
 
         # Others
         self.pressure_range = params.pop('pressure_range', (numpy.nan, numpy.nan))
         self.loading_range = params.pop('loading_range', (numpy.nan, numpy.nan))
         self.rmse = params.pop('rmse', numpy.nan)
 
+    def __setattr__(self, name, value):
+        """Count changes of the parameters and ranges the model is stored with."""
+        if name == "params":
+            value = ObservedDict(value, on_change=self._changed)
+        super().__setattr__(name, value)
+        if name in self._stored_attributes:
+            self._changed()
+
+    def _changed(self):
+        """Record a change of the model."""
+        self.__dict__["_version"] = self.__dict__.get("_version", 0) + 1
+
     def __init_parameters__(self, params):
         """Initialize model parameters from isotherm data."""
 
@@ -155,6 +181,128 @@ class IsothermBaseModel():
         """
         raise NotImplementedError("""This model does not implement spreading pressure.""")
 
+    def spreading_pressure_inverse(self, spreading_pressure: float) -> float:
+        """
+        Calculate gas pressure at specified spreading pressure.
+
+        The spreading pressure is tabulated on a log-pressure grid spanning
+        the range of the model, and the table kept until the model parameters
+        change. Each value is first interpolated in the table, then refined
+        with Newton steps in log-pressure, as :math:`d\\pi / d \\ln{p} = n(p)`.
+        Values outside the table are inverted with a bracketing search.
+        Models where the spreading pressure can be inverted
+        analytically override this method.
+
+        Parameters
+        ----------
+        spreading_pressure : float or array
+            The spreading pressure at which to calculate the pressure.
+
+        Returns
+        -------
+        float or array
+            Pressure at specified spreading pressure, NaN if it cannot be found.
+        """
+        spreading_pressure = numpy.asarray(spreading_pressure, dtype=float)
+        target = spreading_pressure.ravel()
+        pressure = numpy.full(target.shape, numpy.nan)
+        converged = numpy.zeros(target.shape, dtype=bool)
+        converged[target == 0] = True
+        pressure[target == 0] = 0
+
+        log_p, table = self._spreading_pressure_table()
+        index = numpy.flatnonzero((target > table[0]) & (target <= table[-1]))
+        if index.size:
+            # the bracket on log-pressure, from the table
+            k = numpy.clip(numpy.searchsorted(table, target[index]) - 1, 0, len(table) - 2)
+            lower, upper = log_p[k], log_p[k + 1]
+            u = numpy.interp(target[index], table, log_p)
+            with numpy.errstate(all='ignore'):
+                for _ in range(20):
+                    p = numpy.exp(u)
+                    step = (self.spreading_pressure(p) - target[index]) / self.loading(p)
+                    u_new = numpy.clip(u - step, lower, upper)
+                    done = numpy.abs(u_new - u) <= 1e-12
+                    u = u_new
+                    if numpy.all(done):
+                        break
+            pressure[index] = numpy.exp(u)
+            converged[index] = done
+
+        rest = numpy.flatnonzero(~converged & numpy.isfinite(target) & (target > 0))
+        if rest.size:
+            pressure[rest], converged[rest] = invert_monotonic(self.spreading_pressure, target[rest])
+
+        pressure = numpy.where(converged, pressure, numpy.nan)
+        if not spreading_pressure.shape:
+            return pressure[0]
+        return pressure.reshape(spreading_pressure.shape)
+
+    def _spreading_pressure_table(self):
+        """
+        Spreading pressure on a log-pressure grid, with 10 points per decade
+        spanning the pressure range of the model and a few decades around it.
+        The table is kept until the model parameters change.
+        """
+        key = (
+            tuple(self.params.values()),
+            tuple(self.pressure_range) if self.pressure_range else None,
+            tuple(getattr(self, attr) for attr in self._loading_state),
+        )
+        if self._spreading_inverse is None or self._spreading_inverse[0] != key:
+            low, high = self.pressure_range if self.pressure_range else (1, 1)
+            high = numpy.log10(high) if high > 0 else 0
+            low = numpy.log10(low) if low > 0 else high - 3
+            log_p = numpy.log(10) * numpy.arange(numpy.floor(low) - 6, numpy.ceil(high) + 3.05, 0.1)
+            with numpy.errstate(all='ignore'):
+                table = numpy.asarray(self.spreading_pressure(numpy.exp(log_p)), dtype=float)
+            # only keep the increasing part of the table
+            valid = numpy.isfinite(table) & (table > 0)
+            valid &= numpy.maximum.accumulate(numpy.where(valid, table, -numpy.inf)) <= table
+            self._spreading_inverse = (key, (log_p[valid], table[valid]))
+        return self._spreading_inverse[1]
+
+    def param_derivatives(self, value: "list[float]") -> "dict[str, list[float]]":
+        """
+        Calculate the derivatives of the model with respect to each parameter.
+
+        The derivatives are of the loading at specified pressure, or of the
+        pressure at specified loading for models which calculate pressure.
+        Models which can express them analytically override this method,
+        otherwise derivatives are computed by finite differences when fitting.
+
+        Parameters
+        ----------
+        value : ndarray
+            The pressure (or loading) at which to calculate the derivatives.
+
+        Returns
+        -------
+        dict
+            Dictionary of derivatives for each parameter.
+        """
+        raise NotImplementedError
+
+    def _integrate_spreading_pressure(self, pressure):
+        """
+        Integrate the spreading pressure numerically, for models where it
+        has no analytical expression.
+
+        The cumulative integral is tabulated and kept until the model
+        parameters change, so repeated calls only integrate from the
+        nearest tabulated pressure.
+        """
+        key = (
+            tuple(self.params.values()),
+            self.spreading_pressure_tol,
+            tuple(getattr(self, attr) for attr in self._loading_state),
+        )
+        if self._spreading_integral is None or self._spreading_integral[0] != key:
+            self._spreading_integral = (
+                key, LogPressureIntegral(self.loading, tol=self.spreading_pressure_tol)
+            )
+        return self._spreading_integral[1](pressure)
+
     @abc.abstractmethod
     def toth_correction(self, pressure: float) -> float:
         r"""
@@ -270,6 +418,18 @@ class IsothermBaseModel():
                 self.params[param_names[i]] = x[i]
             return fit_func_base(pressure, loading)
 
+        def fit_jac(x, pressure, loading):
+            for i, _ in enumerate(param_names):
+                self.params[param_names[i]] = x[i]
+            with numpy.errstate(divide='ignore', invalid='ignore'):
+                if self.calculates == "loading":
+                    derivatives = self.param_derivatives(pressure)
+                else:
+                    derivatives = self.param_derivatives(loading)
+                jac = numpy.column_stack([derivatives[p] for p in param_names])
+            # limits at zero pressure or loading are zero
+            return numpy.where(numpy.isfinite(jac), jac, 0)
+
         fit_args = {
             "fun": fit_func,  # fitting function
             "x0": guess,  # initial guess
@@ -277,6 +437,9 @@ class IsothermBaseModel():
             "args": (pressure, loading),  # extra arguments to the fit function
             "x_scale": "jac",  # scale the problem using the jacobian
         }
+        # use analytic derivatives if the model has them
+        if type(self).param_derivatives is not IsothermBaseModel.param_derivatives:
+            fit_args["jac"] = fit_jac
         if optimization_params:
             fit_args.update(optimization_params)
 
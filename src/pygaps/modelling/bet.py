@@ -162,6 +162,32 @@ class BET(IsothermBaseModel):
 
         return res
 
+    def param_derivatives(self, pressure):
+        """
+        Calculate the derivatives of the loading with respect to each parameter.
+
+        Parameters
+        ----------
+        pressure : ndarray
+            The pressure at which to calculate the derivatives.
+
+        Returns
+        -------
+        dict
+            Dictionary of derivatives for each parameter.
+        """
+        nm = self.params['n_m']
+        N = self.params['N']
+        C = self.params['C']
+        multilayer = 1.0 - N * pressure
+        monolayer = 1.0 - N * pressure + C * pressure
+        loading = nm * C * pressure / (multilayer * monolayer)
+        return {
+            "n_m": C * pressure / (multilayer * monolayer),
+            "C": nm * pressure / monolayer**2,
+            "N": loading * pressure * (1.0 / multilayer + 1.0 / monolayer),
+        }
+
     def spreading_pressure(self, pressure):
         r"""
         Calculate spreading pressure at specified gas pressure.
@@ -2,10 +2,9 @@
 
 import numpy
 from scipy import constants
-from scipy import integrate
-from scipy import optimize
 
 from pygaps.modelling.base_model import IsothermBaseModel
+from pygaps.modelling.solvers import invert_monotonic
 from pygaps.utilities.exceptions import CalculationError
 
 
@@ -47,6 +46,7 @@ class ChemiPhysisorption(IsothermBaseModel):
     name = 'ChemiPhysisorption'
     formula = r"n_{m_1}\frac{K_1 p}{\sqrt[t_1]{1+(K_1 p)^{t_1}}} + \right[n_{m_2}\frac{K_2 p}{1+K_2 p} ]\left \exp(\frac{-Ea}{RT})"
     calculates = 'loading'
+    numerical_methods = ("pressure", "spreading_pressure")
     param_names = (
         "n_m1",
         "K1",
@@ -63,6 +63,7 @@ class ChemiPhysisorption(IsothermBaseModel):
         (0., numpy.inf),
         (0., numpy.inf),
     )
+    _loading_state = ('rt', )
     rt = 1000
 
     def __init_parameters__(self, params):
@@ -107,15 +108,14 @@ class ChemiPhysisorption(IsothermBaseModel):
         float
             Pressure at specified loading.
         """
-        def fun(x):
-            return self.loading(x) - loading
+        pressure, converged = invert_monotonic(self.loading, loading)
 
-        opt_res = optimize.root(fun, numpy.zeros_like(loading), method='hybr')
-
-        if not opt_res.success:
-            raise CalculationError(f"Root finding for value {loading} failed.")
+        if not numpy.all(converged):
+            raise CalculationError(
+                f"Root finding for value {numpy.asarray(loading)[~converged]} failed."
+            )
 
-        return opt_res.x
+        return pressure
 
     def spreading_pressure(self, pressure):
         r"""
@@ -129,19 +129,21 @@ class ChemiPhysisorption(IsothermBaseModel):
             \pi = \int_{0}^{p_i} \frac{n_i(p_i)}{p_i} dp_i
 
         The integral for the ChemiPhysisorption model cannot be solved analytically
-        and must be calculated numerically.
+        and must be calculated numerically. It is integrated in log-pressure,
+        for all pressures at once, and the cumulative integral is kept
+        for later calls with the same parameters.
 
         Parameters
         ----------
-        pressure : float
+        pressure : float or array
             The pressure at which to calculate the spreading pressure.
 
         Returns
         -------
-        float
+        float or array
             Spreading pressure at specified pressure.
         """
-        return integrate.quad(lambda x: self.loading(x) / x, 0, pressure)[0]
+        return self._integrate_spreading_pressure(pressure)
 
     def toth_correction(self, pressure):
         r"""
@@ -2,7 +2,6 @@
 
 import numpy
 from scipy import constants
-from scipy import integrate
 
 from pygaps.modelling.base_model import IsothermBaseModel
 
@@ -52,12 +51,14 @@ class DA(IsothermBaseModel):
     name = 'DA'
     formula = r"n(p) = n_t \exp[-(\frac{-RT\ln(p/p_0)}{\varepsilon})^{m}]"
     calculates = 'loading'
+    numerical_methods = ("spreading_pressure", )
     param_names = ("n_m", "e", "m")
     param_default_bounds = (
         (0, numpy.inf),
         (0, numpy.inf),
         (1, 3),
     )
+    _loading_state = ('minus_rt', )
     minus_rt = -1000  # initial value for guess
 
     def __init_parameters__(self, params):
@@ -109,6 +110,31 @@ class DA(IsothermBaseModel):
         m = self.params['m']
         return numpy.exp(e / self.minus_rt * numpy.power(-numpy.log(loading / nm), 1 / m))
 
+    def param_derivatives(self, pressure):
+        """
+        Calculate the derivatives of the loading with respect to each parameter.
+
+        Parameters
+        ----------
+        pressure : ndarray
+            The pressure at which to calculate the derivatives.
+
+        Returns
+        -------
+        dict
+            Dictionary of derivatives for each parameter.
+        """
+        nm = self.params['n_m']
+        e = self.params['e']
+        m = self.params['m']
+        potential = self.minus_rt * numpy.log(pressure) / e
+        coverage = numpy.exp(-potential**m)
+        return {
+            "n_m": coverage,
+            "e": nm * coverage * m * potential**m / e,
+            "m": -nm * coverage * potential**m * numpy.log(potential),
+        }
+
     def spreading_pressure(self, pressure):
         r"""
         Calculate spreading pressure at specified gas pressure.
@@ -121,19 +147,21 @@ class DA(IsothermBaseModel):
             \pi = \int_{0}^{p_i} \frac{n_i(p_i)}{p_i} dp_i
 
         The integral for the DA model cannot be solved analytically
-        and must be calculated numerically.
+        and must be calculated numerically. It is integrated in log-pressure,
+        for all pressures at once, and the cumulative integral is kept
+        for later calls with the same parameters.
 
         Parameters
         ----------
-        pressure : float
+        pressure : float or array
             The pressure at which to calculate the spreading pressure.
 
         Returns
         -------
-        float
+        float or array
             Spreading pressure at specified pressure.
         """
-        return integrate.quad(lambda x: self.loading(x) / x, 0, pressure)[0]
+        return self._integrate_spreading_pressure(pressure)
 
     def initial_guess(self, pressure, loading):
         """
@@ -2,7 +2,6 @@
 
 import numpy
 from scipy import constants
-from scipy import integrate
 
 from pygaps.modelling.base_model import IsothermBaseModel
 
@@ -49,11 +48,13 @@ class DR(IsothermBaseModel):
     name = 'DR'
     formula = r"n(p) = n_t \exp [-(\frac{-RT\ln(p/p_0)}{\varepsilon})^{2}]"
     calculates = 'loading'
+    numerical_methods = ("spreading_pressure", )
     param_names = ("n_m", "e")
     param_default_bounds = (
         (0, numpy.inf),
         (0, numpy.inf),
     )
+    _loading_state = ('minus_rt', )
     minus_rt = -1000  # initial value for guess
 
     def __init_parameters__(self, params):
@@ -103,6 +104,29 @@ class DR(IsothermBaseModel):
         e = self.params['e']
         return numpy.exp(e / self.minus_rt * numpy.sqrt(-numpy.log(loading / nm)))
 
+    def param_derivatives(self, pressure):
+        """
+        Calculate the derivatives of the loading with respect to each parameter.
+
+        Parameters
+        ----------
+        pressure : ndarray
+            The pressure at which to calculate the derivatives.
+
+        Returns
+        -------
+        dict
+            Dictionary of derivatives for each parameter.
+        """
+        nm = self.params['n_m']
+        e = self.params['e']
+        potential = self.minus_rt * numpy.log(pressure) / e
+        coverage = numpy.exp(-potential**2)
+        return {
+            "n_m": coverage,
+            "e": 2 * nm * coverage * potential**2 / e,
+        }
+
     def spreading_pressure(self, pressure):
         r"""
         Calculate spreading pressure at specified gas pressure.
@@ -115,19 +139,21 @@ class DR(IsothermBaseModel):
             \pi = \int_{0}^{p_i} \frac{n_i(p_i)}{p_i} dp_i
 
         The integral for the DR model cannot be solved analytically
-        and must be calculated numerically.
+        and must be calculated numerically. It is integrated in log-pressure,
+        for all pressures at once, and the cumulative integral is kept
+        for later calls with the same parameters.
 
         Parameters
         ----------
-        pressure : float
+        pressure : float or array
             The pressure at which to calculate the spreading pressure.
 
         Returns
         -------
-        float
+        float or array
             Spreading pressure at specified pressure.
         """
-        return integrate.quad(lambda x: self.loading(x) / x, 0, pressure)[0]
+        return self._integrate_spreading_pressure(pressure)
 
     def initial_guess(self, pressure, loading):
         """
@@ -142,6 +142,29 @@ class DSLangmuir(IsothermBaseModel):
 
         return (n_P * dP_dn) - 1
 
+    def param_derivatives(self, pressure):
+        """
+        Calculate the derivatives of the loading with respect to each parameter.
+
+        Parameters
+        ----------
+        pressure : ndarray
+            The pressure at which to calculate the derivatives.
+
+        Returns
+        -------
+        dict
+            Dictionary of derivatives for each parameter.
+        """
+        k1p = self.params["K1"] * pressure
+        k2p = self.params["K2"] * pressure
+        return {
+            "n_m1": k1p / (1.0 + k1p),
+            "K1": self.params["n_m1"] * pressure / (1.0 + k1p)**2,
+            "n_m2": k2p / (1.0 + k2p),
+            "K2": self.params["n_m2"] * pressure / (1.0 + k2p)**2,
+        }
+
     def spreading_pressure(self, pressure):
         r"""
         Calculate spreading pressure at specified gas pressure.
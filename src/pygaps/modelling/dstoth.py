@@ -1,10 +1,9 @@
 """Double Site Toth isotherm model."""
 
 import numpy
-from scipy import integrate
-from scipy import optimize
 
 from pygaps.modelling.base_model import IsothermBaseModel
+from pygaps.modelling.solvers import invert_monotonic
 from pygaps.utilities.exceptions import CalculationError
 
 
@@ -53,6 +52,7 @@ class DSToth(IsothermBaseModel):
     name = 'DSToth'
     formula = r"n(p) = n_{m_1}\frac{K_1 p}{\sqrt[t_1]{1+(K_1 p)^{t_1}}} + n_{m_2}\frac{K_2 p}{\sqrt[t_2]{1+(K_2 p)^{t_2}}}"
     calculates = 'loading'
+    numerical_methods = ("pressure", "spreading_pressure")
     param_names = ("n_m1", "K1", "t1", "n_m2", "K2", "t2")
     param_default_bounds = (
         (0., numpy.inf),
@@ -101,15 +101,42 @@ class DSToth(IsothermBaseModel):
         float
             Pressure at specified loading.
         """
-        def fun(x):
-            return self.loading(x) - loading
+        pressure, converged = invert_monotonic(self.loading, loading)
 
-        opt_res = optimize.root(fun, numpy.zeros_like(loading), method='hybr')
+        if not numpy.all(converged):
+            raise CalculationError(
+                f"Root finding for value {numpy.asarray(loading)[~converged]} failed."
+            )
+
+        return pressure
+
+    def param_derivatives(self, pressure):
+        """
+        Calculate the derivatives of the loading with respect to each parameter.
 
-        if not opt_res.success:
-            raise CalculationError(f"Root finding for value {loading} failed.")
+        Parameters
+        ----------
+        pressure : ndarray
+            The pressure at which to calculate the derivatives.
 
-        return opt_res.x
+        Returns
+        -------
+        dict
+            Dictionary of derivatives for each parameter.
+        """
+        derivatives = {}
+        for site in ("1", "2"):
+            n_m = self.params["n_m" + site]
+            Kp = self.params["K" + site] * pressure
+            t = self.params["t" + site]
+            denominator = 1.0 + Kp**t
+            coverage = Kp / denominator**(1 / t)
+            derivatives["n_m" + site] = coverage
+            derivatives["K" + site] = n_m * pressure / denominator**(1 / t + 1)
+            derivatives["t" + site] = n_m * coverage * (
+                numpy.log(denominator) / t**2 - Kp**t * numpy.log(Kp) / (t * denominator)
+            )
+        return derivatives
 
     def spreading_pressure(self, pressure):
         r"""
@@ -123,19 +150,21 @@ class DSToth(IsothermBaseModel):
             \pi = \int_{0}^{p_i} \frac{n_i(p_i)}{p_i} dp_i
 
         The integral for the DSToth model cannot be solved analytically
-        and must be calculated numerically.
+        and must be calculated numerically. It is integrated in log-pressure,
+        for all pressures at once, and the cumulative integral is kept
+        for later calls with the same parameters.
 
         Parameters
         ----------
-        pressure : float
+        pressure : float or array
             The pressure at which to calculate the spreading pressure.
 
         Returns
         -------
-        float
+        float or array
             Spreading pressure at specified pressure.
         """
-        return integrate.quad(lambda x: self.loading(x) / x, 0, pressure)[0]
+        return self._integrate_spreading_pressure(pressure)
 
     def toth_correction(self, pressure):
         r"""
@@ -1,9 +1,9 @@
 """Flory-Huggins-VST isotherm model."""
 
 import numpy
-from scipy import optimize
 
 from pygaps.modelling.base_model import IsothermBaseModel
+from pygaps.modelling.solvers import invert_monotonic
 from pygaps.utilities.exceptions import CalculationError
 
 
@@ -76,6 +76,7 @@ class FHVST(IsothermBaseModel):
     # Model parameters
     name = 'FHVST'
     calculates = 'pressure'
+    numerical_methods = ("loading", )
     param_names = ("n_m", "K", "a1v")
     param_default_bounds = (
         (0, numpy.inf),
@@ -101,15 +102,14 @@ class FHVST(IsothermBaseModel):
         float
             Loading at specified pressure.
         """
-        def fun(x):
-            return self.pressure(x) - pressure
+        loading, converged = invert_monotonic(self.pressure, pressure, upper=self.params["n_m"])
 
-        opt_res = optimize.root(fun, numpy.zeros_like(pressure), method='hybr')
+        if not numpy.all(converged):
+            raise CalculationError(
+                f"Root finding for value {numpy.asarray(pressure)[~converged]} failed."
+            )
 
-        if not opt_res.success:
-            raise CalculationError(f"Root finding for value {pressure} failed.")
-
-        return opt_res.x
+        return loading
 
     def pressure(self, loading):
         """
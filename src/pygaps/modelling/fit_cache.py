@@ -0,0 +1,290 @@
+"""
+A cache of isotherm model fits, to avoid refitting the same data.
+
+Fits are kept in memory, with the least recently used discarded first,
+and optionally in an sqlite file so they persist between sessions.
+"""
+
+import hashlib
+import json
+import pathlib
+import typing as t
+
+import numpy
+
+from pygaps.utilities.python_utilities import LRUCache
+from pygaps.utilities.sqlite_utilities import db_query
+
+_CREATE_TABLE = """
+    CREATE TABLE IF NOT EXISTS "fits" (
+        `key`           TEXT        NOT NULL PRIMARY KEY,
+        `model`         TEXT        NOT NULL,
+        `material`      TEXT,
+        `adsorbate`     TEXT,
+        `temperature`   REAL,
+        `success`       INTEGER     NOT NULL,
+        `fit`           TEXT        NOT NULL
+    );
+"""
+
+
+def _to_json(obj):
+    """Serialise numpy values and anything else as their representation."""
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    return repr(obj)
+
+
+def _entry(model, material, adsorbate, temperature, success, fit) -> dict:
+    """A stored fit, with what it belongs to."""
+    return {
+        "model": str(model).lower(),
+        "material": material,
+        "adsorbate": adsorbate,
+        "temperature": temperature,
+        "success": bool(success),
+        "fit": json.loads(fit),
+    }
+
+
+class FitCache():
+    """
+    A cache of isotherm model fits.
+
+    Each fit is stored under a key made from the fitted data, the isotherm
+    branch, the model name, the parameter guess and bounds and the
+    optimisation parameters (as well as the temperature, which some models
+    use). Fitted models are stored as their dictionary, and failed fits
+    as their error message. Failed fits are only kept in memory, so that
+    they are attempted again in a new session.
+
+    The cache can also provide a starting point for fitting the same
+    model on the same material and adsorbate at a nearby temperature.
+    This starting point is not part of the key, so that a fit is found
+    regardless of the other fits stored before it.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Maximum number of fits kept in memory.
+    path : str, optional
+        Path to an sqlite file where fits are also stored.
+        It is created if it does not exist.
+    warm_start : float, optional
+        Largest temperature difference (in K) from which a cached fit
+        is used as the initial guess of a new fit. Defaults to None,
+        where initial guesses are not taken from the cache.
+
+    Examples
+    --------
+    Reuse fits, also in later sessions, and start from fits within 20 K::
+
+        cache = pygaps.modelling.FitCache(path="fits.db", warm_start=20)
+        pygaps.model_iso(isotherm, model="guess", fit_cache=cache)
+
+    """
+    def __init__(
+        self,
+        maxsize: int = 512,
+        path: str = None,
+        warm_start: float = None,
+    ):
+        self.memory = LRUCache(maxsize=maxsize)
+        self.path = pathlib.Path(path) if path else None
+        self.warm_start = warm_start
+        if self.path:
+            db_query(self.path, _CREATE_TABLE)
+
+    def __len__(self):
+        return len(self.memory)
+
+    @staticmethod
+    def key(
+        model: str,
+        pressure: numpy.ndarray,
+        loading: numpy.ndarray,
+        branch: str = 'ads',
+        param_guess: dict = None,
+        param_bounds: dict = None,
+        optimization_params: dict = None,
+        temperature: float = None,
+    ) -> str:
+        """
+        Generate the key of a fit.
+
+        Parameters
+        ----------
+        model : str
+            Name of the model.
+        pressure : array
+            Pressure of the fitted points.
+        loading : array
+            Loading of the fitted points.
+        branch : str, optional
+            Branch of the isotherm which is fitted.
+        param_guess : dict, optional
+            Initial guess of the model parameters, if given by the user.
+        param_bounds : dict, optional
+            Bounds of the model parameters.
+        optimization_params : dict, optional
+            Parameters passed to the fitting routine.
+        temperature : float, optional
+            Temperature of the isotherm.
+
+        Returns
+        -------
+        str
+            The key of the fit.
+        """
+        data_hasher = hashlib.md5(numpy.ascontiguousarray(pressure, dtype=float).tobytes())
+        data_hasher.update(numpy.ascontiguousarray(loading, dtype=float).tobytes())
+        raw = {
+            "data": data_hasher.hexdigest(),
+            "branch": branch,
+            "model": str(model).lower(),
+            "param_guess": param_guess,
+            "param_bounds": param_bounds,
+            "optimization_params": optimization_params,
+            "temperature": float(temperature) if temperature is not None else None,
+        }
+        raw = json.dumps(raw, sort_keys=True, default=_to_json)
+        return hashlib.md5(raw.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> t.Optional[dict]:
+        """
+        Return a stored fit, looking in memory first, then on disk.
+
+        Parameters
+        ----------
+        key : str
+            The key of the fit.
+
+        Returns
+        -------
+        dict or None
+            The stored ``fit``, with the ``model``, ``material``,
+            ``adsorbate`` and ``temperature`` it belongs to,
+            or None if the fit is not stored.
+        """
+        entry = self.memory.get(key)
+        if entry is None and self.path:
+            rows = db_query(
+                self.path,
+                "SELECT model, material, adsorbate, temperature, success, fit FROM fits WHERE key = ?",
+                (key, ),
+            )
+            if rows:
+                entry = _entry(*rows[0])
+                self.memory[key] = entry
+        return entry
+
+    def set(
+        self,
+        key: str,
+        model: str,
+        fit: dict,
+        material: str = None,
+        adsorbate: str = None,
+        temperature: float = None,
+    ):
+        """
+        Store a fit. Failed fits are not stored on disk.
+
+        Parameters
+        ----------
+        key : str
+            The key of the fit.
+        model : str
+            Name of the model.
+        fit : dict
+            Either the dictionary of the fitted model, or ``{"error": message}``
+            for a failed fit.
+        material : str, optional
+            Material of the isotherm.
+        adsorbate : str, optional
+            Adsorbate of the isotherm.
+        temperature : float, optional
+            Temperature of the isotherm.
+        """
+        success = "error" not in fit
+        fit = json.dumps(fit, default=_to_json)
+        self.memory[key] = _entry(model, material, adsorbate, temperature, success, fit)
+        if self.path and success:
+            db_query(
+                self.path,
+                "INSERT OR REPLACE INTO fits VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, str(model).lower(), material, adsorbate, temperature, success, fit),
+            )
+
+    def nearest(
+        self,
+        model: str,
+        material: str,
+        adsorbate: str,
+        temperature: float,
+    ) -> t.Optional[dict]:
+        """
+        Return the parameters of a successful fit of the same model, material
+        and adsorbate at the nearest other temperature, within ``warm_start`` K.
+
+        Parameters
+        ----------
+        model : str
+            Name of the model.
+        material : str
+            Material of the isotherm.
+        adsorbate : str
+            Adsorbate of the isotherm.
+        temperature : float
+            Temperature of the isotherm.
+
+        Returns
+        -------
+        dict or None
+            The model parameters, or None if there is no fit close enough.
+        """
+        if self.warm_start is None or temperature is None:
+            return None
+
+        candidates = list(self.memory.values())
+        if self.path:
+            candidates += [
+                _entry(*row) for row in db_query(
+                    self.path,
+                    "SELECT model, material, adsorbate, temperature, success, fit FROM fits "
+                    "WHERE model = ? AND material = ? AND adsorbate = ? AND success "
+                    "AND temperature != ? ORDER BY ABS(temperature - ?) LIMIT 1",
+                    (str(model).lower(), material, adsorbate, temperature, temperature),
+                )
+            ]
+
+        best = None
+        for entry in candidates:
+            if (
+                not entry["success"] or entry["temperature"] is None or
+                entry["model"] != str(model).lower() or entry["material"] != material or
+                entry["adsorbate"] != adsorbate
+            ):
+                continue
+            difference = abs(entry["temperature"] - temperature)
+            if 0 < difference <= self.warm_start and (best is None or difference < best[0]):
+                best = (difference, entry["fit"]["parameters"])
+
+        return best[1] if best else None
+
+    def clear(self, disk: bool = False):
+        """
+        Remove all fits from memory and, optionally, from disk.
+
+        Parameters
+        ----------
+        disk : bool, optional
+            Whether to also remove the fits stored on disk.
+        """
+        self.memory.clear()
+        if disk and self.path:
+            db_query(self.path, "DELETE FROM fits")
+
+    def info(self) -> dict:
+        """Return the statistics of the fits kept in memory."""
+        return self.memory.info()
@@ -94,6 +94,28 @@ class Freundlich(IsothermBaseModel):
         """
         return (loading / self.params['K'])**self.params['m']
 
+    def param_derivatives(self, pressure):
+        """
+        Calculate the derivatives of the loading with respect to each parameter.
+
+        Parameters
+        ----------
+        pressure : ndarray
+            The pressure at which to calculate the derivatives.
+
+        Returns
+        -------
+        dict
+            Dictionary of derivatives for each parameter.
+        """
+        K = self.params["K"]
+        m = self.params["m"]
+        power = pressure**(1 / m)
+        return {
+            "K": power,
+            "m": -K * power * numpy.log(pressure) / m**2,
+        }
+
     def spreading_pressure(self, pressure):
         r"""
         Calculate spreading pressure at specified gas pressure.
@@ -125,6 +147,30 @@ class Freundlich(IsothermBaseModel):
         m = self.params["m"]
         return m * K * pressure**(1 / m)
 
+    def spreading_pressure_inverse(self, spreading_pressure):
+        r"""
+        Calculate gas pressure at specified spreading pressure.
+
+        The spreading pressure of the Freundlich model is inverted analytically.
+
+        .. math::
+
+            p = \left( \frac{\pi}{m K} \right)^m
+
+        Parameters
+        ----------
+        spreading_pressure : float or array
+            The spreading pressure at which to calculate the pressure.
+
+        Returns
+        -------
+        float or array
+            Pressure at specified spreading pressure.
+        """
+        K = self.params["K"]
+        m = self.params["m"]
+        return (spreading_pressure / (m * K))**m
+
     def toth_correction(self, pressure: float) -> float:
         r"""
         Calculate T\'oth correction, $\Psi$ to the Polanyi adsorption
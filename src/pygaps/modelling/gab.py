@@ -89,6 +89,32 @@ class GAB(IsothermBaseModel):
 
         return res
 
+    def param_derivatives(self, pressure):
+        """
+        Calculate the derivatives of the loading with respect to each parameter.
+
+        Parameters
+        ----------
+        pressure : ndarray
+            The pressure at which to calculate the derivatives.
+
+        Returns
+        -------
+        dict
+            Dictionary of derivatives for each parameter.
+        """
+        nm = self.params['n_m']
+        C = self.params['C']
+        Kp = self.params['K'] * pressure
+        multilayer = 1.0 - Kp
+        monolayer = 1.0 - Kp + C * Kp
+        return {
+            "n_m": C * Kp / (multilayer * monolayer),
+            "C": nm * Kp / monolayer**2,
+            "K": nm * C * pressure / (multilayer * monolayer) *
+            (1.0 + Kp / multilayer + Kp * (1.0 - C) / monolayer),
+        }
+
     def spreading_pressure(self, pressure):
         r"""
         Calculate spreading pressure at specified gas pressure.
@@ -85,6 +85,22 @@ class Henry(IsothermBaseModel):
         """
         return loading / self.params["K"]
 
+    def param_derivatives(self, pressure):
+        """
+        Calculate the derivatives of the loading with respect to each parameter.
+
+        Parameters
+        ----------
+        pressure : ndarray
+            The pressure at which to calculate the derivatives.
+
+        Returns
+        -------
+        dict
+            Dictionary of derivatives for each parameter.
+        """
+        return {"K": pressure}
+
     def spreading_pressure(self, pressure):
         r"""
         Calculate spreading pressure at specified gas pressure.
@@ -114,6 +130,28 @@ class Henry(IsothermBaseModel):
         """
         return self.params["K"] * pressure
 
+    def spreading_pressure_inverse(self, spreading_pressure):
+        r"""
+        Calculate gas pressure at specified spreading pressure.
+
+        The spreading pressure of the Henry model is inverted analytically.
+
+        .. math::
+
+            p = \frac{\pi}{K_H}
+
+        Parameters
+        ----------
+        spreading_pressure : float or array
+            The spreading pressure at which to calculate the pressure.
+
+        Returns
+        -------
+        float or array
+            Pressure at specified spreading pressure.
+        """
+        return spreading_pressure / self.params["K"]
+
     def toth_correction(self, pressure: float) -> float:
         r"""
         Calculate T\'oth correction, $\Psi$ to the Polanyi adsorption
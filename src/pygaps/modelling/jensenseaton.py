@@ -1,10 +1,9 @@
 """Jensen-Seaton isotherm model."""
 
 import numpy
-from scipy import integrate
-from scipy import optimize
 
 from pygaps.modelling.base_model import IsothermBaseModel
+from pygaps.modelling.solvers import invert_monotonic
 from pygaps.utilities.exceptions import CalculationError
 
 
@@ -51,6 +50,7 @@ class JensenSeaton(IsothermBaseModel):
     name = 'JensenSeaton'
     formula = r"n(p) = K p [1 + (\frac{K p}{(n_m (1 + k p)})^t]^{-1/t}"
     calculates = 'loading'
+    numerical_methods = ("pressure", "spreading_pressure")
     param_names = ("K", "n_m", "k", "t")
     param_default_bounds = (
         (0., numpy.inf),
@@ -96,15 +96,14 @@ class JensenSeaton(IsothermBaseModel):
         float
             Pressure at specified loading.
         """
-        def fun(x):
-            return self.loading(x) - loading
+        pressure, converged = invert_monotonic(self.loading, loading)
 
-        opt_res = optimize.root(fun, numpy.zeros_like(loading), method='hybr')
+        if not numpy.all(converged):
+            raise CalculationError(
+                f"Root finding for value {numpy.asarray(loading)[~converged]} failed."
+            )
 
-        if not opt_res.success:
-            raise CalculationError(f"Root finding for value {loading} failed.")
-
-        return opt_res.x
+        return pressure
 
     def spreading_pressure(self, pressure):
         r"""
@@ -118,19 +117,21 @@ class JensenSeaton(IsothermBaseModel):
             \pi = \int_{0}^{p_i} \frac{n_i(p_i)}{p_i} dp_i
 
         The integral for the Jensen-Seaton model cannot be solved analytically
-        and must be calculated numerically.
+        and must be calculated numerically. It is integrated in log-pressure,
+        for all pressures at once, and the cumulative integral is kept
+        for later calls with the same parameters.
 
         Parameters
         ----------
-        pressure : float
+        pressure : float or array
             The pressure at which to calculate the spreading pressure.
 
         Returns
         -------
-        float
+        float or array
             Spreading pressure at specified pressure.
         """
-        return integrate.quad(lambda x: self.loading(x) / x, 0, pressure)[0]
+        return self._integrate_spreading_pressure(pressure)
 
     def initial_guess(self, pressure, loading):
         """
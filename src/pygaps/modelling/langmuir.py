@@ -125,6 +125,26 @@ class Langmuir(IsothermBaseModel):
         """
         return loading / (self.params["K"] * (self.params["n_m"] - loading))
 
+    def param_derivatives(self, pressure):
+        """
+        Calculate the derivatives of the loading with respect to each parameter.
+
+        Parameters
+        ----------
+        pressure : ndarray
+            The pressure at which to calculate the derivatives.
+
+        Returns
+        -------
+        dict
+            Dictionary of derivatives for each parameter.
+        """
+        kp = self.params["K"] * pressure
+        return {
+            "K": self.params["n_m"] * pressure / (1.0 + kp)**2,
+            "n_m": kp / (1.0 + kp),
+        }
+
     def spreading_pressure(self, pressure):
         r"""
         Calculate spreading pressure at specified gas pressure.
@@ -154,6 +174,28 @@ class Langmuir(IsothermBaseModel):
         """
         return self.params["n_m"] * numpy.log(1.0 + self.params["K"] * pressure)
 
+    def spreading_pressure_inverse(self, spreading_pressure):
+        r"""
+        Calculate gas pressure at specified spreading pressure.
+
+        The spreading pressure of the Langmuir model is inverted analytically.
+
+        .. math::
+
+            p = \frac{1}{K} \left( \exp{\frac{\pi}{n_m}} - 1 \right)
+
+        Parameters
+        ----------
+        spreading_pressure : float or array
+            The spreading pressure at which to calculate the pressure.
+
+        Returns
+        -------
+        float or array
+            Pressure at specified spreading pressure.
+        """
+        return numpy.expm1(spreading_pressure / self.params["n_m"]) / self.params["K"]
+
     def toth_correction(self, pressure):
         r"""
         Calculate T\'oth correction, $\Psi$ to the Polanyi adsorption
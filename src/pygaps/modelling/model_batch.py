@@ -0,0 +1,566 @@
+"""Evaluation and fitting of one isotherm model for many sets of parameters at once."""
+
+import typing as t
+
+import numpy
+
+from pygaps import logger
+from pygaps.modelling import get_isotherm_model
+from pygaps.modelling.base_model import IsothermBaseModel
+from pygaps.utilities.exceptions import CalculationError
+from pygaps.utilities.exceptions import ParameterError
+
+_EPS = numpy.finfo(float).eps
+
+
+class ModelBatch():
+    """
+    One isotherm model with many sets of parameters, such as the fits
+    of the same model on many materials, evaluated together.
+
+    The parameters are stored as arrays, with one value per set.
+    Model functions are evaluated with broadcasting, over (sets x points):
+    a single value gives one result per set, an array of values
+    gives a row of results per set, while a 2D array must
+    have one row of values per set.
+
+    Functions which have a closed form in the model class are evaluated
+    for all sets at once. Functions which the model calculates numerically
+    (listed in ``numerical_methods`` on the model) are evaluated for each
+    set in turn, still for all its points at once.
+
+    Parameters
+    ----------
+    model : str
+        The name of the model.
+    parameters : dict or list
+        Either a dictionary with an array of values for each model parameter,
+        or a list with a dictionary of parameters for each set.
+    temperature : float or array, optional
+        Temperature of the isotherms, for models which require it.
+
+    Attributes
+    ----------
+    rmse : array
+        RMSE of each set, if the batch was fitted.
+    converged : array
+        Whether the fit of each set converged, if the batch was fitted.
+    iterations : array
+        Number of iterations taken to fit each set, if the batch was fitted.
+    pressure_range : array
+        Pressure range of each set, as (min, max) rows, if known.
+    loading_range : array
+        Loading range of each set, as (min, max) rows, if known.
+
+    Examples
+    --------
+    >>> batch = ModelBatch("Langmuir", {"n_m": [1, 2, 3], "K": [10, 1, 0.1]})
+    >>> batch.loading([0.1, 1, 10]).shape
+    (3, 3)
+
+    """
+
+    rmse: numpy.ndarray = None
+    converged: numpy.ndarray = None
+    iterations: numpy.ndarray = None
+    pressure_range: numpy.ndarray = None
+    loading_range: numpy.ndarray = None
+
+    def __init__(
+        self,
+        model: str,
+        parameters: t.Union[dict, t.List[dict]],
+        temperature: t.Union[float, t.List[float]] = None,
+    ):
+        self.model = get_isotherm_model(model)
+        param_names = tuple(self.model.param_names) if not isinstance(
+            self.model.param_names, str
+        ) else (self.model.param_names, )
+
+        if not isinstance(parameters, dict):
+            parameters = list(parameters)
+            try:
+                parameters = {
+                    param: [params[param] for params in parameters]
+                    for param in param_names
+                }
+            except KeyError as err:
+                raise ParameterError(
+                    f"The {self.model.name} model is missing parameter {err}."
+                ) from None
+
+        missing = [param for param in param_names if param not in parameters]
+        if missing:
+            raise ParameterError(f"The {self.model.name} model is missing parameters {missing}.")
+
+        #: Array of values of each parameter
+        self.params = {
+            param: numpy.asarray(parameters[param], dtype=float).ravel()
+            for param in param_names
+        }
+        sizes = {len(values) for values in self.params.values()}
+        if len(sizes) != 1:
+            raise ParameterError("All parameters must have the same number of values.")
+        self.size = sizes.pop()
+
+        # the model holds the parameters as columns, to broadcast over points
+        self.model.params = {param: values[:, None] for param, values in self.params.items()}
+        if temperature is not None:
+            temperature = numpy.broadcast_to(numpy.asarray(temperature, dtype=float), (self.size, ))
+            self.model.__init_parameters__({'temperature': temperature[:, None]})
+
+    @classmethod
+    def from_isotherms(cls, isotherms: t.Iterable):
+        """
+        Create a batch from the models of several ModelIsotherms.
+
+        Parameters
+        ----------
+        isotherms : list of ModelIsotherm
+            Isotherms which are modelled with the same model.
+
+        Returns
+        -------
+        ModelBatch
+            The batch of all isotherm model parameters.
+        """
+        isotherms = list(isotherms)
+        if not isotherms:
+            raise ParameterError("Pass at least one isotherm.")
+        names = {isotherm.model.name for isotherm in isotherms}
+        if len(names) != 1:
+            raise ParameterError(f"Isotherms must all use the same model, not {names}.")
+        batch = cls(
+            names.pop(),
+            [isotherm.model.params for isotherm in isotherms],
+            temperature=[isotherm.temperature for isotherm in isotherms],
+        )
+        batch.rmse = numpy.array([isotherm.model.rmse for isotherm in isotherms], dtype=float)
+        batch.pressure_range = numpy.array([
+            isotherm.model.pressure_range for isotherm in isotherms
+        ], dtype=float)
+        batch.loading_range = numpy.array([
+            isotherm.model.loading_range for isotherm in isotherms
+        ], dtype=float)
+        return batch
+
+    def __len__(self) -> int:
+        """Number of parameter sets."""
+        return self.size
+
+    def __repr__(self) -> str:
+        """Print the model and the number of parameter sets."""
+        return f"<pyGAPS ModelBatch, '{self.model.name}' type, {self.size} parameter sets>"
+
+    def __getitem__(self, index: int) -> IsothermBaseModel:
+        """Return the model with a single set of parameters."""
+        if not -self.size <= index < self.size:
+            raise IndexError("ModelBatch index out of range.")
+        properties = {}
+        if self.rmse is not None:
+            properties['rmse'] = float(self.rmse[index])
+        if self.pressure_range is not None:
+            properties['pressure_range'] = tuple(float(x) for x in self.pressure_range[index])
+        if self.loading_range is not None:
+            properties['loading_range'] = tuple(float(x) for x in self.loading_range[index])
+        model = get_isotherm_model(
+            self.model.name,
+            parameters={param: float(values[index]) for param, values in self.params.items()},
+            **properties,
+        )
+        for attr in model._loading_state:
+            value = numpy.broadcast_to(getattr(self.model, attr), (self.size, 1))
+            setattr(model, attr, float(value[index, 0]))
+        return model
+
+    def loading(self, pressure: t.Union[float, t.List[float]]) -> numpy.ndarray:
+        """
+        Calculate the loading of each set at specified pressures.
+
+        Parameters
+        ----------
+        pressure : float or array
+            The pressures at which to calculate the loading.
+
+        Returns
+        -------
+        array
+            Loading of each set at each pressure.
+        """
+        return self._evaluate("loading", pressure)
+
+    def pressure(self, loading: t.Union[float, t.List[float]]) -> numpy.ndarray:
+        """
+        Calculate the pressure of each set at specified loadings.
+
+        Parameters
+        ----------
+        loading : float or array
+            The loadings at which to calculate the pressure.
+
+        Returns
+        -------
+        array
+            Pressure of each set at each loading.
+        """
+        return self._evaluate("pressure", loading)
+
+    def spreading_pressure(self, pressure: t.Union[float, t.List[float]]) -> numpy.ndarray:
+        """
+        Calculate the reduced spreading pressure of each set at specified pressures.
+
+        Parameters
+        ----------
+        pressure : float or array
+            The pressures at which to calculate the spreading pressure.
+
+        Returns
+        -------
+        array
+            Spreading pressure of each set at each pressure.
+        """
+        return self._evaluate("spreading_pressure", pressure)
+
+    def toth_correction(self, pressure: t.Union[float, t.List[float]]) -> numpy.ndarray:
+        """
+        Calculate the Toth correction of each set at specified pressures.
+
+        Parameters
+        ----------
+        pressure : float or array
+            The pressures at which to calculate the Toth correction.
+
+        Returns
+        -------
+        array
+            Toth correction of each set at each pressure.
+        """
+        return self._evaluate("toth_correction", pressure)
+
+    def _evaluate(self, method: str, values: t.Union[float, t.List[float]]) -> numpy.ndarray:
+        """Evaluate a model function for all sets, broadcasting the values."""
+        values = numpy.asarray(values, dtype=float)
+        if values.ndim > 2 or (values.ndim == 2 and values.shape[0] not in (1, self.size)):
+            raise ParameterError(
+                "Pass a single value, an array of values for all parameter sets, "
+                "or a 2D array with a row of values for each parameter set."
+            )
+        points = numpy.atleast_2d(values)
+        shape = (self.size, points.shape[1])
+
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            if method in self.model.numerical_methods:
+                points = numpy.broadcast_to(points, shape)
+                result = numpy.array([
+                    getattr(self[index], method)(points[index]) for index in range(self.size)
+                ]).reshape(shape)
+            else:
+                result = numpy.broadcast_to(getattr(self.model, method)(points), shape)
+
+        if values.ndim == 0:
+            return numpy.array(result[:, 0])
+        return numpy.array(result)
+
+
+def fit_batch(
+    model: str,
+    pressures: t.Iterable[t.List[float]],
+    loadings: t.Iterable[t.List[float]],
+    param_guess: t.Union[dict, t.List[dict]] = None,
+    param_bounds: dict = None,
+    optimization_params: dict = None,
+    temperature: t.Union[float, t.List[float]] = None,
+    retry: bool = True,
+    verbose: bool = False,
+) -> ModelBatch:
+    """
+    Fit one model to many isotherms at once.
+
+    All fits are solved together by a vectorised Levenberg-Marquardt
+    least squares algorithm, in which each isotherm is an independent
+    problem with its own damping and convergence. Model functions and their
+    parameter derivatives are evaluated for all isotherms in a single call,
+    with the points of each isotherm padded to the same length.
+    Parameter bounds are enforced by projecting each step onto them.
+
+    Derivatives are analytic for models which provide them, otherwise
+    they are computed by forward finite differences. Isotherms which do
+    not converge are, by default, fit again individually with the standard
+    fitting routine, as are all isotherms of models with their own.
+
+    Parameters
+    ----------
+    model : str
+        The name of the model.
+    pressures : list of arrays
+        The pressure points of each isotherm.
+    loadings : list of arrays
+        The loading points of each isotherm.
+    param_guess : dict or list, optional
+        Starting guess for the model parameters, either the same for all
+        isotherms or a list with a guess (or None) for each one.
+        The initial guess of the model is used otherwise.
+    param_bounds : dict, optional
+        Bounds for the model parameters.
+    optimization_params : dict, optional
+        Tolerances ``ftol``, ``xtol`` and ``gtol`` and the maximum number of
+        iterations ``max_nfev`` of the fit. The whole dictionary is
+        passed to SciPy.optimize.least_squares for individual fits.
+    temperature : float or array, optional
+        Temperature of the isotherms, for models which require it.
+    retry : bool, optional
+        Whether isotherms which did not converge are fit again individually.
+    verbose : bool, optional
+        Prints out extra information about steps taken.
+
+    Returns
+    -------
+    ModelBatch
+        The fitted parameters, with the ``rmse``, ``converged`` flag and
+        number of ``iterations`` of each isotherm. Parameters of fits which
+        failed before starting (e.g. with invalid data) are NaN.
+
+    Raises
+    ------
+    ParameterError
+        When the isotherm data or the parameters are invalid.
+
+    """
+    pressures = [numpy.asarray(p, dtype=float).ravel() for p in pressures]
+    loadings = [numpy.asarray(n, dtype=float).ravel() for n in loadings]
+    size = len(pressures)
+    if not size or len(loadings) != size:
+        raise ParameterError("Pass the same number of pressure and loading arrays.")
+    counts = numpy.array([len(p) for p in pressures])
+    if any(len(n) != count for n, count in zip(loadings, counts)) or not counts.all():
+        raise ParameterError("Each isotherm must have equal, non-empty, pressure and loading.")
+    if temperature is not None:
+        temperature = numpy.broadcast_to(numpy.asarray(temperature, dtype=float), (size, ))
+    if param_guess is None or isinstance(param_guess, dict):
+        param_guess = [param_guess] * size
+    param_guess = list(param_guess)
+    if len(param_guess) != size:
+        raise ParameterError("Pass a parameter guess for each isotherm.")
+
+    batch_model = get_isotherm_model(model, param_bounds=param_bounds)
+    param_names = list(batch_model.params)
+    lower = numpy.array([batch_model.param_bounds[param][0] for param in param_names], dtype=float)
+    upper = numpy.array([batch_model.param_bounds[param][1] for param in param_names], dtype=float)
+
+    if verbose:
+        logger.info(f"Attempting to model {size} isotherms using {batch_model.name}.")
+
+    # Initial guess of each isotherm
+    guess = numpy.full((size, len(param_names)), numpy.nan)
+    for index, (pressure, loading) in enumerate(zip(pressures, loadings)):
+        initial = param_guess[index]
+        if initial:
+            for param in initial:
+                if param not in param_names:
+                    raise ParameterError(
+                        f"'{param}' is not a valid parameter"
+                        f" in the '{batch_model.name}' model."
+                    )
+            initial = batch_model.initial_guess_bounds(dict(initial))
+        else:
+            single = get_isotherm_model(model, param_bounds=param_bounds)
+            if temperature is not None:
+                single.__init_parameters__({'temperature': temperature[index]})
+            try:
+                initial = single.initial_guess(pressure, loading)
+            except (ValueError, ZeroDivisionError, CalculationError):
+                continue
+        guess[index] = [initial[param] for param in param_names]
+
+    batch = ModelBatch(model, {param: guess[:, i] for i, param in enumerate(param_names)})
+    batch.pressure_range = numpy.array([(p.min(), p.max()) for p in pressures])
+    batch.loading_range = numpy.array([(n.min(), n.max()) for n in loadings])
+    batch.rmse = numpy.full(size, numpy.nan)
+    batch.converged = numpy.zeros(size, dtype=bool)
+    batch.iterations = numpy.zeros(size, dtype=int)
+    if temperature is not None:
+        batch.model.__init_parameters__({'temperature': temperature[:, None]})
+
+    optimization_params = optimization_params or {}
+    if type(batch_model).fit is IsothermBaseModel.fit:
+        params, rmse, converged, iterations = _fit_stacked(
+            batch.model, pressures, loadings, guess, lower, upper, optimization_params
+        )
+        batch.rmse, batch.converged, batch.iterations = rmse, converged, iterations
+        for i, param in enumerate(param_names):
+            batch.params[param] = params[:, i]
+        retry_indices = numpy.flatnonzero(~converged & numpy.isfinite(guess).all(axis=1))
+    else:
+        retry_indices = numpy.flatnonzero(numpy.isfinite(guess).all(axis=1))
+        retry = True
+
+    if retry:
+        for index in retry_indices:
+            single = get_isotherm_model(
+                model,
+                pressure_range=tuple(batch.pressure_range[index]),
+                loading_range=tuple(batch.loading_range[index]),
+                param_bounds=param_bounds,
+            )
+            if temperature is not None:
+                single.__init_parameters__({'temperature': temperature[index]})
+            try:
+                single.fit(
+                    pressures[index],
+                    loadings[index],
+                    dict(zip(param_names, guess[index])),
+                    optimization_params or None,
+                )
+            except CalculationError:
+                continue
+            for param in param_names:
+                batch.params[param][index] = single.params[param]
+            batch.rmse[index] = single.rmse
+            batch.converged[index] = True
+
+    batch.model.params = {param: values[:, None] for param, values in batch.params.items()}
+
+    if verbose:
+        logger.info(
+            f"Model {batch_model.name} converged for "
+            f"{batch.converged.sum()} of {size} isotherms."
+        )
+
+    return batch
+
+
+def _fit_stacked(
+    model: IsothermBaseModel,
+    pressures: t.List[numpy.ndarray],
+    loadings: t.List[numpy.ndarray],
+    guess: numpy.ndarray,
+    lower: numpy.ndarray,
+    upper: numpy.ndarray,
+    optimization_params: dict,
+) -> t.Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+    """
+    Solve the least squares fits of many isotherms with a vectorised,
+    bound-projected, Levenberg-Marquardt algorithm.
+
+    The model holds parameters for all isotherms as columns. Residuals of each
+    isotherm are divided by the range of the fitted variable, so that the RMSE
+    is the same as for an individual fit. Returns the parameters, RMSE,
+    convergence flag and number of iterations of each isotherm.
+    """
+    ftol = optimization_params.get('ftol', 1e-8)
+    xtol = optimization_params.get('xtol', 1e-8)
+    gtol = optimization_params.get('gtol', 1e-8)
+    max_nfev = int(optimization_params.get('max_nfev') or 100 * guess.shape[1])
+
+    size, n_params = guess.shape
+    counts = numpy.array([len(p) for p in pressures])
+    width = counts.max()
+    mask = numpy.arange(width)[None, :] < counts[:, None]
+
+    def pad(arrays):
+        return numpy.array([numpy.pad(a, (0, width - a.size), mode='edge') for a in arrays])
+
+    if model.calculates == "loading":
+        values, targets = pad(pressures), pad(loadings)
+    else:
+        values, targets = pad(loadings), pad(pressures)
+    model_range = targets.max(axis=1) - targets.min(axis=1)
+    weight = 1 / numpy.where(model_range > 0, model_range, 1.0)[:, None]
+    state = {
+        attr: numpy.broadcast_to(getattr(model, attr), (size, 1))
+        for attr in model._loading_state
+    }
+    analytic = type(model).param_derivatives is not IsothermBaseModel.param_derivatives
+    function = getattr(model, model.calculates)
+
+    def set_params(x, rows):
+        model.params = {param: x[:, i, None] for i, param in enumerate(model.params)}
+        for attr, value in state.items():
+            setattr(model, attr, value[rows])
+
+    def residual(x, rows):
+        set_params(x, rows)
+        res = (function(values[rows]) - targets[rows]) * weight[rows]
+        return numpy.where(mask[rows], res, 0)
+
+    def jacobian(x, rows, res):
+        if analytic:
+            set_params(x, rows)
+            derivatives = model.param_derivatives(values[rows])
+            jac = numpy.stack([
+                numpy.broadcast_to(derivatives[param], res.shape) for param in model.params
+            ], axis=-1) * weight[rows, :, None]
+        else:
+            jac = numpy.empty(res.shape + (n_params, ))
+            for i in range(n_params):
+                step = numpy.sqrt(_EPS) * numpy.maximum(numpy.abs(x[:, i]), 1)
+                # step inwards when at the upper bound
+                step = numpy.where(x[:, i] + step > upper[i], -step, step)
+                shifted = x.copy()
+                shifted[:, i] += step
+                jac[:, :, i] = (residual(shifted, rows) - res) / step[:, None]
+        # limits at zero pressure or loading are zero
+        jac = numpy.where(numpy.isfinite(jac) & mask[rows, :, None], jac, 0)
+        return jac
+
+    with numpy.errstate(all='ignore'):
+        x = guess.copy()
+        rows = numpy.arange(size)
+        res = residual(x, rows)
+        cost = 0.5 * numpy.sum(res**2, axis=1)
+        active = numpy.isfinite(cost) & numpy.isfinite(x).all(axis=1)
+        converged = numpy.zeros(size, dtype=bool)
+        iterations = numpy.zeros(size, dtype=int)
+        damping = numpy.full(size, 1e-3)
+
+        for _ in range(max_nfev):
+            rows = numpy.flatnonzero(active)
+            if not rows.size:
+                break
+            xr, cost_r = x[rows], cost[rows]
+            jac = jacobian(xr, rows, res[rows])
+            grad = numpy.einsum('rmk,rm->rk', jac, res[rows])
+            hess = numpy.einsum('rmk,rml->rkl', jac, jac)
+            diag = numpy.diagonal(hess, axis1=1, axis2=2)
+
+            # parameters held at a bound by the gradient
+            held = ((xr <= lower) & (grad > 0)) | ((xr >= upper) & (grad < 0))
+            grad = numpy.where(held, 0, grad)
+
+            # the residual is orthogonal to the jacobian columns
+            norm = numpy.sqrt(diag * 2 * cost_r[:, None])
+            cosine = numpy.where(norm > 0, numpy.abs(grad) / norm, 0).max(axis=1)
+            done = (cosine <= gtol) | (cost_r == 0)
+
+            scale = numpy.maximum(diag, _EPS * numpy.maximum(diag.max(axis=1, keepdims=True), 1))
+            system = hess + damping[rows, None, None] * (scale[:, :, None] * numpy.eye(n_params))
+            free = ~held[:, :, None] & ~held[:, None, :]
+            system = numpy.where(free, system, numpy.eye(n_params))
+            try:
+                step = numpy.linalg.solve(system, -grad[:, :, None])[:, :, 0]
+            except numpy.linalg.LinAlgError:
+                step = -(numpy.linalg.pinv(system) @ grad[:, :, None])[:, :, 0]
+            x_new = numpy.clip(xr + step, lower, upper)
+            step = x_new - xr
+
+            res_new = residual(x_new, rows)
+            cost_new = 0.5 * numpy.sum(res_new**2, axis=1)
+            better = numpy.isfinite(cost_new) & (cost_new < cost_r)
+            iterations[rows] += 1
+
+            accepted = rows[better]
+            x[accepted] = x_new[better]
+            res[accepted] = res_new[better]
+            cost[accepted] = cost_new[better]
+            damping[rows] = numpy.where(better, damping[rows] / 3, damping[rows] * 4)
+
+            done |= better & (cost_r - cost_new <= ftol * cost_r)
+            done |= numpy.all(numpy.abs(step) <= xtol * (xtol + numpy.abs(xr)), axis=1)
+            converged[rows[done]] = True
+            active[rows[done]] = False
+            # no step can be taken
+            active[rows[~done & (damping[rows] > 1e16)]] = False
+
+        rmse = numpy.sqrt(2 * cost / counts) / (model_range * weight[:, 0])
+
+    return x, rmse, converged, iterations
@@ -96,6 +96,30 @@ class Quadratic(IsothermBaseModel):
 
         return res
 
+    def param_derivatives(self, pressure):
+        """
+        Calculate the derivatives of the loading with respect to each parameter.
+
+        Parameters
+        ----------
+        pressure : ndarray
+            The pressure at which to calculate the derivatives.
+
+        Returns
+        -------
+        dict
+            Dictionary of derivatives for each parameter.
+        """
+        nm = self.params["n_m"]
+        Ka = self.params["Ka"]
+        Kb = self.params["Kb"]
+        denominator = 1.0 + Ka * pressure + Kb * pressure**2
+        return {
+            "n_m": (Ka + 2.0 * Kb * pressure) * pressure / denominator,
+            "Ka": nm * pressure * (1.0 - Kb * pressure**2) / denominator**2,
+            "Kb": nm * pressure**2 * (2.0 + Ka * pressure) / denominator**2,
+        }
+
     def spreading_pressure(self, pressure):
         r"""
         Calculate spreading pressure at specified gas pressure.
@@ -127,6 +151,32 @@ class Quadratic(IsothermBaseModel):
             1.0 + self.params["Ka"] * pressure + self.params["Kb"] * pressure**2
         )
 
+    def spreading_pressure_inverse(self, spreading_pressure):
+        r"""
+        Calculate gas pressure at specified spreading pressure.
+
+        The spreading pressure of the Quadratic model is inverted analytically,
+        as the positive root of a quadratic equation.
+
+        .. math::
+
+            p = \frac{2 E}{K_a + \sqrt{K_a^2 + 4 K_b E}}
+            \quad \text{with} \quad E = \exp{\frac{\pi}{n_m}} - 1
+
+        Parameters
+        ----------
+        spreading_pressure : float or array
+            The spreading pressure at which to calculate the pressure.
+
+        Returns
+        -------
+        float or array
+            Pressure at specified spreading pressure.
+        """
+        Ka = self.params["Ka"]
+        exponent = numpy.expm1(spreading_pressure / self.params["n_m"])
+        return 2 * exponent / (Ka + numpy.sqrt(Ka**2 + 4 * self.params["Kb"] * exponent))
+
     def initial_guess(self, pressure, loading):
         """
         Return initial guess for fitting.
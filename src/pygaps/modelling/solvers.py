@@ -0,0 +1,330 @@
+"""Numerical solvers and integrators shared by isotherm models."""
+
+import functools
+import typing as t
+
+import numpy
+
+_EPS = numpy.finfo(float).eps
+_TINY = numpy.finfo(float).tiny
+
+
+def invert_monotonic(
+    fun: t.Callable,
+    value: t.Union[float, numpy.ndarray],
+    lower: float = 0.0,
+    upper: float = numpy.inf,
+    x0: t.Union[float, numpy.ndarray] = None,
+    xtol: float = 1e-10,
+    ftol: float = 1e-12,
+    maxiter: int = 100,
+) -> t.Tuple[numpy.ndarray, numpy.ndarray]:
+    """
+    Invert an increasing function element-wise, finding ``x`` so that
+    ``fun(x) = value`` for each of the values given.
+
+    Every element is solved independently, although all elements are
+    evaluated together in a single call to ``fun``. A bracket on the root is
+    first found, by expanding the upper limit when it is infinite. Newton
+    steps with a finite difference derivative are then taken, falling back to
+    bisection whenever a step leaves the current bracket.
+
+    Parameters
+    ----------
+    fun : callable
+        Increasing function of a single array argument, computed element-wise.
+    value : float or array
+        The values to invert.
+    lower : float, optional
+        Lower limit of the domain. Defaults to 0.
+    upper : float, optional
+        Upper limit of the domain, which may be infinite (default).
+        Non-finite function values (e.g. at an asymptote) are taken
+        as being above any value.
+    x0 : float or array, optional
+        Initial estimate of the solution, also used as the start
+        of the bracket search.
+    xtol : float, optional
+        Relative tolerance on the solution.
+    ftol : float, optional
+        Relative tolerance on the function value.
+    maxiter : int, optional
+        Maximum number of bracketing and solving iterations.
+
+    Returns
+    -------
+    root : array
+        The solution for each value. Failed elements are NaN.
+    converged : array
+        Whether each element has converged.
+
+    """
+    value = numpy.asarray(value, dtype=float)
+    shape = value.shape
+    target = value.ravel()
+    size = target.size
+
+    a = numpy.full(size, float(lower))
+    b = numpy.full(size, float(upper))
+    root = numpy.full(size, numpy.nan)
+    converged = numpy.zeros(size, dtype=bool)
+    if x0 is None:
+        start = numpy.full(size, max(1.0, 10 * abs(lower)))
+    else:
+        start = numpy.broadcast_to(numpy.asarray(x0, dtype=float), shape).ravel()
+        start = numpy.where(start > lower, start, max(1.0, 10 * abs(lower)))
+
+    def residual(x, idx):
+        ret = fun(x) - target[idx]
+        # non-finite values are past an asymptote, so above the target
+        return numpy.where(numpy.isnan(ret), numpy.inf, ret)
+
+    with numpy.errstate(all='ignore'):
+        idx = numpy.arange(size)
+        f_a = residual(a, idx)
+        exact = f_a == 0
+        root[exact] = a[exact]
+        converged[exact] = True
+        # values at or below the lower limit cannot be bracketed
+        active = f_a < 0
+
+        # Find an upper bracket for each element
+        if numpy.isinf(upper):
+            b = numpy.where(active, numpy.minimum(start, numpy.finfo(float).max), b)
+            searching = active.copy()
+            for _ in range(maxiter):
+                idx = numpy.flatnonzero(searching)
+                if not idx.size:
+                    break
+                below = residual(b[idx], idx) < 0
+                a[idx[below]] = b[idx[below]]
+                b[idx[below]] *= 10
+                searching[idx[~below]] = False
+            active &= ~searching
+        else:
+            idx = numpy.flatnonzero(active)
+            active[idx[residual(b[idx], idx) < 0]] = False
+
+        # Start from the estimate if within the bracket, otherwise the middle
+        x = numpy.where((start > a) & (start < b), start, 0.5 * (a + b))
+
+        for _ in range(maxiter):
+            idx = numpy.flatnonzero(active)
+            if not idx.size:
+                break
+            xi = x[idx]
+            fi = residual(xi, idx)
+
+            # solution found
+            done_f = numpy.abs(fi) <= ftol * numpy.abs(target[idx])
+
+            # narrow the bracket
+            neg = fi < 0
+            a[idx[neg]] = xi[neg]
+            b[idx[~neg]] = xi[~neg]
+            ai, bi = a[idx], b[idx]
+
+            # Newton step, or bisection if outside the bracket
+            step = numpy.sqrt(_EPS) * numpy.maximum(numpy.abs(xi), _TINY)
+            slope = (residual(xi + step, idx) - fi) / step
+            x_new = xi - fi / slope
+            bisect = ~numpy.isfinite(x_new) | (x_new <= ai) | (x_new >= bi)
+            x_new = numpy.where(bisect, 0.5 * (ai + bi), x_new)
+
+            # the step or the bracket are below tolerance
+            scale = xtol * numpy.maximum(numpy.abs(x_new), _TINY)
+            done_x = (~bisect & (numpy.abs(x_new - xi) <= scale)) | ((bi - ai) <= scale)
+
+            x[idx] = numpy.where(done_f, xi, x_new)
+            done = idx[done_f | done_x]
+            root[done] = x[done]
+            converged[done] = True
+            active[done] = False
+
+    if not shape:
+        return root[0], converged[0]
+    return root.reshape(shape), converged.reshape(shape)
+
+
+@functools.lru_cache(maxsize=None)
+def _gauss_legendre(order: int, panels: int) -> t.Tuple[numpy.ndarray, numpy.ndarray]:
+    """Nodes and weights of composite Gauss-Legendre quadrature on [-1, 0]."""
+    nodes, weights = numpy.polynomial.legendre.leggauss(order)
+    width = 1 / panels
+    starts = numpy.arange(-1, 0, width)[:panels]
+    nodes = (starts[:, None] + width * (nodes[None, :] + 1) / 2).ravel()
+    weights = numpy.tile(weights * width / 2, panels)
+    return nodes, weights
+
+
+def spreading_pressure_quadrature(
+    loading: t.Callable,
+    pressure: t.Union[float, numpy.ndarray],
+    tol: float = 1e-8,
+    order: int = 8,
+    decades: int = 12,
+    maxiter: int = 8,
+) -> t.Union[float, numpy.ndarray]:
+    r"""
+    Integrate the reduced spreading pressure of an isotherm model numerically,
+    for all pressures at once.
+
+    The integral is computed in log-pressure, where isotherms are smooth,
+    from a pressure ``decades`` orders of magnitude below each pressure.
+    Below that point, the isotherm is taken as linear (Henry's law).
+
+    .. math::
+
+        \pi(p) = \int_{0}^{p} \frac{n(\hat{p})}{\hat{p}} d\hat{p}
+               \approx n(p_{low}) + \int_{\ln p_{low}}^{\ln p} n(e^u) du
+
+    Composite Gauss-Legendre quadrature is used, evaluating the isotherm
+    at all nodes for all pressures in a single call. The number of panels is
+    doubled until two successive estimates agree to within the tolerance.
+    The lower limit is also extended if the isotherm is not yet linear.
+
+    Parameters
+    ----------
+    loading : callable
+        Isotherm loading, computed element-wise for an array of pressures.
+    pressure : float or array
+        The pressures at which to calculate the spreading pressure.
+    tol : float, optional
+        Relative tolerance of the integral.
+    order : int, optional
+        Number of Gauss-Legendre nodes in each panel.
+    decades : int, optional
+        Number of decades of pressure integrated, initially in one panel each.
+    maxiter : int, optional
+        Maximum number of refinements of the integration.
+
+    Returns
+    -------
+    float or array
+        Spreading pressure at each pressure.
+
+    """
+    pressure = numpy.asarray(pressure, dtype=float)
+    p = pressure.ravel()
+    result = numpy.zeros(p.size)
+    result[numpy.isnan(p)] = numpy.nan
+    idx = numpy.flatnonzero(p > 0)
+
+    with numpy.errstate(all='ignore'):
+        # Extend the integration range until the isotherm is in the Henry regime
+        span = numpy.full(idx.size, decades * numpy.log(10))
+        limit = loading(p[idx])
+        for _ in range(maxiter):
+            low = p[idx] * numpy.exp(-span)
+            n_low = loading(low)
+            henry = numpy.abs(loading(low / 10) * 10 / n_low - 1) <= tol
+            linear = henry | (numpy.abs(n_low) <= tol * numpy.abs(limit)) | ~numpy.isfinite(n_low)
+            if linear.all():
+                break
+            span[~linear] *= 2
+
+        # Refine until successive estimates agree
+        panels = decades
+        active = numpy.arange(idx.size)
+        previous = None
+        for _ in range(maxiter):
+            nodes, weights = _gauss_legendre(order, panels)
+            u = span[active, None] * nodes[None, :]
+            integral = span[active] * (loading(p[idx[active], None] * numpy.exp(u)) @ weights)
+            integral += loading(p[idx[active]] * numpy.exp(-span[active]))
+            result[idx[active]] = integral
+            if previous is not None:
+                done = (numpy.abs(integral - previous) <= tol * numpy.abs(integral)) | \
+                    ~numpy.isfinite(integral)
+                active, previous = active[~done], integral[~done]
+                if not active.size:
+                    break
+            else:
+                previous = integral
+            panels *= 2
+
+    if not pressure.shape:
+        return result[0]
+    return result.reshape(pressure.shape)
+
+
+class LogPressureIntegral():
+    """
+    Cumulative spreading pressure integral of an isotherm model, tabulated
+    on a grid in log-pressure so that it can be reused between calls.
+
+    The integral up to the lowest grid point is computed with
+    ``spreading_pressure_quadrature``, then the integral over each grid
+    interval is added with a fixed-order Gauss-Legendre rule. Any pressure
+    then only requires the integral from the grid point below it, which is
+    evaluated together for all pressures. The grid is extended when
+    pressures outside it are requested.
+
+    Parameters
+    ----------
+    loading : callable
+        Isotherm loading, computed element-wise for an array of pressures.
+    tol : float, optional
+        Relative tolerance of the integral up to the lowest grid point.
+    order : int, optional
+        Number of Gauss-Legendre nodes in each grid interval.
+    step : float, optional
+        Width of the grid intervals, in decades of pressure.
+
+    """
+    def __init__(
+        self,
+        loading: t.Callable,
+        tol: float = 1e-8,
+        order: int = 8,
+        step: float = 0.1,
+    ):
+        self.loading = loading
+        self.tol = tol
+        self.order = order
+        self.step = step * numpy.log(10)
+        self._nodes, self._weights = _gauss_legendre(order, 1)
+        # first grid index, and the integral at each grid point
+        self._start = None
+        self._table = None
+
+    def __call__(self, pressure: t.Union[float, numpy.ndarray]) -> t.Union[float, numpy.ndarray]:
+        """Return the spreading pressure at each pressure."""
+        pressure = numpy.asarray(pressure, dtype=float)
+        p = pressure.ravel()
+        result = numpy.where(p > 0, numpy.nan, 0.)
+        valid = numpy.flatnonzero((p > 0) & numpy.isfinite(p))
+
+        if valid.size:
+            with numpy.errstate(all='ignore'):
+                u = numpy.log(p[valid])
+                index = numpy.floor(u / self.step).astype(int)
+                self._extend(index.min(), index.max())
+                start = index * self.step
+                # integral from the grid point below to each pressure,
+                # with nodes on [-1, 0] mapped to [start, u]
+                width = u - start
+                x = numpy.exp(start[:, None] + width[:, None] * (self._nodes[None, :] + 1))
+                partial = width * (self.loading(x) @ self._weights)
+                result[valid] = self._table[index - self._start] + partial
+
+        if not pressure.shape:
+            return result[0]
+        return result.reshape(pressure.shape)
+
+    def _extend(self, low: int, high: int):
+        """Ensure the grid covers the indices given, with a margin."""
+        if self._table is not None and self._start <= low and \
+                high < self._start + len(self._table) - 1:
+            return
+        if self._table is not None:
+            low = min(low, self._start)
+            high = max(high, self._start + len(self._table) - 1)
+        low, high = low - 10, high + 11
+
+        edges = numpy.arange(low, high + 1) * self.step
+        base = spreading_pressure_quadrature(self.loading, numpy.exp(edges[0]), tol=self.tol)
+        x = numpy.exp(edges[:-1, None] + self.step * (self._nodes[None, :] + 1))
+        intervals = self.step * (self.loading(x) @ self._weights)
+        self._start = low
+        self._table = base + numpy.concatenate(([0], numpy.cumsum(intervals)))
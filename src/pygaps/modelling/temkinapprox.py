@@ -1,9 +1,9 @@
 """Temkin Approximation isotherm model."""
 
 import numpy
-from scipy import optimize
 
 from pygaps.modelling.base_model import IsothermBaseModel
+from pygaps.modelling.solvers import invert_monotonic
 from pygaps.utilities.exceptions import CalculationError
 
 
@@ -40,6 +40,7 @@ class TemkinApprox(IsothermBaseModel):
     name = 'TemkinApprox'
     formula = r"n(p) = n_m \frac{K p}{1 + K p} + n_m \theta (\frac{K p}{1 + K p})^2 (\frac{K p}{1 + K p} -1)"
     calculates = 'loading'
+    numerical_methods = ("pressure", )
     param_names = ("n_m", "K", "tht")
     param_default_bounds = (
         (0, numpy.inf),
@@ -84,15 +85,38 @@ class TemkinApprox(IsothermBaseModel):
         float
             Pressure at specified loading.
         """
-        def fun(x):
-            return self.loading(x) - loading
+        pressure, converged = invert_monotonic(self.loading, loading)
 
-        opt_res = optimize.root(fun, numpy.zeros_like(loading), method='hybr')
+        if not numpy.all(converged):
+            raise CalculationError(
+                f"Root finding for value {numpy.asarray(loading)[~converged]} failed."
+            )
 
-        if not opt_res.success:
-            raise CalculationError(f"Root finding for value {loading} failed.")
+        return pressure
 
-        return opt_res.x
+    def param_derivatives(self, pressure):
+        """
+        Calculate the derivatives of the loading with respect to each parameter.
+
+        Parameters
+        ----------
+        pressure : ndarray
+            The pressure at which to calculate the derivatives.
+
+        Returns
+        -------
+        dict
+            Dictionary of derivatives for each parameter.
+        """
+        n_m = self.params["n_m"]
+        Kp = self.params["K"] * pressure
+        tht = self.params["tht"]
+        lang_load = Kp / (1.0 + Kp)
+        return {
+            "n_m": lang_load + tht * lang_load**2 * (lang_load - 1),
+            "K": n_m * (1 + tht * (3 * lang_load**2 - 2 * lang_load)) * pressure / (1.0 + Kp)**2,
+            "tht": n_m * lang_load**2 * (lang_load - 1),
+        }
 
     def spreading_pressure(self, pressure):
         r"""
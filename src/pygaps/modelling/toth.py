@@ -1,7 +1,6 @@
 """Toth isotherm model."""
 
 import numpy
-from scipy import integrate
 
 from pygaps.modelling.base_model import IsothermBaseModel
 
@@ -30,6 +29,7 @@ class Toth(IsothermBaseModel):
     name = 'Toth'
     formula = r"n(p) = n_m \frac{K p}{\sqrt[t]{1 + (K p)^t}}"
     calculates = 'loading'
+    numerical_methods = ("spreading_pressure", )
     param_names = ("n_m", "K", "t")
     param_default_bounds = (
         (0, numpy.inf),
@@ -82,6 +82,31 @@ class Toth(IsothermBaseModel):
         t = self.params["t"]
         return (loading / (n_m * K)) / (1 - (loading / n_m)**t)**(1 / t)
 
+    def param_derivatives(self, pressure):
+        """
+        Calculate the derivatives of the loading with respect to each parameter.
+
+        Parameters
+        ----------
+        pressure : ndarray
+            The pressure at which to calculate the derivatives.
+
+        Returns
+        -------
+        dict
+            Dictionary of derivatives for each parameter.
+        """
+        n_m = self.params["n_m"]
+        Kp = self.params["K"] * pressure
+        t = self.params["t"]
+        denominator = 1.0 + Kp**t
+        coverage = Kp / denominator**(1 / t)
+        return {
+            "n_m": coverage,
+            "K": n_m * pressure / denominator**(1 / t + 1),
+            "t": n_m * coverage * (numpy.log(denominator) / t**2 - Kp**t * numpy.log(Kp) / (t * denominator)),
+        }
+
     def spreading_pressure(self, pressure):
         r"""
         Calculate spreading pressure at specified gas pressure.
@@ -94,19 +119,21 @@ class Toth(IsothermBaseModel):
             \pi = \int_{0}^{p_i} \frac{n_i(p_i)}{p_i} dp_i
 
         The integral for the Toth model cannot be solved analytically
-        and must be calculated numerically.
+        and must be calculated numerically. It is integrated in log-pressure,
+        for all pressures at once, and the cumulative integral is kept
+        for later calls with the same parameters.
 
         Parameters
         ----------
-        pressure : float
+        pressure : float or array
             The pressure at which to calculate the spreading pressure.
 
         Returns
         -------
-        float
+        float or array
             Spreading pressure at specified pressure.
         """
-        return integrate.quad(lambda x: self.loading(x) / x, 0, pressure)[0]
+        return self._integrate_spreading_pressure(pressure)
 
     def toth_correction(self, pressure):
         r"""
@@ -1,9 +1,9 @@
 """Triple Site Langmuir isotherm model."""
 
 import numpy
-from scipy import optimize
 
 from pygaps.modelling.base_model import IsothermBaseModel
+from pygaps.modelling.solvers import invert_monotonic
 from pygaps.utilities.exceptions import CalculationError
 
 
@@ -45,6 +45,7 @@ class TSLangmuir(IsothermBaseModel):
     name = 'TSLangmuir'
     formula = r"n(p) = n_{m_1} \frac{K_1 p}{1+K_1 p} + n_{m_2} \frac{K_2 p}{1+K_2 p} + n_{m_3} \frac{K_3 p}{1+K_3 p}"
     calculates = 'loading'
+    numerical_methods = ("pressure", )
     param_names = ["n_m1", "n_m2", "n_m3", "K1", "K2", "K3"]
     param_default_bounds = (
         (0., numpy.inf),
@@ -93,15 +94,35 @@ class TSLangmuir(IsothermBaseModel):
         float
             Pressure at specified loading.
         """
-        def fun(x):
-            return self.loading(x) - loading
+        pressure, converged = invert_monotonic(self.loading, loading)
 
-        opt_res = optimize.root(fun, numpy.zeros_like(loading), method='hybr')
+        if not numpy.all(converged):
+            raise CalculationError(
+                f"Root finding for value {numpy.asarray(loading)[~converged]} failed."
+            )
+
+        return pressure
 
-        if not opt_res.success:
-            raise CalculationError(f"Root finding for value {loading} failed.")
+    def param_derivatives(self, pressure):
+        """
+        Calculate the derivatives of the loading with respect to each parameter.
 
-        return opt_res.x
+        Parameters
+        ----------
+        pressure : ndarray
+            The pressure at which to calculate the derivatives.
+
+        Returns
+        -------
+        dict
+            Dictionary of derivatives for each parameter.
+        """
+        derivatives = {}
+        for site in ("1", "2", "3"):
+            kp = self.params["K" + site] * pressure
+            derivatives["n_m" + site] = kp / (1.0 + kp)
+            derivatives["K" + site] = self.params["n_m" + site] * pressure / (1.0 + kp)**2
+        return derivatives
 
     def spreading_pressure(self, pressure):
         r"""
@@ -1,11 +1,11 @@
 """Virial isotherm model."""
 
 import numpy
-from scipy import optimize
 
 from pygaps import logger
 from pygaps.graphing.calc_graphs import virial_plot
 from pygaps.modelling.base_model import IsothermBaseModel
+from pygaps.modelling.solvers import invert_monotonic
 from pygaps.utilities.exceptions import CalculationError
 
 
@@ -44,6 +44,7 @@ class Virial(IsothermBaseModel):
     name = 'Virial'
     formula = r"p(n) = n \exp{(-\ln{K_H} + An + Bn^2 + Cn^3)}"
     calculates = 'pressure'
+    numerical_methods = ("loading", "spreading_pressure")
     param_names = ("K", "A", "B", "C")
     param_default_bounds = (
         (0, numpy.inf),
@@ -62,23 +63,30 @@ class Virial(IsothermBaseModel):
 
         Parameters
         ----------
-        pressure : float
+        pressure : float or array
             The pressure at which to calculate the loading.
 
         Returns
         -------
-        float
+        float or array
             Loading at specified pressure.
         """
-        def fun(x):
-            return (self.pressure(x) - pressure)**2
+        limit, lowest = self._increasing_range(self.pressure)
+        ambiguous = numpy.asarray(pressure) >= lowest
+        if numpy.any(ambiguous):
+            raise CalculationError(
+                f"The pressure of the Virial model decreases above a loading of {limit:.4g}, "
+                f"and pressure {numpy.asarray(pressure)[ambiguous]} is reached at more than one loading."
+            )
 
-        opt_res = optimize.minimize(fun, pressure, method='Nelder-Mead')
+        X, converged = invert_monotonic(self.pressure, pressure, upper=limit)
 
-        if not opt_res.success:
-            raise CalculationError(f"Root finding failed. Error: \n\t{opt_res.message}")
+        if not numpy.all(converged):
+            raise CalculationError(
+                f"Root finding for value {numpy.asarray(pressure)[~converged]} failed."
+            )
 
-        return opt_res.x
+        return X
 
     def pressure(self, loading):
         """
@@ -112,20 +120,85 @@ class Virial(IsothermBaseModel):
 
             \pi = \int_{0}^{p_i} \frac{n_i(p_i)}{p_i} dp_i
 
-        The integral for the Virial model cannot be solved analytically
-        and must be calculated numerically.
+        As the Virial model is explicit in loading, the integral can
+        be changed to one over loading, and solved analytically.
+
+        .. math::
+
+            \pi = \int_{0}^{n_i} n \frac{d \ln{p}}{dn} dn
+                = n_i + \frac{A}{2} n_i^2 + \frac{2B}{3} n_i^3 + \frac{3C}{4} n_i^4
+
+        Only the loading at the specified pressure has to
+        be computed numerically.
 
         Parameters
         ----------
-        pressure : float
+        pressure : float or array
             The pressure at which to calculate the spreading pressure.
 
         Returns
         -------
-        float
+        float or array
             Spreading pressure at specified pressure.
         """
-        raise NotImplementedError
+        return self._loading_spreading_pressure(self.loading(pressure))
+
+    def spreading_pressure_inverse(self, spreading_pressure):
+        """
+        Calculate gas pressure at specified spreading pressure.
+
+        As the spreading pressure is a polynomial in loading, only the
+        loading is found numerically, the pressure being then calculated
+        directly from it.
+
+        Parameters
+        ----------
+        spreading_pressure : float or array
+            The spreading pressure at which to calculate the pressure.
+
+        Returns
+        -------
+        float or array
+            Pressure at specified spreading pressure, NaN if it cannot be found.
+        """
+        limit, lowest = self._increasing_range(self._loading_spreading_pressure)
+        loading, converged = invert_monotonic(
+            self._loading_spreading_pressure, spreading_pressure, upper=limit
+        )
+        converged = converged & (numpy.asarray(spreading_pressure) < lowest)
+        if not numpy.all(converged):
+            loading = numpy.where(converged, loading, numpy.nan)
+        return self.pressure(loading)
+
+    def _increasing_range(self, fun):
+        """
+        Return the loading up to which ``fun``, either the pressure or the
+        spreading pressure, increases, and the lowest value it reaches above
+        this loading. Values below it correspond to a single loading.
+
+        Both functions have a derivative of the same sign as
+        :math:`1 + An + 2Bn^2 + 3Cn^3`, and stop increasing at its first
+        positive root.
+        """
+        roots = numpy.roots([3 * self.params['C'], 2 * self.params['B'], self.params['A'], 1])
+        roots = numpy.sort(roots.real[(numpy.abs(roots.imag) < 1e-12) & (roots.real > 0)])
+        if roots.size == 0:
+            return numpy.inf, numpy.inf
+
+        # functions which decrease at large loading have no lower bound
+        leading = next((c for c in (self.params['C'], self.params['B'], self.params['A']) if c != 0), 0)
+        if leading < 0:
+            return roots[0], -numpy.inf
+        return roots[0], numpy.min(fun(roots[1:]))
+
+    def _loading_spreading_pressure(self, loading):
+        """Spreading pressure as a function of loading."""
+        return loading * (
+            1 + loading * (
+                self.params['A'] / 2 + loading *
+                (self.params['B'] * 2 / 3 + loading * self.params['C'] * 3 / 4)
+            )
+        )
 
     def initial_guess(self, pressure, loading):
         """
@@ -188,6 +261,7 @@ class Virial(IsothermBaseModel):
         add_point = False
         added_point = False
         if optimization_params:
+            optimization_params = dict(optimization_params)
             add_point = optimization_params.pop('add_point', None)
         fractional_loading = loading / max(loading)
         if len(fractional_loading[fractional_loading < 0.5]) < 3:
@@ -214,8 +288,13 @@ class Virial(IsothermBaseModel):
             return self.params['C'] * L**3 + self.params['B'] * L**2 \
                 + self.params['A'] * L - numpy.log(self.params['K']) - ln_p_over_n
 
+        def fit_jac(x, L, ln_p_over_n):
+            derivatives = {'K': -numpy.ones_like(L) / x[param_names.index('K')], 'A': L, 'B': L**2, 'C': L**3}
+            return numpy.column_stack([derivatives[param] for param in param_names])
+
         kwargs = {
             "fun": fit_func,  # fitting function
+            "jac": fit_jac,  # analytic jacobian of the fit function
             "x0": guess,  # initial guess
             "bounds": bounds,  # bounds of the parameters
             "args": (loading, ln_p_over_n),  # extra arguments to the fit function
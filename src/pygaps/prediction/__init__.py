@@ -5,6 +5,15 @@ from .iast import iast_point
 from .iast import iast_point_fraction
 from .iast import iast_binary_svp
 from .iast import iast_binary_vle
+from .iast import iast_binary_raw
+from .iast import iast_fast_raw
+from .iast import iast_sweep
 from .iast import reverse_iast
+from .iast import reverse_iast_raw
+from .iast_cache import IASTCache
+from .breakthrough import IASTTable
+from .breakthrough import breakthrough_curve
+from .iast_grid import iast_grid
+from .iast_screening import iast_screen
 from .enthalpy_to_isotherm import predict_isotherm_from_enthalpy_clapeyron
 from .enthalpy_to_isotherm import predict_isosurface_from_enthalpy_clapeyron
@@ -0,0 +1,388 @@
+"""
+Module simulating breakthrough curves of gas mixtures through fixed beds,
+with the mixture equilibrium interpolated from IAST lookup tables.
+"""
+
+import numpy
+from scipy import constants
+from scipy import sparse
+from scipy.integrate import solve_ivp
+from scipy.interpolate import RegularGridInterpolator
+
+from pygaps import logger
+from pygaps.core.modelisotherm import ModelIsotherm
+from pygaps.modelling import is_model_iast
+from pygaps.prediction.iast import iast_binary_raw
+from pygaps.prediction.iast import iast_fast_raw
+from pygaps.units.converter_unit import _MASS_UNITS
+from pygaps.units.converter_unit import _MOLAR_UNITS
+from pygaps.units.converter_unit import _PRESSURE_UNITS
+from pygaps.units.converter_unit import c_unit
+from pygaps.utilities.exceptions import CalculationError
+from pygaps.utilities.exceptions import ParameterError
+
+R = constants.gas_constant
+
+
+class IASTTable():
+    r"""
+    Mixture loadings calculated once with IAST on a lattice of
+    total pressures and compositions, then interpolated.
+
+    The total pressure axis is spaced quadratically from zero to
+    ``pressure_max``, so that it is denser at low pressure where
+    isotherms are most curved. The bulk gas composition is mapped
+    onto a unit hypercube with :math:`n-1` coordinates
+
+    .. math::
+
+        s_j = \frac{y_j}{1 - \sum_{k<j} y_k}
+
+    so that every composition is on the lattice, including those where
+    some components are absent. Loadings between lattice points
+    are interpolated linearly, and extrapolated linearly above ``pressure_max``.
+
+    Parameters
+    ----------
+    isotherms : list of ModelIsotherms or PointIsotherms
+        Pure-component adsorption isotherms, which must share units.
+    pressure_max : float
+        Highest total pressure of the lattice, in the isotherm pressure unit.
+    n_pressures : int, optional
+        Number of total pressures of the lattice.
+    n_fractions : int, optional
+        Number of points on each composition coordinate of the lattice.
+    branch : str, optional
+        Branch of the isotherms which is used.
+
+    Attributes
+    ----------
+    pressures : array
+        Total pressures of the lattice.
+    fractions : array
+        Points of each composition coordinate of the lattice.
+    loading : array
+        Loadings of each component, with a shape of
+        (n_pressures, n_fractions, ..., ncomponents).
+
+    Raises
+    ------
+    ParameterError
+        When the isotherms or lattice are not suitable.
+    CalculationError
+        When IAST cannot be solved at some points of the lattice.
+
+    """
+    def __init__(
+        self,
+        isotherms: list,
+        pressure_max: float,
+        n_pressures: int = 41,
+        n_fractions: int = 21,
+        branch: str = "ads",
+    ):
+        isotherms = list(isotherms)
+        for isotherm in isotherms:
+            if isinstance(isotherm, ModelIsotherm):
+                if not is_model_iast(isotherm.model.name):
+                    raise ParameterError(f"Model {isotherm.model.name} cannot be used with IAST.")
+            if isotherm.pressure_mode.startswith("relative"):
+                raise ParameterError("IAST only runs with isotherms on an absolute pressure basis.")
+        for unit in ("pressure_unit", "loading_basis", "loading_unit", "material_basis", "material_unit"):
+            if len({getattr(isotherm, unit) for isotherm in isotherms}) != 1:
+                raise ParameterError(f"All isotherms must have the same {unit.replace('_', ' ')}.")
+        if pressure_max <= 0:
+            raise ParameterError("The highest pressure of the table must be positive.")
+        if n_pressures < 2 or n_fractions < 2:
+            raise ParameterError("The table needs at least two points on each axis.")
+
+        self.isotherms = isotherms
+        self.branch = branch
+        self.n_components = len(isotherms)
+        self.pressures = pressure_max * numpy.linspace(0, 1, n_pressures)**2
+        self.fractions = numpy.linspace(0, 1, n_fractions)
+
+        axes = [self.pressures] + [self.fractions] * (self.n_components - 1)
+        lattice = numpy.stack(numpy.meshgrid(*axes, indexing="ij"), axis=-1)
+        lattice = lattice.reshape(-1, self.n_components)
+        partial_pressures = lattice[:, :1] * self._mole_fractions(lattice[:, 1:])
+
+        # nothing is adsorbed at zero pressure
+        loading = numpy.zeros_like(partial_pressures)
+        solve = lattice[:, 0] > 0
+        if self.n_components == 1:
+            loading[solve, 0] = isotherms[0].loading_at(partial_pressures[solve, 0], branch=branch)
+            converged = numpy.isfinite(loading[solve, 0])
+        else:
+            solver = iast_binary_raw if self.n_components == 2 else iast_fast_raw
+            result = solver(isotherms, partial_pressures[solve], branch)
+            loading[solve] = result["loading"]
+            converged = result["converged"]
+        if not numpy.all(converged):
+            raise CalculationError(
+                f"IAST could not be solved at {numpy.sum(~converged)} points of the table. "
+                "Try lowering the highest pressure of the table."
+            )
+
+        self.loading = loading.reshape([len(axis) for axis in axes] + [self.n_components])
+        self._interpolator = RegularGridInterpolator(
+            axes,
+            self.loading,
+            bounds_error=False,
+            fill_value=None,
+        )
+
+    def _mole_fractions(self, coordinates):
+        """Convert composition coordinates of the lattice to mole fractions."""
+        fractions = numpy.empty(coordinates.shape[:-1] + (self.n_components, ))
+        if self.n_components == 1:
+            fractions[..., 0] = 1
+            return fractions
+        remaining = numpy.cumprod(1 - coordinates, axis=-1)
+        fractions[..., 0] = coordinates[..., 0]
+        fractions[..., 1:-1] = remaining[..., :-1] * coordinates[..., 1:]
+        fractions[..., -1] = remaining[..., -1]
+        return fractions
+
+    def _coordinates(self, mole_fractions):
+        """Convert mole fractions to composition coordinates of the lattice."""
+        remaining = numpy.cumsum(mole_fractions[..., ::-1], axis=-1)[..., ::-1]
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            coordinates = mole_fractions[..., :-1] / remaining[..., :-1]
+        return numpy.clip(numpy.nan_to_num(coordinates), 0, 1)
+
+    def __call__(self, partial_pressures) -> numpy.ndarray:
+        """
+        Interpolate the loadings of each component.
+
+        Parameters
+        ----------
+        partial_pressures : array
+            Partial pressures of gas components,
+            with a shape of (npoints, ncomponents).
+
+        Returns
+        -------
+        array
+            Loadings of each component, with a shape of (npoints, ncomponents).
+        """
+        partial_pressures = numpy.clip(numpy.atleast_2d(partial_pressures), 0, None)
+        total_pressure = partial_pressures.sum(axis=1, keepdims=True)
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            mole_fractions = numpy.nan_to_num(partial_pressures / total_pressure)
+        points = numpy.concatenate((total_pressure, self._coordinates(mole_fractions)), axis=1)
+        return self._interpolator(points)
+
+
+def breakthrough_curve(
+    isotherms,
+    feed_partial_pressures,
+    times,
+    bed_length: float,
+    velocity: float,
+    bed_voidage: float,
+    bed_density: float,
+    mass_transfer_coefficients,
+    axial_dispersion: float = 0,
+    temperature: float = None,
+    n_cells: int = 50,
+    branch: str = "ads",
+    table_kwargs: dict = None,
+    rtol: float = 1e-6,
+    atol: float = None,
+) -> dict:
+    r"""
+    Simulate the breakthrough of a gas mixture through a fixed bed of
+    adsorbent, initially clean, with the mixture equilibrium from IAST.
+
+    The bed is isothermal, with a constant interstitial velocity,
+    and the feed is diluted in an inert carrier gas.
+    The partial pressure :math:`p_i` of each component along the bed
+    follows an axial dispersion model
+
+    .. math::
+
+        \frac{\partial p_i}{\partial t} = D \frac{\partial^2 p_i}{\partial z^2}
+            - v \frac{\partial p_i}{\partial z}
+            - \frac{\rho_b R T}{\varepsilon} \frac{\partial q_i}{\partial t}
+
+    and the loading :math:`q_i` approaches equilibrium with a
+    linear driving force
+
+    .. math::
+
+        \frac{\partial q_i}{\partial t} = k_i \left( q_i^*(p_1, ..., p_n) - q_i \right)
+
+    The bed is divided in cells (method of lines), with upwind convection,
+    a Danckwerts condition at the inlet and no dispersion at the outlet.
+    The resulting system is integrated with a stiff (BDF) solver,
+    using the sparsity of its Jacobian. The equilibrium loadings
+    :math:`q_i^*` are interpolated from an :class:`IASTTable`, so IAST
+    is only solved once, when building the table.
+
+    Parameters
+    ----------
+    isotherms : list of ModelIsotherms or PointIsotherms, or IASTTable
+        Pure-component adsorption isotherms, which must share units,
+        or a table built from them, to reuse between simulations.
+        Loadings must be molar per mass of material.
+    feed_partial_pressures : array or list
+        Partial pressures of each component in the feed,
+        in the isotherm pressure unit.
+    times : array or list
+        Times at which the bed is recorded, in seconds.
+    bed_length : float
+        Length of the bed, in m.
+    velocity : float
+        Interstitial velocity of the gas, in m/s.
+    bed_voidage : float
+        Fraction of the bed volume between adsorbent particles.
+    bed_density : float
+        Mass of adsorbent per volume of bed, in kg/m3.
+    mass_transfer_coefficients : float or array
+        Linear driving force coefficient of each component, in 1/s.
+    axial_dispersion : float, optional
+        Axial dispersion coefficient, in m2/s. Defaults to plug flow,
+        although the discretisation adds some numerical dispersion.
+    temperature : float, optional
+        Bed temperature, in K. Defaults to the temperature of the first isotherm.
+    n_cells : int, optional
+        Number of cells along the bed.
+    branch : str, optional
+        Branch of the isotherms which is used.
+    table_kwargs : dict, optional
+        Options of the IAST table, when it is built from isotherms.
+        The highest pressure defaults to 1.5 times the total feed pressure.
+    rtol : float, optional
+        Relative tolerance of the integration.
+    atol : float, optional
+        Absolute tolerance of the integration. Defaults to 1e-6 of
+        the highest feed partial pressure or loading.
+
+    Returns
+    -------
+    dict
+        A dictionary with the following components:
+
+            - ``time`` the times at which the bed is recorded
+            - ``outlet_partial_pressure`` partial pressures at the outlet,
+              with a shape of (ntimes, ncomponents)
+            - ``outlet_relative`` outlet partial pressures over the feed partial pressures
+            - ``position`` the positions of the centre of each cell
+            - ``partial_pressure`` partial pressures along the bed,
+              with a shape of (ntimes, ncells, ncomponents)
+            - ``loading`` loadings along the bed, with the same shape
+            - ``table`` the IAST table of the equilibrium
+            - ``success`` whether the integration reached the last time
+            - ``message`` the message of the integrator
+
+    Raises
+    ------
+    ParameterError
+        When something is wrong with the function parameters.
+    CalculationError
+        When the IAST table cannot be built.
+
+    """
+    # Parameter checks
+    if isinstance(isotherms, IASTTable):
+        table = isotherms
+    else:
+        table = None
+        isotherms = list(isotherms)
+    n_components = table.n_components if table else len(isotherms)
+
+    feed = numpy.ravel(numpy.asarray(feed_partial_pressures, dtype=float))
+    if len(feed) != n_components:
+        raise ParameterError("Pass a feed partial pressure for each component.")
+    if numpy.any(feed < 0) or not numpy.any(feed > 0):
+        raise ParameterError("Feed partial pressures must be positive.")
+    times = numpy.ravel(numpy.asarray(times, dtype=float))
+    if times[0] < 0 or numpy.any(numpy.diff(times) <= 0):
+        raise ParameterError("Times must be positive and increasing.")
+    if bed_length <= 0 or velocity <= 0 or bed_density <= 0:
+        raise ParameterError("Bed length, velocity and density must be positive.")
+    if not 0 < bed_voidage < 1:
+        raise ParameterError("Bed voidage must be between 0 and 1.")
+    if axial_dispersion < 0:
+        raise ParameterError("Axial dispersion cannot be negative.")
+    coefficients = numpy.broadcast_to(numpy.asarray(mass_transfer_coefficients, dtype=float), feed.shape)
+    if numpy.any(coefficients <= 0):
+        raise ParameterError("Mass transfer coefficients must be positive.")
+
+    if table is None:
+        table_kwargs = dict(table_kwargs or {})
+        table_kwargs.setdefault("pressure_max", 1.5 * feed.sum())
+        table = IASTTable(isotherms, branch=branch, **table_kwargs)
+    isotherm = table.isotherms[0]
+    if isotherm.loading_basis != "molar" or isotherm.material_basis != "mass":
+        raise ParameterError("Isotherm loadings must be molar, per mass of material.")
+    if temperature is None:
+        temperature = isotherm.temperature
+    if feed.sum() > table.pressures[-1]:
+        logger.warning("The feed pressure is higher than the table, whose loadings are extrapolated.")
+
+    # loading to mol/kg and pressure to Pa
+    loading_factor = c_unit(_MOLAR_UNITS, 1, isotherm.loading_unit, "mol") / \
+        c_unit(_MASS_UNITS, 1, isotherm.material_unit, "kg")
+    pressure_factor = c_unit(_PRESSURE_UNITS, 1, isotherm.pressure_unit, "Pa")
+    capacity = bed_density * R * temperature * loading_factor / (bed_voidage * pressure_factor)
+
+    dz = bed_length / n_cells
+    size = n_cells * n_components
+    inlet_flux = velocity * feed
+
+    def derivatives(_, state):
+        pressure = state[:size].reshape(n_cells, n_components)
+        loading = state[size:].reshape(n_cells, n_components)
+        loading_rate = coefficients * (table(pressure) - loading)
+
+        flux = numpy.empty((n_cells + 1, n_components))
+        flux[0] = inlet_flux
+        flux[1:-1] = velocity * pressure[:-1] - axial_dispersion * numpy.diff(pressure, axis=0) / dz
+        flux[-1] = velocity * pressure[-1]
+        pressure_rate = -numpy.diff(flux, axis=0) / dz - capacity * loading_rate
+        return numpy.concatenate((pressure_rate.ravel(), loading_rate.ravel()))
+
+    # pressures depend on neighbouring cells, and all variables on the pressures in their cell
+    cells = sparse.identity(size, format="csr")
+    neighbours = sparse.kron(sparse.eye(n_cells, k=-1) + sparse.eye(n_cells, k=1), sparse.identity(n_components))
+    mixture = sparse.kron(sparse.identity(n_cells), numpy.ones((n_components, n_components)))
+    sparsity = sparse.bmat([[neighbours + mixture, cells], [mixture, cells]], format="csr")
+
+    if atol is None:
+        atol = 1e-6 * numpy.concatenate((
+            numpy.full(size, feed.max()),
+            numpy.full(size, max(numpy.max(table.loading), 1e-12)),
+        ))
+
+    solution = solve_ivp(
+        derivatives,
+        (0, times[-1]),
+        numpy.zeros(2 * size),
+        method="BDF",
+        t_eval=times,
+        jac_sparsity=sparsity,
+        rtol=rtol,
+        atol=atol,
+    )
+    if not solution.success:
+        logger.warning(f"Breakthrough integration stopped early: {solution.message}")
+
+    states = solution.y.T
+    pressure = states[:, :size].reshape(-1, n_cells, n_components)
+    loading = states[:, size:].reshape(-1, n_cells, n_components)
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        relative = pressure[:, -1] / feed
+
+    return {
+        "time": solution.t,
+        "outlet_partial_pressure": pressure[:, -1],
+        "outlet_relative": relative,
+        "position": (numpy.arange(n_cells) + 0.5) * dz,
+        "partial_pressure": pressure,
+        "loading": loading,
+        "table": table,
+        "success": solution.success,
+        "message": solution.message,
+    }
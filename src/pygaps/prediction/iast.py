@@ -10,10 +10,14 @@ from pygaps.core.modelisotherm import ModelIsotherm
 from pygaps.graphing.iast_graphs import plot_iast_svp
 from pygaps.graphing.iast_graphs import plot_iast_vle
 from pygaps.modelling import is_model_iast
+from pygaps.prediction.iast_cache import IASTCache
 from pygaps.utilities.exceptions import CalculationError
 from pygaps.utilities.exceptions import ParameterError
 
-# TODO add _raw functions to ensure that sanity checks only happen once
+_EPS = numpy.finfo(float).eps
+_TINY = numpy.finfo(float).tiny
+
+_IAST_METHODS = ("mole_fractions", "fastiast")
 
 
 def iast_binary_vle(
@@ -73,6 +77,10 @@ def iast_binary_vle(
         raise ParameterError(
             "The binary equilibrium calculation can only take two components as parameters."
         )
+    for isotherm in isotherms:
+        if isinstance(isotherm, ModelIsotherm):
+            if not is_model_iast(isotherm.model.name):
+                raise ParameterError(f"Model {isotherm.model.name} cannot be used with IAST.")
     if any(iso.pressure_mode.startswith("relative") for iso in isotherms):
         raise ParameterError("IAST only runs with isotherms on an absolute pressure basis.")
 
@@ -80,21 +88,18 @@ def iast_binary_vle(
     y_data = numpy.linspace(0.01, 0.99, npoints)
     binary_fractions = numpy.array((y_data, 1 - y_data)).transpose()
 
-    # Generate the array of loadings
-    component_loadings = numpy.zeros((npoints, 2))
-
-    # Run IAST
-    for index, fraction in enumerate(binary_fractions):
-        component_loadings[index, :] = iast_point_fraction(
-            isotherms,
-            fraction,
-            total_pressure,
-            branch=branch,
-            warningoff=warningoff,
-            adsorbed_mole_fraction_guess=adsorbed_mole_fraction_guess
-        )
+    # Run IAST on all compositions at once
+    if adsorbed_mole_fraction_guess is not None:
+        adsorbed_mole_fraction_guess = numpy.asarray(adsorbed_mole_fraction_guess)[0]
+    result = iast_binary_raw(
+        isotherms,
+        binary_fractions * total_pressure,
+        branch=branch,
+        adsorbed_mole_fraction_guess=adsorbed_mole_fraction_guess,
+    )
+    _check_binary_result(isotherms, result, branch, warningoff)
 
-    x_data = [x[0] / (x[0] + x[1]) for x in component_loadings]
+    x_data = result["adsorbed_mole_fraction"][:, 0]
 
     # Add start and end points
     x_data = numpy.concatenate([[0], x_data, [1]])
@@ -173,6 +178,10 @@ def iast_binary_svp(
         )
     if sum(mole_fractions) != 1:
         raise ParameterError("Mole fractions do not add up to unity")
+    for isotherm in isotherms:
+        if isinstance(isotherm, ModelIsotherm):
+            if not is_model_iast(isotherm.model.name):
+                raise ParameterError(f"Model {isotherm.model.name} cannot be used with IAST.")
     if any(iso.pressure_mode.startswith("relative") for iso in isotherms):
         raise ParameterError("IAST only runs with isotherms on an absolute pressure basis.")
 
@@ -180,21 +189,20 @@ def iast_binary_svp(
     pressures = numpy.asarray(pressures)
     mole_fractions = numpy.asarray(mole_fractions)
 
-    # Generate the array of partial pressures
-    component_loadings = numpy.zeros((len(pressures), 2))
-
-    for index, pressure in enumerate(pressures):
-        component_loadings[index, :] = iast_point_fraction(
-            isotherms,
-            mole_fractions,
-            pressure,
-            branch=branch,
-            warningoff=warningoff,
-            adsorbed_mole_fraction_guess=adsorbed_mole_fraction_guess
-        )
+    # Run IAST on all pressures at once
+    if adsorbed_mole_fraction_guess is not None:
+        adsorbed_mole_fraction_guess = numpy.asarray(adsorbed_mole_fraction_guess)[0]
+    result = iast_binary_raw(
+        isotherms,
+        numpy.outer(pressures, mole_fractions),
+        branch=branch,
+        adsorbed_mole_fraction_guess=adsorbed_mole_fraction_guess,
+    )
+    _check_binary_result(isotherms, result, branch, warningoff)
 
-    selectivities = [(x[0] / mole_fractions[0]) / (x[1] / mole_fractions[1])
-                     for x in component_loadings]
+    component_loadings = result["loading"]
+    selectivities = (component_loadings[:, 0] / mole_fractions[0]) / \
+        (component_loadings[:, 1] / mole_fractions[1])
 
     if verbose:
         plot_iast_svp(
@@ -213,6 +221,450 @@ def iast_binary_svp(
     }
 
 
+def iast_sweep(
+    isotherms,
+    partial_pressures,
+    branch="ads",
+    warningoff=False,
+    adsorbed_mole_fraction_guess=None,
+    max_refinements=4,
+):
+    """
+    Perform IAST calculations along a path of partial pressures, such as
+    a composition or pressure sweep, for any number of components.
+
+    Each point is solved starting from the adsorbed mole fractions of the
+    previous point. If a point fails, the step from the previous point is
+    divided into 2, 4, 8... smaller steps, up to `max_refinements` times, each
+    started from the solution of the step before. Points which still fail
+    are recorded, and the next point is started from the last solution.
+
+    Parameters
+    ----------
+    isotherms : list of ModelIsotherms or PointIsotherms
+        Pure-component adsorption isotherms.
+        e.g. [methane_isotherm, ethane_isotherm, ...]
+    partial_pressures : array
+        Partial pressures of all components at each point of
+        the sweep, with a shape of (npoints, ncomponents).
+    branch : str
+        which branch of the isotherm to use
+    warningoff: bool, optional
+        When False, logger.warning will print when the IAST
+        calculation result required extrapolation of the pure-component
+        adsorption isotherm beyond the highest pressure in the data.
+    adsorbed_mole_fraction_guess : array or list, optional
+        Starting guesses for adsorbed phase mole fractions at the
+        first point of the sweep.
+    max_refinements : int, optional
+        Maximum number of times the step to a failed point is halved.
+
+    Returns
+    -------
+    dict
+        Dictionary with the results for each point:
+            - `loading` predicted uptakes of each component, shape (npoints, ncomponents)
+            - `adsorbed_mole_fraction` adsorbed mole fractions, shape (npoints, ncomponents)
+            - `converged` whether the solution was found, shape (npoints)
+            - `iterations` number of solver iterations, shape (npoints)
+            - `nfev` number of evaluations of the spreading pressure
+              differences, shape (npoints)
+
+        Values at points which have not converged are NaN.
+
+    """
+    # Parameter checks
+    for isotherm in isotherms:
+        if isinstance(isotherm, ModelIsotherm):
+            if not is_model_iast(isotherm.model.name):
+                raise ParameterError(f"Model {isotherm.model.name} cannot be used with IAST.")
+    if any(iso.pressure_mode.startswith("relative") for iso in isotherms):
+        raise ParameterError("IAST only runs with isotherms on an absolute pressure basis.")
+
+    n_components = len(isotherms)
+    if n_components == 1:
+        raise ParameterError("Pass at least two isotherms.")
+
+    partial_pressures = numpy.atleast_2d(numpy.asarray(partial_pressures, dtype=float))
+    if partial_pressures.shape[1] != n_components:
+        raise ParameterError(
+            "Number of partial pressures != number of isotherms. Example use:\n"
+            "iast_sweep([iso1, iso2], [[p1, p2], [p1, p2], ...])"
+        )
+    npoints = len(partial_pressures)
+
+    loadings = numpy.full((npoints, n_components), numpy.nan)
+    adsorbed_mole_fractions = numpy.full((npoints, n_components), numpy.nan)
+    converged = numpy.zeros(npoints, dtype=bool)
+    iterations = numpy.zeros(npoints, dtype=int)
+    nfev = numpy.zeros(npoints, dtype=int)
+
+    ranges = [_pressure_range(isotherm, branch) for isotherm in isotherms]
+
+    # last two solutions on the path, as (partial pressures, mole fractions)
+    solved = []
+    for index, pressures in enumerate(partial_pressures):
+        guess = _sweep_guess(solved, pressures) if solved else adsorbed_mole_fraction_guess
+        res = _iast_point_solve(isotherms, pressures, branch, guess, ranges)
+        iterations[index] += res.nit
+        nfev[index] += res.nfev
+
+        # Fall back to the default guess
+        if not _iast_valid(res) and guess is not None:
+            res = _iast_point_solve(isotherms, pressures, branch, ranges=ranges)
+            iterations[index] += res.nit
+            nfev[index] += res.nfev
+
+        # Approach the point in smaller steps from the last solution
+        refinement = 0
+        while not _iast_valid(res) and solved and refinement < max_refinements:
+            refinement += 1
+            steps = 2**refinement
+            previous, step_guess = solved[-1]
+            for fraction in numpy.arange(1, steps + 1) / steps:
+                res = _iast_point_solve(
+                    isotherms,
+                    previous + fraction * (pressures - previous),
+                    branch,
+                    step_guess,
+                    ranges,
+                )
+                iterations[index] += res.nit
+                nfev[index] += res.nfev
+                if not _iast_valid(res):
+                    break
+                step_guess = res.x
+
+        if not _iast_valid(res):
+            continue
+
+        converged[index] = True
+        adsorbed_mole_fractions[index] = res.x
+        loadings[index] = _iast_loadings(isotherms, res.x, pressures / res.x)
+        solved = solved[-1:] + [(pressures, res.x)]
+
+    if not warningoff:
+        _warn_extrapolation(isotherms, partial_pressures / adsorbed_mole_fractions, branch)
+
+    return {
+        "loading": loadings,
+        "adsorbed_mole_fraction": adsorbed_mole_fractions,
+        "converged": converged,
+        "iterations": iterations,
+        "nfev": nfev,
+    }
+
+
+def _sweep_guess(solved, pressures):
+    """
+    Adsorbed mole fraction guess at the next point of a sweep, extrapolated
+    linearly from the last two solutions, or equal to the last solution.
+    """
+    guess = solved[-1][1]
+    if len(solved) == 2:
+        (pressures_0, guess_0), (pressures_1, guess_1) = solved
+        step = numpy.linalg.norm(pressures_1 - pressures_0)
+        if step > 0:
+            ratio = numpy.linalg.norm(pressures - pressures_1) / step
+            guess = guess_1 + ratio * (guess_1 - guess_0)
+            # keep the guess strictly within (0, 1)
+            guess = numpy.clip(guess, 0.1 * guess_1, 1)
+            guess = guess / numpy.sum(guess)
+    return guess
+
+
+def _iast_valid(res):
+    """Whether an IAST solution has converged to physical mole fractions."""
+    return res.success and numpy.all((res.x >= 0.0) & (res.x <= 1.0))
+
+
+def iast_binary_raw(
+    isotherms,
+    partial_pressures,
+    branch="ads",
+    adsorbed_mole_fraction_guess=None,
+    xtol=1e-10,
+    ftol=1e-12,
+    maxiter=100,
+):
+    r"""
+    Solve binary IAST for many sets of partial pressures at once.
+
+    For two components, IAST reduces to a single equation in the adsorbed
+    mole fraction of the first component, :math:`x`:
+
+    .. math::
+
+        f(x) = \Pi_1 \left( \frac{p_1}{x} \right) - \Pi_2 \left( \frac{p_2}{1 - x} \right) = 0
+
+    The residual decreases monotonically with :math:`x`, and since
+    :math:`d\Pi / dp^0 = n(p^0) / p^0`, its derivative is given by the
+    pure-component loadings at the fictitious pressures:
+
+    .. math::
+
+        \frac{df}{dx} = - \frac{n_1(p^0_1)}{x} - \frac{n_2(p^0_2)}{1 - x}
+
+    All points are solved together with Newton steps, which fall back to
+    bisection whenever they leave the bracket on :math:`x`. Each iteration
+    therefore requires a single call to the spreading pressure and loading of
+    each isotherm. For PointIsotherms, the bracket is limited so that the
+    fictitious pressures remain within the isotherm data.
+
+    No checks are performed on the isotherms passed: use
+    ``iast_binary_vle`` or ``iast_binary_svp`` for a checked calculation.
+
+    Parameters
+    ----------
+    isotherms : list of ModelIsotherms or PointIsotherms
+        The two pure-component isotherms.
+    partial_pressures : array
+        Partial pressures of the two components, with a shape
+        of (npoints, 2).
+    branch : str
+        which branch of the isotherm to use
+    adsorbed_mole_fraction_guess : float or array, optional
+        Starting guesses for the adsorbed mole fraction of the first
+        component, for all or for each point.
+    xtol : float, optional
+        Relative tolerance on the adsorbed mole fractions.
+    ftol : float, optional
+        Relative tolerance on the spreading pressure difference.
+    maxiter : int, optional
+        Maximum number of iterations.
+
+    Returns
+    -------
+    dict
+        Dictionary with the results for each point:
+            - `loading` predicted uptakes of each component, shape (npoints, 2)
+            - `adsorbed_mole_fraction` adsorbed mole fractions, shape (npoints, 2)
+            - `pressure0` fictitious pressures of each component, shape (npoints, 2)
+            - `converged` whether the solution was found, shape (npoints)
+            - `iterations` number of Newton iterations, shape (npoints)
+            - `nfev` number of evaluations of the spreading pressure
+              difference, shape (npoints)
+
+        Values at points which have not converged are NaN.
+
+    """
+    partial_pressures = numpy.atleast_2d(numpy.asarray(partial_pressures, dtype=float))
+    npoints = len(partial_pressures)
+    p_1, p_2 = partial_pressures.T
+
+    x = numpy.full(npoints, numpy.nan)
+    converged = numpy.zeros(npoints, dtype=bool)
+    iterations = numpy.zeros(npoints, dtype=int)
+    nfev = numpy.zeros(npoints, dtype=int)
+
+    # A single component is trivially solved
+    x[p_1 == 0] = 0
+    x[p_2 == 0] = 1
+    converged[(p_1 == 0) | (p_2 == 0)] = True
+    active = ~converged & (p_1 > 0) & (p_2 > 0)
+
+    # Bracket on the adsorbed mole fraction, within the data range
+    # of PointIsotherms, outside which the residual changes sign
+    ranges = [_pressure_range(isotherm, branch) for isotherm in isotherms]
+    a = p_1 / ranges[0][1]
+    b = 1 - p_2 / ranges[1][1]
+    active &= a < b
+
+    with numpy.errstate(all='ignore'):
+        for bound, sign in ((a, -1), (b, 1)):
+            idx = numpy.flatnonzero(active & (bound > 0) & (bound < 1))
+            if idx.size:
+                f_bound, _, _ = _binary_residual(
+                    isotherms, ranges, partial_pressures[idx], bound[idx], branch
+                )
+                nfev[idx] += 1
+                active[idx[sign * f_bound > 0]] = False
+
+        # Initial estimate, from the pure-component loadings if not given
+        if adsorbed_mole_fraction_guess is None:
+            idx = numpy.flatnonzero(active)
+            n_1 = _loading(isotherms[0], ranges[0], p_1[idx], branch)
+            n_2 = _loading(isotherms[1], ranges[1], p_2[idx], branch)
+            start = numpy.full(npoints, numpy.nan)
+            start[idx] = n_1 / (n_1 + n_2)
+        else:
+            start = numpy.broadcast_to(
+                numpy.asarray(adsorbed_mole_fraction_guess, dtype=float), (npoints, )
+            )
+        x_i = numpy.where((start > a) & (start < b), start, 0.5 * (a + b))
+
+        for _ in range(maxiter):
+            idx = numpy.flatnonzero(active)
+            if not idx.size:
+                break
+            xi = x_i[idx]
+            fi, pi_scale, dfi = _binary_residual(
+                isotherms, ranges, partial_pressures[idx], xi, branch
+            )
+            iterations[idx] += 1
+            nfev[idx] += 1
+
+            # solution found
+            done_f = numpy.abs(fi) <= ftol * pi_scale
+
+            # narrow the bracket, the residual decreases with x
+            pos = fi > 0
+            a[idx[pos]] = xi[pos]
+            b[idx[~pos]] = xi[~pos]
+            ai, bi = a[idx], b[idx]
+
+            # Newton step, or bisection if outside the bracket
+            x_new = xi - fi / dfi
+            bisect = ~numpy.isfinite(x_new) | (x_new <= ai) | (x_new >= bi)
+            x_new = numpy.where(bisect, 0.5 * (ai + bi), x_new)
+
+            # the step or the bracket are below tolerance
+            scale = xtol * numpy.maximum(numpy.minimum(x_new, 1 - x_new), _TINY)
+            done_x = (~bisect & (numpy.abs(x_new - xi) <= scale)) | ((bi - ai) <= scale)
+
+            x_i[idx] = numpy.where(done_f, xi, x_new)
+            done = idx[done_f | done_x]
+            x[done] = x_i[done]
+            converged[done] = True
+            active[done] = False
+
+        result = _binary_loadings(isotherms, ranges, partial_pressures, x, branch, converged)
+
+    result["iterations"] = iterations
+    result["nfev"] = nfev
+    return result
+
+
+def _pressure_range(isotherm, branch):
+    """
+    Range of pressures over which the isotherm can be evaluated, which
+    is limited to the data for PointIsotherms.
+    """
+    if isinstance(isotherm, ModelIsotherm):
+        return 0, numpy.inf
+    pressures, _, _ = _point_table(isotherm, branch)
+    return pressures[0], pressures[-1]
+
+
+def _point_table(isotherm, branch):
+    """
+    The sorted data of a PointIsotherm branch, stored together with its
+    spreading pressure integral, in the units used by spreading_pressure_at.
+    """
+    return isotherm._spreading_pressure_table(
+        branch=branch,
+        pressure_unit=None,
+        pressure_mode=None,
+        loading_unit=None,
+        loading_basis=None,
+        material_unit=None,
+        material_basis=None,
+    )
+
+
+def _spreading_pressure(isotherm, p_range, pressure, branch):
+    """Spreading pressure of an isotherm, within its pressure range."""
+    return isotherm.spreading_pressure_at(numpy.minimum(pressure, p_range[1]), branch=branch)
+
+
+def _loading(isotherm, p_range, pressure, branch):
+    """
+    Loading of an isotherm, within its pressure range. Below the first
+    point of PointIsotherms, Henry's law is assumed, as in the spreading
+    pressure integral.
+    """
+    if isinstance(isotherm, ModelIsotherm):
+        return isotherm.loading_at(pressure, branch=branch)
+    p_min, p_max = p_range
+    loading = isotherm.loading_at(numpy.clip(pressure, p_min, p_max), branch=branch)
+    return loading * numpy.minimum(pressure / p_min, 1)
+
+
+def _binary_residual(isotherms, ranges, partial_pressures, x, branch):
+    """
+    Binary IAST spreading pressure difference at adsorbed mole fractions `x`,
+    together with its scale and derivative.
+    """
+    pressure0_1 = partial_pressures[:, 0] / x
+    pressure0_2 = partial_pressures[:, 1] / (1 - x)
+    pi_1 = _spreading_pressure(isotherms[0], ranges[0], pressure0_1, branch)
+    pi_2 = _spreading_pressure(isotherms[1], ranges[1], pressure0_2, branch)
+    n_1 = _loading(isotherms[0], ranges[0], pressure0_1, branch)
+    n_2 = _loading(isotherms[1], ranges[1], pressure0_2, branch)
+    return pi_1 - pi_2, numpy.maximum(pi_1, pi_2), -n_1 / x - n_2 / (1 - x)
+
+
+def _binary_loadings(isotherms, ranges, partial_pressures, x, branch, converged):
+    """Assemble the binary IAST result at adsorbed mole fractions `x`."""
+    adsorbed_mole_fractions = numpy.stack((x, 1 - x), axis=1)
+    with numpy.errstate(all='ignore'):
+        pressure0 = partial_pressures / adsorbed_mole_fractions
+        pressure0[adsorbed_mole_fractions == 0] = 0
+
+        # total loading, from the pure-component loadings at p0
+        inverse_loading = numpy.zeros(len(x))
+        for i, isotherm in enumerate(isotherms):
+            frac = adsorbed_mole_fractions[:, i]
+            present = converged & (frac > 0)
+            inverse_loading[present] += frac[present] / \
+                _loading(isotherm, ranges[i], pressure0[present, i], branch)
+        loadings = adsorbed_mole_fractions / inverse_loading[:, None]
+
+    loadings[~converged] = numpy.nan
+    adsorbed_mole_fractions[~converged] = numpy.nan
+    pressure0[~converged] = numpy.nan
+
+    return {
+        "loading": loadings,
+        "adsorbed_mole_fraction": adsorbed_mole_fractions,
+        "pressure0": pressure0,
+        "converged": converged,
+    }
+
+
+def _check_binary_result(isotherms, result, branch, warningoff):
+    """Raise if any binary IAST point has failed, and warn on extrapolation."""
+    if not numpy.all(result["converged"]):
+        failed = numpy.count_nonzero(~result["converged"])
+        raise CalculationError(
+            textwrap.dedent(
+                f"""
+                Root finding for adsorbed phase mole fractions failed at
+                {failed} point(s). If using PointIsotherms, this is likely
+                because the solution would require extrapolating the
+                pure-component isotherm data: fit a model isotherm instead."""
+            )
+        )
+
+    if not warningoff:
+        _warn_extrapolation(isotherms, result["pressure0"], branch)
+
+
+def _warn_extrapolation(isotherms, pressure0, branch):
+    """
+    Warn if the fictitious pressures of any component are above the highest
+    pressure in its data, so that the model had to be extrapolated.
+    PointIsotherms are never extrapolated.
+    """
+    pressure0 = numpy.atleast_2d(pressure0)
+    for i, isotherm in enumerate(isotherms):
+        if not isinstance(isotherm, ModelIsotherm):
+            continue
+        p_max = isotherm.pressure(branch=branch).max()
+        p0_max = numpy.nanmax(pressure0[:, i], initial=0)
+        if p0_max > p_max:
+            logger.warning(
+                textwrap.dedent(
+                    f"""
+                    WARNING:
+                    Component {i:d}: p0 = {p0_max:.4g} > {p_max:.4g}
+                    the highest pressure exhibited in the pure-component
+                    isotherm data. Thus, pyGAPS had to extrapolate the
+                    isotherm data to achieve this IAST result."""
+                )
+            )
+
+
 def iast_point_fraction(
     isotherms,
     gas_mole_fraction,
@@ -220,7 +672,9 @@ def iast_point_fraction(
     branch="ads",
     verbose=False,
     warningoff=False,
-    adsorbed_mole_fraction_guess=None
+    adsorbed_mole_fraction_guess=None,
+    method="mole_fractions",
+    cache: IASTCache = None,
 ):
     """
     Perform IAST calculation to predict multi-component adsorption isotherm from
@@ -253,6 +707,15 @@ def iast_point_fraction(
     adsorbed_mole_fraction_guess : array or list, optional
         Starting guesses for adsorbed phase mole fractions that
         `iast` solves for.
+    method : {'mole_fractions', 'fastiast'}, optional
+        The solver used. The default solves for the adsorbed mole fractions,
+        while `fastiast` solves for the common spreading pressure of all
+        components, which is faster for many components
+        (see :func:`iast_fast_raw`).
+    cache : IASTCache, optional
+        A cache of results to reuse, and to which new results are added.
+        Cached results are returned without any warnings, and the
+        cache is not used with `verbose`.
 
     Returns
     -------
@@ -268,7 +731,9 @@ def iast_point_fraction(
         branch=branch,
         verbose=verbose,
         warningoff=warningoff,
-        adsorbed_mole_fraction_guess=adsorbed_mole_fraction_guess
+        adsorbed_mole_fraction_guess=adsorbed_mole_fraction_guess,
+        method=method,
+        cache=cache,
     )
 
 
@@ -278,7 +743,9 @@ def iast_point(
     branch="ads",
     verbose=False,
     warningoff=False,
-    adsorbed_mole_fraction_guess=None
+    adsorbed_mole_fraction_guess=None,
+    method="mole_fractions",
+    cache: IASTCache = None,
 ):
     """
     Perform IAST calculation to predict multi-component adsorption isotherm from
@@ -308,6 +775,15 @@ def iast_point(
     adsorbed_mole_fraction_guess : array or list, optional
         Starting guesses for adsorbed phase mole fractions that
         `iast` solves for.
+    method : {'mole_fractions', 'fastiast'}, optional
+        The solver used. The default solves for the adsorbed mole fractions,
+        while `fastiast` solves for the common spreading pressure of all
+        components, which is faster for many components
+        (see :func:`iast_fast_raw`).
+    cache : IASTCache, optional
+        A cache of results to reuse, and to which new results are added.
+        Cached results are returned without any warnings, and the
+        cache is not used with `verbose`.
 
     Returns
     -------
@@ -332,70 +808,32 @@ def iast_point(
             "Number of partial pressures != number of isotherms. Example use:\n"
             "iast_point([iso1, iso2, iso3], [p1,p2,p3], total_p)"
         )
+    if method not in _IAST_METHODS:
+        raise ParameterError(f"IAST method must be one of {_IAST_METHODS}.")
+
+    key = None
+    if cache is not None and cache.enabled and not verbose:
+        key = cache.key(isotherms, partial_pressures, branch)
+        loadings = cache.get(key)
+        if loadings is not None:
+            return loadings
 
     if verbose:
         logger.info(f"{n_components:d} components.")
         for i in range(n_components):
             logger.info(f"\tPartial pressure component {i:d} = {partial_pressures[i]:.4g}")
 
-    # Assert that the spreading pressures of each component are equal
-    def spreading_pressure_differences(adsorbed_mole_fractions):
-        """
-        Assert that spreading pressures of each component at fictitious pressure
-        are equal.
-
-        Parameters
-        ----------
-        adsorbed_mole_fractions : array
-            Mole fractions in the adsorbed phase;
-            numpy.size(adsorbed_mole_fractions) = n_components - 1
-            because sum z_i = 1 asserted here automatically.
-
-        Returns
-        -------
-        array
-            Spreading pressure difference between component i and i+1.
-        """
-        spreading_pressure_diff = numpy.zeros((n_components - 1, ))
-        for i in range(n_components - 1):
-            if i == n_components - 2:
-                # automatically assert \sum z_i = 1
-                ads_mole_frac2 = 1.0 - numpy.sum(adsorbed_mole_fractions)
-            else:
-                ads_mole_frac2 = adsorbed_mole_fractions[i + 1]
-
-            sp1 = isotherms[i].spreading_pressure_at(
-                partial_pressures[i] / adsorbed_mole_fractions[i],
-                branch=branch,
-            )
-            sp2 = isotherms[i + 1].spreading_pressure_at(
-                partial_pressures[i + 1] / ads_mole_frac2,
-                branch=branch,
-            )
-            spreading_pressure_diff[i] = sp1 - sp2
-
-        return spreading_pressure_diff
-
     ###
     #   Solve for mole fractions in adsorbed phase by equating spreading
     #   pressures.
     ####
-    if adsorbed_mole_fraction_guess is None:
-        # Default guess: pure-component loadings at these partial pressures.
-        loading_guess = numpy.asarray([
-            isotherms[i].loading_at(partial_pressures[i]) for i in range(n_components)
-        ])
-        adsorbed_mole_fraction_guess = loading_guess / numpy.sum(loading_guess)
-    else:
+    if adsorbed_mole_fraction_guess is not None:
         numpy.testing.assert_almost_equal(1.0, numpy.sum(adsorbed_mole_fraction_guess), decimal=4)
-        # if list, convert to numpy array
-        adsorbed_mole_fraction_guess = numpy.asarray(adsorbed_mole_fraction_guess)
 
-    res = optimize.root(
-        spreading_pressure_differences,
-        adsorbed_mole_fraction_guess[:-1],
-        method='lm',
-    )
+    if method == "fastiast":
+        res = _iast_point_fast(isotherms, partial_pressures, branch, adsorbed_mole_fraction_guess)
+    else:
+        res = _iast_point_solve(isotherms, partial_pressures, branch, adsorbed_mole_fraction_guess)
 
     if not res.success:
         raise CalculationError(
@@ -412,11 +850,6 @@ def iast_point(
 
     adsorbed_mole_fractions = res.x
 
-    # concatenate mole fraction of last component
-    adsorbed_mole_fractions = numpy.concatenate(
-        (adsorbed_mole_fractions, numpy.asarray([1.0 - numpy.sum(adsorbed_mole_fractions)]))
-    )
-
     if numpy.any((adsorbed_mole_fractions < 0.0) | (adsorbed_mole_fractions > 1.0)):
         raise CalculationError(
             textwrap.dedent(
@@ -429,15 +862,8 @@ def iast_point(
         )
 
     pressure0 = partial_pressures / adsorbed_mole_fractions
+    loadings = _iast_loadings(isotherms, adsorbed_mole_fractions, pressure0)
 
-    # solve for the total gas adsorbed
-    inverse_loading = 0.0
-    for i in range(n_components):
-        inverse_loading += adsorbed_mole_fractions[i] / isotherms[i].loading_at(pressure0[i])
-    loading_total = 1.0 / inverse_loading
-
-    # get loading of each component by multiplying by mole fractions
-    loadings = adsorbed_mole_fractions * loading_total
     if verbose:
         # print IAST loadings and corresponding pure-component loadings
         for i in range(n_components):
@@ -452,24 +878,426 @@ def iast_point(
 
     # print warning if had to extrapolate isotherm in spreading pressure
     if not warningoff:
-        for i in range(n_components):
-            if pressure0[i] > isotherms[i].pressure(branch=branch).max():
-                logger.warning(
-                    textwrap.dedent(
-                        f"""
-                        WARNING:
-                        Component {i:d}: p0 = {pressure0[i]:.4g} > \
-                            {isotherms[i].pressure(branch=branch).max():.4g}
-                        the highest pressure exhibited in the pure-component
-                        isotherm data. Thus, pyGAPS had to extrapolate the
-                        isotherm data to achieve this IAST result."""
-                    )
-                )
+        _warn_extrapolation(isotherms, pressure0, branch)
+
+    if key is not None:
+        cache.set(key, loadings)
 
     # return loadings [component 1, component 2, ...]. same units as in data
     return loadings
 
 
+def _iast_point_solve(
+    isotherms,
+    partial_pressures,
+    branch,
+    adsorbed_mole_fraction_guess=None,
+    ranges=None,
+):
+    """
+    Solve for the adsorbed mole fractions at one set of partial pressures,
+    without any checks.
+
+    Returns the scipy result, with the mole fractions of all components as
+    `x`, the number of solver iterations as `nit` and the number of
+    spreading pressure difference evaluations as `nfev`. Failures to
+    evaluate the isotherms are returned as unsuccessful.
+    """
+    n_components = len(isotherms)
+    partial_pressures = numpy.asarray(partial_pressures, dtype=float)
+    if ranges is None:
+        ranges = [_pressure_range(isotherm, branch) for isotherm in isotherms]
+    counts = {"nfev": 0, "nit": 0}
+
+    def mole_fractions(adsorbed_mole_fractions):
+        # automatically assert \sum z_i = 1
+        return numpy.append(adsorbed_mole_fractions, 1.0 - numpy.sum(adsorbed_mole_fractions))
+
+    # Assert that the spreading pressures of each component are equal
+    def spreading_pressure_differences(adsorbed_mole_fractions):
+        """
+        Assert that spreading pressures of each component at fictitious pressure
+        are equal.
+
+        Parameters
+        ----------
+        adsorbed_mole_fractions : array
+            Mole fractions in the adsorbed phase;
+            numpy.size(adsorbed_mole_fractions) = n_components - 1
+            because sum z_i = 1 asserted here automatically.
+
+        Returns
+        -------
+        array
+            Spreading pressure difference between component i and i+1.
+        """
+        counts["nfev"] += 1
+        pressure0 = partial_pressures / mole_fractions(adsorbed_mole_fractions)
+        spreading_pressures = numpy.array([
+            isotherm.spreading_pressure_at(pressure0[i], branch=branch)
+            for i, isotherm in enumerate(isotherms)
+        ])
+        return spreading_pressures[:-1] - spreading_pressures[1:]
+
+    def spreading_pressure_jacobian(adsorbed_mole_fractions):
+        """
+        Derivatives of the spreading pressure differences. As
+        d(Pi)/d(p0) = n(p0) / p0, the derivative of the spreading pressure
+        of component i with its mole fraction is -n_i(p0_i) / z_i, while
+        that of the last component with all mole fractions is n_n(p0_n) / z_n.
+        """
+        counts["nit"] += 1
+        fractions = mole_fractions(adsorbed_mole_fractions)
+        pressure0 = partial_pressures / fractions
+        derivatives = numpy.array([
+            _loading(isotherm, ranges[i], pressure0[i], branch) / fractions[i]
+            for i, isotherm in enumerate(isotherms)
+        ])
+        jacobian = numpy.diag(-derivatives[:-1])
+        jacobian[:-1, 1:] += numpy.diag(derivatives[1:-1])
+        jacobian[-1, :] -= derivatives[-1]
+        return jacobian
+
+    try:
+        if adsorbed_mole_fraction_guess is None:
+            # Default guess: pure-component loadings at these partial pressures.
+            loading_guess = numpy.asarray([
+                isotherms[i].loading_at(partial_pressures[i]) for i in range(n_components)
+            ])
+            adsorbed_mole_fraction_guess = loading_guess / numpy.sum(loading_guess)
+        else:
+            # if list, convert to numpy array
+            adsorbed_mole_fraction_guess = numpy.asarray(adsorbed_mole_fraction_guess)
+
+        res = optimize.root(
+            spreading_pressure_differences,
+            adsorbed_mole_fraction_guess[:-1],
+            jac=spreading_pressure_jacobian,
+            method='lm',
+        )
+    except (CalculationError, ValueError) as err:
+        # the isotherm cannot be evaluated, e.g. outside PointIsotherm data
+        res = optimize.OptimizeResult(
+            x=numpy.full(n_components - 1, numpy.nan),
+            success=False,
+            message=str(err),
+        )
+
+    res.x = mole_fractions(res.x)
+    res.nfev = counts["nfev"]
+    res.nit = counts["nit"]
+    return res
+
+
+def _iast_point_fast(isotherms, partial_pressures, branch, adsorbed_mole_fraction_guess=None):
+    """
+    Solve for the adsorbed mole fractions at one set of partial pressures
+    with ``iast_fast_raw``, returning a result like ``_iast_point_solve``.
+    """
+    result = iast_fast_raw(
+        isotherms,
+        [partial_pressures],
+        branch=branch,
+        adsorbed_mole_fraction_guess=adsorbed_mole_fraction_guess,
+    )
+    success = bool(result["converged"][0])
+    return optimize.OptimizeResult(
+        x=result["adsorbed_mole_fraction"][0],
+        success=success,
+        message="" if success else "No common spreading pressure found within the isotherm data.",
+        nit=result["iterations"][0],
+        nfev=result["nfev"][0],
+    )
+
+
+def _iast_loadings(isotherms, adsorbed_mole_fractions, pressure0):
+    """Component loadings from the adsorbed mole fractions and fictitious pressures."""
+    # solve for the total gas adsorbed
+    inverse_loading = 0.0
+    for i, isotherm in enumerate(isotherms):
+        inverse_loading += adsorbed_mole_fractions[i] / isotherm.loading_at(pressure0[i])
+    loading_total = 1.0 / inverse_loading
+
+    # get loading of each component by multiplying by mole fractions
+    return adsorbed_mole_fractions * loading_total
+
+
+def iast_fast_raw(
+    isotherms,
+    partial_pressures,
+    branch="ads",
+    adsorbed_mole_fraction_guess=None,
+    rtol=1e-10,
+    ftol=1e-12,
+    maxiter=100,
+):
+    r"""
+    Solve IAST for many sets of partial pressures at once, in terms
+    of the reduced spreading pressure common to all components.
+
+    Instead of solving for the adsorbed mole fractions, this solver
+    (as in FastIAST [#]_) finds the spreading pressure :math:`\Pi` for which
+    the adsorbed mole fractions add up to one:
+
+    .. math::
+
+        g(\Pi) = \sum_i \frac{p_i}{p^0_i(\Pi)} - 1 = 0
+
+    where :math:`p^0_i(\Pi)` is the inverse of the spreading pressure of
+    each component. This is a single, monotonically decreasing equation for
+    any number of components, with a derivative given by the loadings:
+
+    .. math::
+
+        \frac{dg}{d\Pi} = - \sum_i \frac{x_i}{n_i(p^0_i)}
+
+    The root is bracketed by the pure-component spreading pressures at the
+    total pressure, and all points are solved together with Newton steps,
+    falling back to bisection outside the bracket. The inverse of the
+    spreading pressure is analytical for several models (e.g. Henry,
+    Langmuir, Quadratic), and otherwise computed element-wise by the model.
+    For PointIsotherms, the tabulated integral of the data is inverted.
+
+    No checks are performed on the isotherms passed.
+
+    Parameters
+    ----------
+    isotherms : list of ModelIsotherms or PointIsotherms
+        Pure-component adsorption isotherms.
+    partial_pressures : array
+        Partial pressures of all components, with a shape
+        of (npoints, ncomponents).
+    branch : str
+        which branch of the isotherm to use
+    adsorbed_mole_fraction_guess : array, optional
+        Starting guesses for adsorbed phase mole fractions, for
+        all or for each point.
+    rtol : float, optional
+        Relative tolerance on the spreading pressure.
+    ftol : float, optional
+        Tolerance on the sum of the adsorbed mole fractions.
+    maxiter : int, optional
+        Maximum number of iterations.
+
+    Returns
+    -------
+    dict
+        Dictionary with the results for each point:
+            - `loading` predicted uptakes of each component, shape (npoints, ncomponents)
+            - `adsorbed_mole_fraction` adsorbed mole fractions, shape (npoints, ncomponents)
+            - `pressure0` fictitious pressures of each component, shape (npoints, ncomponents)
+            - `spreading_pressure` the reduced spreading pressure, shape (npoints)
+            - `converged` whether the solution was found, shape (npoints)
+            - `iterations` number of Newton iterations, shape (npoints)
+            - `nfev` number of inversions of the spreading pressures, shape (npoints)
+
+        Values at points which have not converged are NaN.
+
+    References
+    ----------
+    .. [#] S. Lee, J. H. Lee, J. Kim. User-friendly graphical user interface
+       software for ideal adsorbed solution theory calculations. Korean J.
+       Chem. Eng. 35, 214-221 (2018).
+
+    """
+    partial_pressures = numpy.atleast_2d(numpy.asarray(partial_pressures, dtype=float))
+    npoints, n_components = partial_pressures.shape
+    tables = [_point_table(iso, branch) if not isinstance(iso, ModelIsotherm) else None for iso in isotherms]
+    ranges = [_pressure_range(isotherm, branch) for isotherm in isotherms]
+    present = partial_pressures > 0
+    total_pressure = numpy.sum(partial_pressures, axis=1)
+
+    nfev = numpy.zeros(npoints, dtype=int)
+
+    def residual(idx, sp):
+        """Sum of adsorbed mole fractions minus one, and its derivative."""
+        nfev[idx] += 1
+        fractions = numpy.zeros((idx.size, n_components))
+        slope = numpy.zeros(idx.size)
+        for i, isotherm in enumerate(isotherms):
+            rows = present[idx, i]
+            pressure0 = _spreading_pressure_inverse(isotherm, tables[i], sp[rows])
+            fractions[rows, i] = partial_pressures[idx[rows], i] / pressure0
+            slope[rows] -= fractions[rows, i] / _loading(isotherm, ranges[i], pressure0, branch)
+        return numpy.sum(fractions, axis=1) - 1, slope
+
+    with numpy.errstate(all='ignore'):
+        # Bracket from the spreading pressures at the total pressure,
+        # limited to where PointIsotherms can be inverted
+        pure = numpy.full((npoints, n_components), numpy.nan)
+        upper = numpy.full(npoints, numpy.inf)
+        for i, isotherm in enumerate(isotherms):
+            rows = present[:, i]
+            pure[rows, i] = _spreading_pressure(isotherm, ranges[i], total_pressure[rows], branch)
+            if tables[i] is not None:
+                upper[rows] = numpy.minimum(upper[rows], tables[i][2][-1])
+        a = numpy.nanmin(pure, axis=1)
+        b = numpy.minimum(numpy.nanmax(pure, axis=1), upper)
+
+        # Initial estimate, from the mole fraction guess if given
+        if adsorbed_mole_fraction_guess is None:
+            start = numpy.sum(pure * partial_pressures, axis=1, where=present) / total_pressure
+        else:
+            guess = numpy.broadcast_to(
+                numpy.asarray(adsorbed_mole_fraction_guess, dtype=float),
+                (npoints, n_components),
+            )
+            start = numpy.zeros(npoints)
+            for i, isotherm in enumerate(isotherms):
+                rows = present[:, i]
+                start[rows] += guess[rows, i] * _spreading_pressure(
+                    isotherm, ranges[i], partial_pressures[rows, i] / guess[rows, i], branch
+                )
+
+        spreading_pressure, converged, iterations = _solve_spreading_pressure(
+            residual,
+            a,
+            b,
+            b == upper,
+            start,
+            numpy.any(present, axis=1),
+            rtol,
+            ftol,
+            maxiter,
+        )
+
+        # Mole fractions and loadings at the solution
+        adsorbed_mole_fractions = numpy.full((npoints, n_components), numpy.nan)
+        pressure0 = numpy.full((npoints, n_components), numpy.nan)
+        inverse_loading = numpy.zeros(npoints)
+        for i, isotherm in enumerate(isotherms):
+            rows = converged & present[:, i]
+            pressure0[rows, i] = _spreading_pressure_inverse(
+                isotherm, tables[i], spreading_pressure[rows]
+            )
+            adsorbed_mole_fractions[converged, i] = 0
+            adsorbed_mole_fractions[rows, i] = partial_pressures[rows, i] / pressure0[rows, i]
+            inverse_loading[rows] += adsorbed_mole_fractions[rows, i] / \
+                _loading(isotherm, ranges[i], pressure0[rows, i], branch)
+        # enforce the sum of mole fractions to within the tolerance
+        adsorbed_mole_fractions /= numpy.sum(adsorbed_mole_fractions, axis=1, keepdims=True)
+        loadings = adsorbed_mole_fractions / inverse_loading[:, None]
+
+    return {
+        "loading": loadings,
+        "adsorbed_mole_fraction": adsorbed_mole_fractions,
+        "pressure0": pressure0,
+        "spreading_pressure": spreading_pressure,
+        "converged": converged,
+        "iterations": iterations,
+        "nfev": nfev,
+    }
+
+
+def _solve_spreading_pressure(residual, a, b, limited, start, active, rtol, ftol, maxiter):
+    """
+    Find the root of a residual decreasing with the spreading pressure, at all
+    points with Newton steps, falling back to bisection outside the bracket
+    [a, b]. Points where the upper end of the bracket is a limit of the
+    isotherms, rather than a bound on the root, are only solved if the
+    residual there is negative. The residual takes the indices of the points
+    and their spreading pressures, and returns its value and derivative.
+    """
+    npoints = len(a)
+    spreading_pressure = numpy.full(npoints, numpy.nan)
+    converged = numpy.zeros(npoints, dtype=bool)
+    iterations = numpy.zeros(npoints, dtype=int)
+    active = active & (a <= b)
+
+    with numpy.errstate(all='ignore'):
+        # Points at the upper limit must have a solution below it
+        idx = numpy.flatnonzero(active & limited)
+        if idx.size:
+            f_b, _ = residual(idx, b[idx])
+            active[idx[~(f_b <= 0)]] = False
+
+        sp_i = numpy.where((start > a) & (start < b), start, 0.5 * (a + b))
+
+        for _ in range(maxiter):
+            idx = numpy.flatnonzero(active)
+            if not idx.size:
+                break
+            spi = sp_i[idx]
+            fi, dfi = residual(idx, spi)
+            iterations[idx] += 1
+
+            # solution found
+            done_f = numpy.abs(fi) <= ftol
+
+            # narrow the bracket, the residual decreases with the spreading pressure
+            pos = fi > 0
+            a[idx[pos]] = spi[pos]
+            b[idx[~pos]] = spi[~pos]
+            ai, bi = a[idx], b[idx]
+
+            # Newton step, or bisection if outside the bracket
+            sp_new = spi - fi / dfi
+            bisect = ~numpy.isfinite(sp_new) | (sp_new <= ai) | (sp_new >= bi)
+            sp_new = numpy.where(bisect, 0.5 * (ai + bi), sp_new)
+
+            # the step or the bracket are below tolerance
+            scale = rtol * numpy.maximum(numpy.abs(sp_new), _TINY)
+            done_x = (~bisect & (numpy.abs(sp_new - spi) <= scale)) | ((bi - ai) <= scale)
+
+            sp_i[idx] = numpy.where(done_f, spi, sp_new)
+            done = idx[done_f | done_x]
+            spreading_pressure[done] = sp_i[done]
+            converged[done] = True
+            active[done] = False
+
+    return spreading_pressure, converged, iterations
+
+
+def _spreading_pressure_inverse(isotherm, table, spreading_pressure):
+    """
+    Pressure at which an isotherm has the given spreading pressure, from the
+    model or, for PointIsotherms, by inverting the tabulated integral.
+    """
+    if isinstance(isotherm, ModelIsotherm):
+        return isotherm.model.spreading_pressure_inverse(spreading_pressure)
+    return _invert_point_table(*table, spreading_pressure)
+
+
+def _invert_point_table(pressures, loadings, areas, spreading_pressure, maxiter=50):
+    r"""
+    Invert the spreading pressure integral of a linearly interpolated isotherm.
+
+    Below the first point the isotherm follows Henry's law, which is inverted
+    directly. In each segment between points the integral is
+    :math:`A_k + s_k (p - p_k) + c_k \ln(p / p_k)`, which is inverted with
+    Newton steps started from log-linear interpolation of the table. Spreading
+    pressures above the last point are NaN.
+    """
+    spreading_pressure = numpy.asarray(spreading_pressure, dtype=float)
+    sp = spreading_pressure.ravel()
+    result = sp * pressures[0] / loadings[0]
+
+    inside = sp >= areas[0]
+    result[inside] = numpy.nan
+    index = numpy.flatnonzero(inside & (sp <= areas[-1]))
+    if index.size:
+        sp_in = sp[index]
+        k = numpy.clip(numpy.searchsorted(areas, sp_in, side='right') - 1, 0, len(areas) - 2)
+        p_lo, p_hi = pressures[k], pressures[k + 1]
+        slope = (loadings[k + 1] - loadings[k]) / (p_hi - p_lo)
+        intercept = loadings[k] - slope * p_lo
+
+        with numpy.errstate(all='ignore'):
+            p = p_lo * (p_hi / p_lo)**((sp_in - areas[k]) / (areas[k + 1] - areas[k]))
+            for _ in range(maxiter):
+                f = areas[k] + slope * (p - p_lo) + intercept * numpy.log(p / p_lo) - sp_in
+                p_new = numpy.clip(p - f / (slope + intercept / p), p_lo, p_hi)
+                done = numpy.all(numpy.abs(p_new - p) <= 4 * _EPS * p_new)
+                p = p_new
+                if done:
+                    break
+        result[index] = p
+
+    if not spreading_pressure.shape:
+        return result[0]
+    return result.reshape(spreading_pressure.shape)
+
+
 def reverse_iast(
     isotherms,
     adsorbed_mole_fractions,
@@ -546,56 +1374,14 @@ def reverse_iast(
                 f"\tDesired adsorbed phase mole fraction of component {i:d} = {adsorbed_mole_fractions[i]:.4g}"
             )
 
-    # assert that the spreading pressures of each component are equal
-    def spreading_pressure_differences(gas_mole_fractions):
-        r"""
-        Assert that spreading pressures of each component at fictitious pressure
-        are equal.
-
-        Parameters
-        ----------
-        gas_mole_fractions : array
-            Mole fractions in bulk gas phase
-            numpy.size(y) = n_components - 1 because \sum y_i = 1 asserted here
-            automatically.
-
-        Returns
-        -------
-        array
-            Spreading pressure difference
-            between component i and i+1.
-        """
-        spreading_pressure_diff = numpy.zeros((n_components - 1, ))
-        for i in range(n_components - 1):
-            if i == n_components - 2:
-                # automatically assert \sum y_i = 1
-                gas_mole_fraction_n = 1.0 - numpy.sum(gas_mole_fractions)
-            else:
-                gas_mole_fraction_n = gas_mole_fractions[i + 1]
-
-            sp1 = isotherms[i].spreading_pressure_at(
-                total_pressure * gas_mole_fractions[i] / adsorbed_mole_fractions[i],
-                branch=branch,
-            )
-            sp2 = isotherms[i + 1].spreading_pressure_at(
-                total_pressure * gas_mole_fraction_n / adsorbed_mole_fractions[i + 1],
-                branch=branch
-            )
-            spreading_pressure_diff[i] = sp1 - sp2
-
-        return spreading_pressure_diff
-
     ###
     #  Solve for mole fractions in gas phase by equating spreading pressures
-    if gas_mole_fraction_guess is None:
-        # Default guess: adsorbed mole fraction
-        gas_mole_fraction_guess = adsorbed_mole_fractions
-    else:
+    if gas_mole_fraction_guess is not None:
         numpy.testing.assert_almost_equal(1.0, numpy.sum(gas_mole_fraction_guess), decimal=4)
-        # if list, convert to numpy array
-        gas_mole_fraction_guess = numpy.asarray(gas_mole_fraction_guess)
 
-    res = optimize.root(spreading_pressure_differences, gas_mole_fraction_guess[:-1], method='lm')
+    res = _reverse_iast_solve(
+        isotherms, adsorbed_mole_fractions, total_pressure, branch, gas_mole_fraction_guess
+    )
 
     if not res.success:
         raise CalculationError(
@@ -611,11 +1397,6 @@ def reverse_iast(
 
     gas_mole_fractions = res.x
 
-    # concatenate mole fraction of last component
-    gas_mole_fractions = numpy.concatenate(
-        (gas_mole_fractions, numpy.array([1.0 - numpy.sum(gas_mole_fractions)]))
-    )
-
     if numpy.sum(gas_mole_fractions < 0.0) != 0 or numpy.sum(gas_mole_fractions > 1.0) != 0:
         raise CalculationError(
             textwrap.dedent(
@@ -627,15 +1408,7 @@ def reverse_iast(
         )
 
     pressure0 = total_pressure * gas_mole_fractions / adsorbed_mole_fractions
-
-    # solve for the total gas adsorbed
-    inverse_loading = 0.0
-    for i in range(n_components):
-        inverse_loading += adsorbed_mole_fractions[i] / isotherms[i].loading_at(pressure0[i])
-    loading_total = 1.0 / inverse_loading
-
-    # get loading of each component by multiplying by mole fractions
-    loadings = adsorbed_mole_fractions * loading_total
+    loadings = _iast_loadings(isotherms, adsorbed_mole_fractions, pressure0)
 
     if verbose:
         # print off IAST loadings and corresponding pure component loadings
@@ -655,19 +1428,268 @@ def reverse_iast(
 
     # print warning if had to extrapolate isotherm in spreading pressure
     if not warningoff:
-        for i in range(n_components):
-            if pressure0[i] > isotherms[i].pressure(branch=branch).max():
-                logger.warning(
-                    textwrap.dedent(
-                        f"""
-                        WARNING:
-                        Component {i}: p0 = {pressure0[i]} > {isotherms[i].pressure(branch=branch).max()}, the highest pressure
-                        exhibited in the pure-component isotherm data. Thus,
-                        code had to extrapolate the isotherm data to achieve
-                        this IAST result.
-                        """
-                    )
-                )
+        _warn_extrapolation(isotherms, pressure0, branch)
 
     # return mole fractions in gas phase, component loadings
     return gas_mole_fractions, loadings
+
+
+def reverse_iast_raw(
+    isotherms,
+    adsorbed_mole_fractions,
+    total_pressures,
+    branch="ads",
+    gas_mole_fraction_guess=None,
+    rtol=1e-10,
+    ftol=1e-12,
+    maxiter=100,
+):
+    r"""
+    Perform reverse IAST for many adsorbed mole fractions and
+    total pressures at once.
+
+    At a set adsorbed composition, the fictitious pressures of all
+    components are given by the reduced spreading pressure :math:`\Pi`,
+    and the gas mole fractions :math:`y_i = x_i p^0_i(\Pi) / P` must add up
+    to one. As in ``iast_fast_raw``, a single equation is solved for each point:
+
+    .. math::
+
+        h(\Pi) = 1 - \frac{1}{P} \sum_i x_i p^0_i(\Pi) = 0
+
+    which decreases monotonically with :math:`\Pi`, with a derivative of
+    :math:`-\sum_i x_i p^0_i / (P n_i(p^0_i))`. The root is bracketed by
+    the pure-component spreading pressures at the total pressure, and all
+    points are solved together with safeguarded Newton steps, started from
+    the gas mole fraction guesses if given, such as the results of
+    a nearby sweep.
+
+    No checks are performed on the isotherms passed: use
+    ``reverse_iast`` for a checked calculation.
+
+    Parameters
+    ----------
+    isotherms : list of ModelIsotherms or PointIsotherms
+        Pure-component adsorption isotherms.
+    adsorbed_mole_fractions : array
+        Desired adsorbed mole fractions, with a shape of (npoints, ncomponents).
+    total_pressures : float or array
+        Total bulk gas pressure, for all or for each point.
+    branch : str
+        which branch of the isotherm to use
+    gas_mole_fraction_guess : array, optional
+        Starting guesses for gas phase mole fractions, for
+        all or for each point.
+    rtol : float, optional
+        Relative tolerance on the spreading pressure.
+    ftol : float, optional
+        Tolerance on the sum of the gas mole fractions.
+    maxiter : int, optional
+        Maximum number of iterations.
+
+    Returns
+    -------
+    dict
+        Dictionary with the results for each point:
+            - `gas_mole_fraction` bulk gas mole fractions, shape (npoints, ncomponents)
+            - `loading` adsorbed uptakes of each component, shape (npoints, ncomponents)
+            - `pressure0` fictitious pressures of each component, shape (npoints, ncomponents)
+            - `spreading_pressure` the reduced spreading pressure, shape (npoints)
+            - `converged` whether the solution was found, shape (npoints)
+            - `iterations` number of Newton iterations, shape (npoints)
+            - `nfev` number of inversions of the spreading pressures, shape (npoints)
+
+        Values at points which have not converged are NaN.
+
+    """
+    adsorbed_mole_fractions = numpy.atleast_2d(numpy.asarray(adsorbed_mole_fractions, dtype=float))
+    npoints, n_components = adsorbed_mole_fractions.shape
+    total_pressures = numpy.broadcast_to(numpy.asarray(total_pressures, dtype=float), (npoints, ))
+    tables = [_point_table(iso, branch) if not isinstance(iso, ModelIsotherm) else None for iso in isotherms]
+    ranges = [_pressure_range(isotherm, branch) for isotherm in isotherms]
+    present = adsorbed_mole_fractions > 0
+
+    nfev = numpy.zeros(npoints, dtype=int)
+
+    def residual(idx, sp):
+        """One minus the sum of gas mole fractions, and its derivative."""
+        nfev[idx] += 1
+        fractions = numpy.zeros((idx.size, n_components))
+        slope = numpy.zeros(idx.size)
+        for i, isotherm in enumerate(isotherms):
+            rows = present[idx, i]
+            pressure0 = _spreading_pressure_inverse(isotherm, tables[i], sp[rows])
+            fractions[rows, i] = adsorbed_mole_fractions[idx[rows], i] * pressure0 / total_pressures[idx[rows]]
+            slope[rows] -= fractions[rows, i] / _loading(isotherm, ranges[i], pressure0, branch)
+        return 1 - numpy.sum(fractions, axis=1), slope
+
+    with numpy.errstate(all='ignore'):
+        # Bracket from the spreading pressures at the total pressure,
+        # limited to where PointIsotherms can be inverted
+        pure = numpy.full((npoints, n_components), numpy.nan)
+        upper = numpy.full(npoints, numpy.inf)
+        for i, isotherm in enumerate(isotherms):
+            rows = present[:, i]
+            pure[rows, i] = _spreading_pressure(isotherm, ranges[i], total_pressures[rows], branch)
+            if tables[i] is not None:
+                upper[rows] = numpy.minimum(upper[rows], tables[i][2][-1])
+        a = numpy.nanmin(pure, axis=1)
+        b = numpy.minimum(numpy.nanmax(pure, axis=1), upper)
+
+        # Initial estimate, from the gas mole fraction guess if given
+        if gas_mole_fraction_guess is None:
+            start = numpy.sum(pure * adsorbed_mole_fractions, axis=1, where=present)
+        else:
+            guess = numpy.broadcast_to(
+                numpy.asarray(gas_mole_fraction_guess, dtype=float),
+                (npoints, n_components),
+            )
+            start = numpy.zeros(npoints)
+            for i, isotherm in enumerate(isotherms):
+                rows = present[:, i]
+                start[rows] += adsorbed_mole_fractions[rows, i] * _spreading_pressure(
+                    isotherm,
+                    ranges[i],
+                    total_pressures[rows] * guess[rows, i] / adsorbed_mole_fractions[rows, i],
+                    branch,
+                )
+
+        spreading_pressure, converged, iterations = _solve_spreading_pressure(
+            residual,
+            a,
+            b,
+            b == upper,
+            start,
+            numpy.any(present, axis=1) & (total_pressures > 0),
+            rtol,
+            ftol,
+            maxiter,
+        )
+
+        # Gas mole fractions and loadings at the solution
+        gas_mole_fractions = numpy.full((npoints, n_components), numpy.nan)
+        pressure0 = numpy.full((npoints, n_components), numpy.nan)
+        inverse_loading = numpy.zeros(npoints)
+        for i, isotherm in enumerate(isotherms):
+            rows = converged & present[:, i]
+            pressure0[rows, i] = _spreading_pressure_inverse(
+                isotherm, tables[i], spreading_pressure[rows]
+            )
+            gas_mole_fractions[converged, i] = 0
+            gas_mole_fractions[rows, i] = adsorbed_mole_fractions[rows, i] * \
+                pressure0[rows, i] / total_pressures[rows]
+            inverse_loading[rows] += adsorbed_mole_fractions[rows, i] / \
+                _loading(isotherm, ranges[i], pressure0[rows, i], branch)
+        # enforce the sum of mole fractions to within the tolerance
+        gas_mole_fractions /= numpy.sum(gas_mole_fractions, axis=1, keepdims=True)
+        loadings = numpy.where(
+            converged[:, None], adsorbed_mole_fractions / inverse_loading[:, None], numpy.nan
+        )
+
+    return {
+        "gas_mole_fraction": gas_mole_fractions,
+        "loading": loadings,
+        "pressure0": pressure0,
+        "spreading_pressure": spreading_pressure,
+        "converged": converged,
+        "iterations": iterations,
+        "nfev": nfev,
+    }
+
+
+def _reverse_iast_solve(
+    isotherms,
+    adsorbed_mole_fractions,
+    total_pressure,
+    branch,
+    gas_mole_fraction_guess=None,
+    ranges=None,
+):
+    """
+    Solve for the gas mole fractions giving a set of adsorbed mole fractions
+    at a total pressure, without any checks.
+
+    Returns the scipy result, in the same form as ``_iast_point_solve``.
+    """
+    n_components = len(isotherms)
+    adsorbed_mole_fractions = numpy.asarray(adsorbed_mole_fractions, dtype=float)
+    if ranges is None:
+        ranges = [_pressure_range(isotherm, branch) for isotherm in isotherms]
+    counts = {"nfev": 0, "nit": 0}
+
+    def mole_fractions(gas_mole_fractions):
+        # automatically assert \sum y_i = 1
+        return numpy.append(gas_mole_fractions, 1.0 - numpy.sum(gas_mole_fractions))
+
+    # assert that the spreading pressures of each component are equal
+    def spreading_pressure_differences(gas_mole_fractions):
+        r"""
+        Assert that spreading pressures of each component at fictitious pressure
+        are equal.
+
+        Parameters
+        ----------
+        gas_mole_fractions : array
+            Mole fractions in bulk gas phase
+            numpy.size(y) = n_components - 1 because \sum y_i = 1 asserted here
+            automatically.
+
+        Returns
+        -------
+        array
+            Spreading pressure difference
+            between component i and i+1.
+        """
+        counts["nfev"] += 1
+        pressure0 = total_pressure * mole_fractions(gas_mole_fractions) / adsorbed_mole_fractions
+        spreading_pressures = numpy.array([
+            isotherm.spreading_pressure_at(pressure0[i], branch=branch)
+            for i, isotherm in enumerate(isotherms)
+        ])
+        return spreading_pressures[:-1] - spreading_pressures[1:]
+
+    def spreading_pressure_jacobian(gas_mole_fractions):
+        """
+        Derivatives of the spreading pressure differences. As
+        d(Pi)/d(p0) = n(p0) / p0, the derivative of the spreading pressure
+        of component i with its gas mole fraction is n_i(p0_i) / y_i, while
+        that of the last component with all mole fractions is -n_n(p0_n) / y_n.
+        """
+        counts["nit"] += 1
+        fractions = mole_fractions(gas_mole_fractions)
+        pressure0 = total_pressure * fractions / adsorbed_mole_fractions
+        derivatives = numpy.array([
+            _loading(isotherm, ranges[i], pressure0[i], branch) / fractions[i]
+            for i, isotherm in enumerate(isotherms)
+        ])
+        jacobian = numpy.diag(derivatives[:-1])
+        jacobian[:-1, 1:] -= numpy.diag(derivatives[1:-1])
+        jacobian[-1, :] += derivatives[-1]
+        return jacobian
+
+    if gas_mole_fraction_guess is None:
+        # Default guess: adsorbed mole fraction
+        gas_mole_fraction_guess = adsorbed_mole_fractions
+    else:
+        # if list, convert to numpy array
+        gas_mole_fraction_guess = numpy.asarray(gas_mole_fraction_guess)
+
+    try:
+        res = optimize.root(
+            spreading_pressure_differences,
+            gas_mole_fraction_guess[:-1],
+            jac=spreading_pressure_jacobian,
+            method='lm',
+        )
+    except (CalculationError, ValueError) as err:
+        # the isotherm cannot be evaluated, e.g. outside PointIsotherm data
+        res = optimize.OptimizeResult(
+            x=numpy.full(n_components - 1, numpy.nan),
+            success=False,
+            message=str(err),
+        )
+
+    res.x = mole_fractions(res.x)
+    res.nfev = counts["nfev"]
+    res.nit = counts["nit"]
+    return res
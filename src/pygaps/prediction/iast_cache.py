@@ -0,0 +1,169 @@
+"""
+A cache of IAST results, to avoid solving the same mixture again.
+
+Results are kept in memory, with the least recently used discarded first,
+and optionally in an sqlite file so they persist between sessions.
+"""
+
+import json
+import pathlib
+import typing as t
+
+import numpy
+
+from pygaps.utilities.python_utilities import LRUCache
+from pygaps.utilities.sqlite_utilities import db_query
+
+_CREATE_TABLE = """
+    CREATE TABLE IF NOT EXISTS "iast" (
+        `key`           TEXT        NOT NULL PRIMARY KEY,
+        `loading`       TEXT        NOT NULL
+    );
+"""
+
+
+class IASTCache():
+    """
+    A cache of IAST point results.
+
+    Each result is stored under a key made from the ids of the isotherms
+    (which include the parameters of fitted models), the isotherm branch
+    and the partial pressures, rounded to a number of significant digits.
+    Only converged results are stored.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Maximum number of results kept in memory.
+    path : str, optional
+        Path to an sqlite file where results are also stored.
+        It is created if it does not exist.
+    digits : int, optional
+        Number of significant digits of the partial pressures
+        which are part of the key.
+    enabled : bool, optional
+        Whether the cache is used. It can be switched off and on
+        through the ``enabled`` attribute.
+
+    Examples
+    --------
+    Reuse the results of a mixture, also in later sessions::
+
+        import pygaps.prediction as pgp
+
+        cache = pgp.IASTCache(path="iast.db")
+        pgp.iast_point_fraction([ch4_isotherm, c2h6_isotherm], [0.5, 0.5], 1, cache=cache)
+        cache.info()
+
+    """
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        path: str = None,
+        digits: int = 10,
+        enabled: bool = True,
+    ):
+        self.memory = LRUCache(maxsize=maxsize)
+        self.path = pathlib.Path(path) if path else None
+        self.digits = digits
+        self.enabled = enabled
+        self.disk_hits = 0
+        if self.path:
+            db_query(self.path, _CREATE_TABLE)
+
+    def __len__(self):
+        return len(self.memory)
+
+    def key(
+        self,
+        isotherms: list,
+        partial_pressures: list,
+        branch: str = 'ads',
+    ) -> str:
+        """
+        Generate the key of an IAST result.
+
+        Parameters
+        ----------
+        isotherms : list of ModelIsotherms or PointIsotherms
+            Pure-component adsorption isotherms.
+        partial_pressures : array or list
+            Partial pressures of gas components.
+        branch : str, optional
+            Branch of the isotherms which is used.
+
+        Returns
+        -------
+        str
+            The key of the result.
+        """
+        pressures = ",".join(f"{float(p):.{self.digits}g}" for p in numpy.ravel(partial_pressures))
+        ids = ",".join(isotherm.iso_id for isotherm in isotherms)
+        return f"{ids}|{branch}|{pressures}"
+
+    def get(self, key: str) -> t.Optional[numpy.ndarray]:
+        """
+        Return a stored result, looking in memory first, then on disk.
+
+        Parameters
+        ----------
+        key : str
+            The key of the result.
+
+        Returns
+        -------
+        array or None
+            The loadings of each component, or None if the result is not stored.
+        """
+        loading = self.memory.get(key)
+        if loading is None and self.path:
+            rows = db_query(self.path, "SELECT loading FROM iast WHERE key = ?", (key, ))
+            if rows:
+                loading = numpy.array(json.loads(rows[0][0]))
+                self.memory[key] = loading
+                self.disk_hits += 1
+        return None if loading is None else loading.copy()
+
+    def set(self, key: str, loading: numpy.ndarray):
+        """
+        Store a result.
+
+        Parameters
+        ----------
+        key : str
+            The key of the result.
+        loading : array
+            The loadings of each component.
+        """
+        loading = numpy.array(loading, dtype=float)
+        self.memory[key] = loading
+        if self.path:
+            db_query(
+                self.path,
+                "INSERT OR REPLACE INTO iast VALUES (?, ?)",
+                (key, json.dumps(loading.tolist())),
+            )
+
+    def clear(self, disk: bool = False):
+        """
+        Remove all results from memory and, optionally, from disk.
+
+        Parameters
+        ----------
+        disk : bool, optional
+            Whether to also remove the results stored on disk.
+        """
+        self.memory.clear()
+        if disk and self.path:
+            db_query(self.path, "DELETE FROM iast")
+
+    def info(self) -> dict:
+        """
+        Return the statistics of the cache: the ``hits`` and ``misses``
+        of lookups in memory, the memory misses found on disk as ``disk_hits``,
+        the ``size`` and ``maxsize`` of the memory and whether it is ``enabled``.
+        """
+        info = self.memory.info()
+        info["disk_hits"] = self.disk_hits
+        info["enabled"] = self.enabled
+        return info
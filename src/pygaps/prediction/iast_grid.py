@@ -0,0 +1,239 @@
+"""Module calculating IAST over a grid of pressures, compositions and temperatures."""
+
+import os
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy
+import pandas
+
+from pygaps import logger
+from pygaps.core.modelisotherm import ModelIsotherm
+from pygaps.modelling import is_model_iast
+from pygaps.prediction.iast import _warn_extrapolation
+from pygaps.prediction.iast import iast_binary_raw
+from pygaps.prediction.iast import iast_fast_raw
+from pygaps.utilities.exceptions import ParameterError
+
+# Isotherms of each temperature, set once in each worker process
+_GRID_ISOTHERMS = {}
+
+
+def iast_grid(
+    isotherms,
+    total_pressures,
+    mole_fractions,
+    branch: str = "ads",
+    warningoff: bool = False,
+    n_jobs: int = None,
+    executor: Executor = None,
+    chunksize: int = None,
+) -> pandas.DataFrame:
+    """
+    Perform IAST calculations on every combination of temperature,
+    total pressure and bulk gas composition.
+
+    The grid is split in chunks of points, which can be solved concurrently
+    by passing a number of processes in ``n_jobs``. The isotherms are then
+    sent once to each process, rather than with every chunk.
+    Points which cannot be solved are recorded in the result,
+    without stopping the rest of the grid.
+
+    Parameters
+    ----------
+    isotherms : list of ModelIsotherms or PointIsotherms, or dict
+        Pure-component adsorption isotherms,
+        e.g. [methane_isotherm, ethane_isotherm, ...].
+        To include temperature in the grid, pass a dictionary of
+        temperatures and the isotherms at each temperature,
+        e.g. {298: [methane_298, ethane_298], 313: [methane_313, ethane_313]}.
+    total_pressures : array or list
+        Total pressures of the gas mixture.
+    mole_fractions : array or list
+        Bulk gas compositions, with a shape of (ncompositions, ncomponents).
+        For binary mixtures, an 1D array with the mole fraction of the
+        first component can also be passed.
+    branch : str
+        which branch of the isotherm to use
+    warningoff: bool, optional
+        When False, logger.warning will print when the IAST
+        calculation result required extrapolation of the pure-component
+        adsorption isotherm beyond the highest pressure in the data,
+        or when some points of the grid could not be solved.
+    n_jobs : int, optional
+        Number of processes used to solve the grid. Defaults to solving
+        it in this process. Set to -1 to use all processors.
+    executor : concurrent.futures.Executor, optional
+        An executor (process or thread pool) to solve the grid on.
+        Takes precedence over ``n_jobs``. The isotherms are sent with
+        every chunk of points.
+    chunksize : int, optional
+        Number of points in each chunk. Defaults to splitting the points
+        at each temperature in four chunks for each process.
+
+    Returns
+    -------
+    DataFrame
+        Results for each point, indexed by ``temperature``, ``total_pressure``
+        and ``composition``, the row of `mole_fractions`. The columns are:
+
+            - ``gas_fraction_<adsorbate>`` bulk gas mole fraction of each component
+            - ``adsorbed_fraction_<adsorbate>`` adsorbed mole fraction of each component
+            - ``loading_<adsorbate>`` predicted uptake of each component
+            - ``selectivity`` selectivity of the first component over all others
+            - ``converged`` whether the point was solved
+
+        Values at points which have not converged are NaN.
+
+    """
+    # Parameter checks
+    if not isinstance(isotherms, dict):
+        isotherms = {isotherms[0].temperature: isotherms}
+    isotherms = {temperature: list(isos) for temperature, isos in isotherms.items()}
+    n_components = {len(isos) for isos in isotherms.values()}
+    if len(n_components) != 1:
+        raise ParameterError("Pass the same number of isotherms at each temperature.")
+    n_components = n_components.pop()
+    if n_components == 1:
+        raise ParameterError("Pass at least two isotherms.")
+    for isos in isotherms.values():
+        for isotherm in isos:
+            if isinstance(isotherm, ModelIsotherm):
+                if not is_model_iast(isotherm.model.name):
+                    raise ParameterError(f"Model {isotherm.model.name} cannot be used with IAST.")
+        if any(iso.pressure_mode.startswith("relative") for iso in isos):
+            raise ParameterError("IAST only runs with isotherms on an absolute pressure basis.")
+
+    total_pressures = numpy.ravel(numpy.asarray(total_pressures, dtype=float))
+    mole_fractions = numpy.asarray(mole_fractions, dtype=float)
+    if mole_fractions.ndim == 1 and n_components == 2:
+        mole_fractions = numpy.stack((mole_fractions, 1 - mole_fractions), axis=1)
+    if mole_fractions.ndim != 2 or mole_fractions.shape[1] != n_components:
+        raise ParameterError(
+            "Pass a bulk gas composition for each component, "
+            "with a shape of (ncompositions, ncomponents)."
+        )
+    if numpy.any(mole_fractions < 0) or not numpy.allclose(mole_fractions.sum(axis=1), 1):
+        raise ParameterError("Bulk gas mole fractions must be positive and add up to 1.")
+
+    # all (pressure, composition) points at each temperature
+    partial_pressures = (total_pressures[:, None, None] * mole_fractions[None, :, :]).reshape(
+        -1, n_components
+    )
+    npoints = len(partial_pressures)
+    if chunksize is None:
+        workers = 1
+        if executor is not None or (n_jobs is not None and n_jobs != 1):
+            workers = n_jobs if n_jobs and n_jobs > 0 else os.cpu_count() or 1
+        chunksize = max(1, -(-npoints // (4 * workers)))
+    chunks = [
+        (temperature, slice(start, start + chunksize))
+        for temperature in isotherms
+        for start in range(0, npoints, chunksize)
+    ]
+
+    if executor is None and n_jobs is not None and n_jobs != 1:
+        with ProcessPoolExecutor(
+            max_workers=n_jobs if n_jobs > 0 else None,
+            initializer=_iast_grid_init,
+            initargs=(isotherms, ),
+        ) as pool:
+            futures = [
+                pool.submit(_iast_grid_chunk, temperature, partial_pressures[rows], branch)
+                for temperature, rows in chunks
+            ]
+            results = [future.result() for future in futures]
+    elif executor is not None:
+        futures = [
+            executor.submit(
+                _iast_grid_solve, isotherms[temperature], partial_pressures[rows], branch
+            ) for temperature, rows in chunks
+        ]
+        results = [future.result() for future in futures]
+    else:
+        results = [
+            _iast_grid_solve(isotherms[temperature], partial_pressures[rows], branch)
+            for temperature, rows in chunks
+        ]
+
+    # assemble the results of all temperatures
+    results = {
+        temperature: {
+            key: numpy.concatenate([
+                result[key] for (chunk_temperature, _), result in zip(chunks, results)
+                if chunk_temperature == temperature
+            ])
+            for key in results[0]
+        }
+        for temperature in isotherms
+    }
+
+    if not warningoff:
+        for temperature, isos in isotherms.items():
+            _warn_extrapolation(isos, results[temperature]["pressure0"], branch)
+        failed = sum(numpy.sum(~result["converged"]) for result in results.values())
+        if failed:
+            logger.warning(f"IAST could not be solved at {failed} points of the grid.")
+
+    names = [str(isotherm.adsorbate) for isotherm in next(iter(isotherms.values()))]
+    if len(set(names)) != len(names):
+        names = [f"{name}_{index}" for index, name in enumerate(names)]
+
+    gas_fractions = numpy.tile(mole_fractions, (len(total_pressures), 1))
+    frames = []
+    for temperature, result in results.items():
+        adsorbed = result["adsorbed_mole_fraction"]
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            selectivity = (adsorbed[:, 0] / gas_fractions[:, 0]) / (
+                (1 - adsorbed[:, 0]) / (1 - gas_fractions[:, 0])
+            )
+        frame = {}
+        frame.update({f"gas_fraction_{name}": gas_fractions[:, i] for i, name in enumerate(names)})
+        frame.update({f"adsorbed_fraction_{name}": adsorbed[:, i] for i, name in enumerate(names)})
+        frame.update({f"loading_{name}": result["loading"][:, i] for i, name in enumerate(names)})
+        frame["selectivity"] = selectivity
+        frame["converged"] = result["converged"]
+        frames.append(pandas.DataFrame(frame))
+
+    index = pandas.MultiIndex.from_product(
+        [list(isotherms), total_pressures, range(len(mole_fractions))],
+        names=["temperature", "total_pressure", "composition"],
+    )
+    return pandas.concat(frames, ignore_index=True).set_index(index)
+
+
+def _iast_grid_init(isotherms):
+    """Keep the isotherms of the grid in a worker process."""
+    _GRID_ISOTHERMS.clear()
+    _GRID_ISOTHERMS.update(isotherms)
+
+
+def _iast_grid_chunk(temperature, partial_pressures, branch):
+    """Solve a chunk of the grid with the isotherms kept in a worker process."""
+    return _iast_grid_solve(_GRID_ISOTHERMS[temperature], partial_pressures, branch)
+
+
+def _iast_grid_solve(isotherms, partial_pressures, branch):
+    """
+    Solve IAST at a chunk of points. Binary mixtures are solved in the
+    adsorbed mole fraction, and others in the spreading pressure.
+    Errors mark the whole chunk as failed, rather than stopping the grid.
+    """
+    solver = iast_binary_raw if len(isotherms) == 2 else iast_fast_raw
+    try:
+        result = solver(isotherms, partial_pressures, branch)
+    except Exception as err:
+        logger.info(f"IAST failed on a chunk of the grid: {err}")
+        nans = numpy.full(partial_pressures.shape, numpy.nan)
+        return {
+            "loading": nans,
+            "adsorbed_mole_fraction": nans,
+            "pressure0": nans,
+            "converged": numpy.zeros(len(partial_pressures), dtype=bool),
+        }
+    return {
+        "loading": result["loading"],
+        "adsorbed_mole_fraction": result["adsorbed_mole_fraction"],
+        "pressure0": result["pressure0"],
+        "converged": result["converged"],
+    }
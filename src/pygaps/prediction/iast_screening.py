@@ -0,0 +1,381 @@
+"""Module screening materials in an isotherm database with IAST."""
+
+import hashlib
+import json
+import pathlib
+import time
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy
+import pandas
+
+from pygaps import logger
+from pygaps.core.modelisotherm import ModelIsotherm
+from pygaps.core.pointisotherm import PointIsotherm
+from pygaps.modelling import FitCache
+from pygaps.modelling import is_model_iast
+from pygaps.parsing.sqlite import isotherms_from_db
+from pygaps.parsing.sqlite import with_connection
+from pygaps.prediction.iast import iast_binary_raw
+from pygaps.prediction.iast import iast_fast_raw
+from pygaps.utilities.exceptions import CalculationError
+from pygaps.utilities.exceptions import ParameterError
+from pygaps.utilities.sqlite_utilities import db_query
+
+_CREATE_TABLE = """
+    CREATE TABLE IF NOT EXISTS "screening" (
+        `run`           TEXT        NOT NULL,
+        `material`      TEXT        NOT NULL,
+        `temperature`   REAL        NOT NULL,
+        `result`        TEXT        NOT NULL,
+        PRIMARY KEY (`run`, `material`, `temperature`)
+    );
+"""
+
+
+def iast_screen(
+    adsorbates: list,
+    mole_fractions: list,
+    total_pressure: float,
+    desorption_pressure: float = None,
+    criteria: dict = None,
+    db_path: str = None,
+    model=None,
+    fit_cache: FitCache = None,
+    branch: str = "ads",
+    rank_by: str = "selectivity",
+    resume_path: str = None,
+    batch_size: int = 50,
+    n_jobs: int = None,
+    executor: Executor = None,
+    verbose: bool = False,
+) -> dict:
+    """
+    Rank the materials in an isotherm database by their IAST
+    selectivity and working capacity for a gas mixture.
+
+    Every material with isotherms of all `adsorbates` at the same temperature
+    is screened. The isotherms are read from the database in batches of
+    materials, modelled if a `model` is given, and IAST is solved
+    for each material. Fitted models can be kept in a ``FitCache``,
+    and the results of each batch stored in a ``resume_path`` file,
+    so that an interrupted screening continues where it stopped.
+
+    Parameters
+    ----------
+    adsorbates : list of str
+        Adsorbates of the mixture, e.g. ["carbon dioxide", "nitrogen"].
+        The selectivity is the one of the first adsorbate.
+    mole_fractions : list
+        Bulk gas mole fractions of the feed.
+    total_pressure : float
+        Total pressure of the feed, in the pressure unit of the isotherms.
+    desorption_pressure : float, optional
+        Total pressure at which the material is regenerated. If given, the
+        working capacity of the first adsorbate between the feed and this
+        pressure, at the same composition, is also calculated.
+    criteria : dict, optional
+        Other isotherm parameters on which to filter the database,
+        such as ``{'temperature': 298}``.
+    db_path : str, optional
+        Path to the database. If none is specified, internal database is used.
+    model : str or list, optional
+        Model (or list of models to choose from) used to describe the
+        point isotherms. Defaults to using the isotherms as stored.
+    fit_cache : FitCache, optional
+        A cache of fits to reuse, and to which new fits are added.
+    branch : str
+        which branch of the isotherm to use
+    rank_by : str, optional
+        Column of the results by which materials are ranked,
+        in decreasing order.
+    resume_path : str, optional
+        Path to an sqlite file where results are stored after each batch.
+        Materials already screened under the same conditions are not
+        screened again.
+    batch_size : int, optional
+        Number of materials read from the database at once.
+    n_jobs : int, optional
+        Number of processes used to fit models and solve IAST. Defaults to
+        doing both in this process. Set to -1 to use all processors.
+    executor : concurrent.futures.Executor, optional
+        An executor (process or thread pool) on which models are fit and
+        IAST solved. Takes precedence over ``n_jobs``.
+    verbose : bool
+        Print out the progress of the screening.
+
+    Returns
+    -------
+    dict
+        A dictionary with:
+
+            - ``ranking`` a DataFrame with a row for each material, in order of
+              `rank_by` with failed materials last. The columns are the
+              ``material``, ``temperature``, ``model_<adsorbate>``,
+              ``loading_<adsorbate>``, ``adsorbed_fraction_<adsorbate>``,
+              ``selectivity``, ``working_capacity`` (if there is a
+              `desorption_pressure`), the IAST ``time`` and any ``error``.
+            - ``statistics`` a dictionary with the number of ``materials``
+              screened, of those ``solved``, ``failed`` and ``resumed``
+              from a previous run, and the ``fit_time``, ``iast_time``
+              and ``total_time`` in seconds.
+
+    """
+    start = time.perf_counter()
+
+    # Parameter checks
+    adsorbates = [str(adsorbate) for adsorbate in adsorbates]
+    if len(adsorbates) < 2:
+        raise ParameterError("Pass at least two adsorbates.")
+    mole_fractions = numpy.asarray(mole_fractions, dtype=float)
+    if len(mole_fractions) != len(adsorbates):
+        raise ParameterError("Number of mole fractions != number of adsorbates.")
+    if numpy.any(mole_fractions <= 0) or not numpy.isclose(mole_fractions.sum(), 1):
+        raise ParameterError("Bulk gas mole fractions must be positive and add up to 1.")
+    if desorption_pressure is not None and desorption_pressure >= total_pressure:
+        raise ParameterError("Desorption pressure must be lower than the feed pressure.")
+    criteria = dict(criteria) if criteria else {}
+    for key in ("material", "adsorbate"):
+        if key in criteria:
+            raise ParameterError(f"The database cannot be filtered by {key} when screening.")
+
+    pressures = [total_pressure] if desorption_pressure is None else [
+        total_pressure, desorption_pressure
+    ]
+    partial_pressures = numpy.outer(pressures, mole_fractions)
+
+    # Results of a previous run under the same conditions
+    run = _screening_run(
+        adsorbates,
+        mole_fractions,
+        pressures,
+        criteria,
+        model,
+        branch,
+    )
+    store = _ScreeningStore(resume_path, run) if resume_path else None
+    done = store.load() if store else {}
+    rows = list(done.values())
+
+    statistics = {
+        "materials": 0,
+        "solved": 0,
+        "failed": 0,
+        "resumed": len(done),
+        "fit_time": 0.0,
+        "iast_time": 0.0,
+        "total_time": 0.0,
+    }
+
+    pool = None
+    if executor is None and n_jobs is not None and n_jobs != 1:
+        pool = executor = ProcessPoolExecutor(max_workers=n_jobs if n_jobs > 0 else None)
+
+    try:
+        candidates = [
+            candidate
+            for candidate in _screening_candidates(adsorbates, criteria, db_path=db_path)
+            if (candidate[0], candidate[1]) not in done
+        ]
+        for first in range(0, len(candidates), batch_size):
+            batch = candidates[first:first + batch_size]
+
+            # Read the isotherms of the batch
+            isotherms = [[
+                isotherms_from_db(criteria={"id": iso_id}, db_path=db_path, verbose=False)[0]
+                for iso_id in iso_ids
+            ] for _, _, iso_ids in batch]
+
+            # Model them
+            fit_start = time.perf_counter()
+            if model is not None:
+                isotherms = _screening_models(
+                    isotherms, model, branch, fit_cache, executor, verbose
+                )
+            statistics["fit_time"] += time.perf_counter() - fit_start
+
+            # Solve IAST for each material
+            if executor is not None:
+                futures = [
+                    executor.submit(_screen_material, isos, partial_pressures, branch)
+                    for isos in isotherms
+                ]
+                results = [future.result() for future in futures]
+            else:
+                results = [
+                    _screen_material(isos, partial_pressures, branch) for isos in isotherms
+                ]
+
+            batch_rows = []
+            for (material, temperature, _), isos, result in zip(batch, isotherms, results):
+                row = {"material": material, "temperature": temperature}
+                for adsorbate, isotherm in zip(adsorbates, isos):
+                    row[f"model_{adsorbate}"] = _model_name(isotherm)
+                row.update(_screening_row(adsorbates, mole_fractions, result))
+                batch_rows.append(row)
+                statistics["iast_time"] += result["time"]
+
+            rows.extend(batch_rows)
+            if store:
+                store.save(batch_rows)
+            if verbose:
+                logger.info(f"Screened {len(rows)} of {len(candidates) + len(done)} materials.")
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    columns = ["material", "temperature"]
+    for prefix in ("model", "loading", "adsorbed_fraction"):
+        columns.extend(f"{prefix}_{adsorbate}" for adsorbate in adsorbates)
+    columns.append("selectivity")
+    if desorption_pressure is not None:
+        columns.append("working_capacity")
+    columns.extend(["time", "error"])
+
+    ranking = pandas.DataFrame(rows, columns=columns)
+    if rank_by not in ranking.columns:
+        raise ParameterError(f"Cannot rank materials by {rank_by}, choose one of {columns}.")
+    ranking = ranking.sort_values(
+        rank_by,
+        ascending=False,
+        na_position="last",
+        kind="stable",
+    ).reset_index(drop=True)
+
+    failed = ranking["error"].notna()
+    statistics["materials"] = len(ranking)
+    statistics["failed"] = int(failed.sum())
+    statistics["solved"] = len(ranking) - statistics["failed"]
+    statistics["total_time"] = time.perf_counter() - start
+
+    return {
+        "ranking": ranking,
+        "statistics": statistics,
+    }
+
+
+def _screening_run(*conditions) -> str:
+    """Key of a screening, from all the conditions which change its results."""
+    raw = json.dumps(conditions, sort_keys=True, default=lambda obj: obj.tolist())
+    return hashlib.md5(raw.encode('utf-8')).hexdigest()
+
+
+@with_connection
+def _screening_candidates(adsorbates, criteria, db_path=None, **kwargs):
+    """
+    Find the (material, temperature, isotherm ids) with an isotherm of each
+    adsorbate, taking the first isotherm if there are several.
+    """
+    cursor = kwargs['cursor']
+    where = " AND ".join(f"{key} = :{key}" for key in criteria)
+    cursor.execute(
+        f"""SELECT id, material, adsorbate, temperature FROM "isotherms"
+            WHERE iso_type != 'isotherm' {'AND ' + where if where else ''}
+            ORDER BY material, temperature, id;""",
+        criteria,
+    )
+    groups = {}
+    for row in cursor.fetchall():
+        ids = groups.setdefault((row['material'], row['temperature']), {})
+        ids.setdefault(row['adsorbate'], row['id'])
+
+    return [(material, temperature, [ids[adsorbate] for adsorbate in adsorbates])
+            for (material, temperature), ids in groups.items()
+            if all(adsorbate in ids for adsorbate in adsorbates)]
+
+
+def _screening_models(isotherms, model, branch, fit_cache, executor, verbose):
+    """Model the point isotherms of a batch, keeping any model isotherms."""
+    points = [iso for isos in isotherms for iso in isos if isinstance(iso, PointIsotherm)]
+    fits = ModelIsotherm.from_pointisotherms(
+        points,
+        branch=branch,
+        model=model,
+        verbose=verbose,
+        executor=executor,
+        fit_cache=fit_cache,
+    )
+    fits = dict(zip(map(id, points), fits))
+    return [[fits.get(id(iso), iso) for iso in isos] for isos in isotherms]
+
+
+def _model_name(isotherm):
+    """Name of the model of an isotherm, if any."""
+    if isinstance(isotherm, ModelIsotherm):
+        return isotherm.model.name
+    if isinstance(isotherm, PointIsotherm):
+        return "point"
+    return None
+
+
+def _screen_material(isotherms, partial_pressures, branch):
+    """
+    Solve IAST for a material at the feed, and at the desorption pressure.
+    Errors are recorded rather than raised.
+    """
+    start = time.perf_counter()
+    try:
+        for isotherm in isotherms:
+            if isotherm is None:
+                raise ParameterError("An isotherm could not be modelled.")
+            if isinstance(isotherm, ModelIsotherm) and not is_model_iast(isotherm.model.name):
+                raise ParameterError(f"Model {isotherm.model.name} cannot be used with IAST.")
+        solver = iast_binary_raw if len(isotherms) == 2 else iast_fast_raw
+        result = solver(isotherms, partial_pressures, branch)
+        if not result["converged"].all():
+            raise CalculationError("IAST did not converge.")
+        return {
+            "loading": result["loading"],
+            "adsorbed_mole_fraction": result["adsorbed_mole_fraction"],
+            "time": time.perf_counter() - start,
+        }
+    except Exception as err:
+        return {"error": str(err) or type(err).__name__, "time": time.perf_counter() - start}
+
+
+def _screening_row(adsorbates, mole_fractions, result) -> dict:
+    """Columns of the ranking from the IAST results of a material."""
+    row = {"time": result["time"], "error": result.get("error")}
+    if "error" in result:
+        return row
+    loading = result["loading"]
+    adsorbed = result["adsorbed_mole_fraction"][0]
+    for index, adsorbate in enumerate(adsorbates):
+        row[f"loading_{adsorbate}"] = loading[0, index]
+        row[f"adsorbed_fraction_{adsorbate}"] = adsorbed[index]
+    row["selectivity"] = (adsorbed[0] / mole_fractions[0]) / (
+        (1 - adsorbed[0]) / (1 - mole_fractions[0])
+    )
+    if len(loading) > 1:
+        row["working_capacity"] = loading[0, 0] - loading[1, 0]
+    return row
+
+
+class _ScreeningStore():
+    """Results of a screening, stored in an sqlite file after each batch."""
+    def __init__(self, path, run):
+        self.path = pathlib.Path(path)
+        self.run = run
+        db_query(self.path, _CREATE_TABLE)
+
+    def load(self) -> dict:
+        """Stored results of the run, by (material, temperature)."""
+        rows = db_query(
+            self.path,
+            "SELECT material, temperature, result FROM screening WHERE run = ?", (self.run, )
+        )
+        return {(material, temperature): json.loads(result) for material, temperature, result in rows}
+
+    def save(self, rows: list):
+        """Store the results of materials."""
+        db_query(
+            self.path,
+            "INSERT OR REPLACE INTO screening VALUES (?, ?, ?, ?)",
+            [(
+                self.run,
+                row["material"],
+                row["temperature"],
+                json.dumps(row, default=float),
+            ) for row in rows],
+        )
@@ -31,6 +31,13 @@ def isotherm_to_hash(isotherm):
     elif isinstance(isotherm, pygaps.ModelIsotherm):
         raw_dict["data_hash"] = isotherm.model.to_dict()
 
-    md_hasher = hashlib.md5(json.dumps(raw_dict, sort_keys=True).encode('utf-8'))
+    md_hasher = hashlib.md5(json.dumps(raw_dict, sort_keys=True, default=_to_json).encode('utf-8'))
 
     return md_hasher.hexdigest()
+
+
+def _to_json(obj):
+    """Serialise numpy values and anything else as their string."""
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    return str(obj)
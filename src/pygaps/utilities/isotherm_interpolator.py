@@ -1,7 +1,14 @@
 """A class used for isotherm interpolation."""
 
+import numpy
+from scipy.interpolate import CubicSpline
+from scipy.interpolate import PchipInterpolator
 from scipy.interpolate import interp1d
 
+# Kinds of interpolation which are computed from coefficients stored on
+# creation, instead of going through scipy.interpolate.interp1d
+_CACHED_KINDS = ('linear', 'pchip', 'cubic')
+
 
 class IsothermInterpolator():
     """
@@ -9,7 +16,12 @@ class IsothermInterpolator():
 
     Call directly to use.
 
-    It is mainly a wrapper around scipy.interpolate.interp1d.
+    For `linear`, `pchip` (monotone piecewise cubic) and `cubic` interpolation,
+    the sorted data and the interpolation coefficients are stored on creation,
+    and each call is a direct numpy evaluation (numpy.interp for bounded
+    linear interpolation). Other kinds are delegated to
+    scipy.interpolate.interp1d. In all cases, values outside the data bounds
+    are treated as in interp1d.
 
     Parameters
     ----------
@@ -48,11 +60,37 @@ class IsothermInterpolator():
 
         # The actual interpolator. This is generated
         # the first time it is needed to make calculations faster.
+        self.interp_fun = None
         if known_data is None:
             return
 
         # Create the interpolator
-        if interp_fill is None:
+        if interp_kind in _CACHED_KINDS:
+            known_data = numpy.asarray(known_data, dtype=float)
+            interp_data = numpy.asarray(interp_data, dtype=float)
+            order = numpy.argsort(known_data, kind="mergesort")
+            self._x = known_data[order]
+            self._y = interp_data[order]
+            if self._x.size < 2:
+                raise ValueError("x and y arrays must have at least 2 entries")
+            if isinstance(interp_fill, str) and interp_fill != "extrapolate":
+                raise ValueError(f"Unknown fill value '{interp_fill}'.")
+            if interp_fill is None or isinstance(interp_fill, str):
+                self._fill = None
+            elif isinstance(interp_fill, tuple) and len(interp_fill) == 2:
+                self._fill = interp_fill
+            else:
+                self._fill = (interp_fill, interp_fill)
+
+            if interp_kind == 'linear':
+                self._slopes = numpy.diff(self._y) / numpy.diff(self._x)
+                self.interp_fun = self._linear
+            elif interp_kind == 'pchip':
+                self.interp_fun = PchipInterpolator(self._x, self._y)
+            elif interp_kind == 'cubic':
+                self.interp_fun = CubicSpline(self._x, self._y)
+
+        elif interp_fill is None:
             self.interp_fun = interp1d(
                 known_data,
                 interp_data,
@@ -71,4 +109,40 @@ class IsothermInterpolator():
 
     def __call__(self, data):
         """Override direct call to return interpolated data."""
-        return self.interp_fun(data)
+        if self.interp_kind not in _CACHED_KINDS:
+            return self.interp_fun(data)
+
+        data = numpy.asarray(data, dtype=float)
+
+        if self.interp_fill is None:
+            if data.min(initial=self._x[0]) < self._x[0]:
+                raise ValueError(
+                    f"A value ({data.min()}) in x_new is below "
+                    f"the interpolation range's minimum value ({self._x[0]})."
+                )
+            if data.max(initial=self._x[-1]) > self._x[-1]:
+                raise ValueError(
+                    f"A value ({data.max()}) in x_new is above "
+                    f"the interpolation range's maximum value ({self._x[-1]})."
+                )
+
+        if self.interp_kind == 'linear' and self.interp_fill != "extrapolate":
+            # bounded linear interpolation is done in a single numpy call
+            if self._fill is None:
+                return numpy.asarray(numpy.interp(data, self._x, self._y))
+            return numpy.asarray(numpy.interp(data, self._x, self._y, *self._fill))
+
+        ret = numpy.asarray(self.interp_fun(data))
+        if self._fill is None:
+            # "extrapolate" uses the interpolation itself
+            return ret
+        ret = numpy.where(data < self._x[0], self._fill[0], ret)
+        ret = numpy.where(data > self._x[-1], self._fill[1], ret)
+        return ret
+
+    def _linear(self, data):
+        """Linear interpolation (and extrapolation) from stored segments."""
+        # same segment selection as interp1d
+        hi = numpy.clip(numpy.searchsorted(self._x, data), 1, self._x.size - 1)
+        lo = hi - 1
+        return self._slopes[lo] * (data - self._x[lo]) + self._y[lo]
@@ -11,17 +11,21 @@ from pygaps.utilities.exceptions import ParameterError
 def split_ads_data(data, pressure_key):
     """Find the inflection in an adsorption dataset with adsorption/desorption."""
 
+    # Works on both DataFrames and dictionaries of arrays
+    pressure = numpy.asarray(data[pressure_key])
+    index = getattr(data, "index", None)
+
     # Generate array
-    split = numpy.zeros(data.shape[0], dtype=numpy.int8)
+    split = numpy.zeros(pressure.shape[0], dtype=numpy.int8)
 
     # Get the maximum pressure point (assume where desorption starts)
-    inflexion = data.index.get_loc(data[pressure_key].idxmax()) + 1
+    inflexion = numpy.nanargmax(pressure) + 1
 
     # If the maximum is not the last point
     if inflexion != len(split):
 
         # If the first point is the maximum, then it is purely desorption
-        if inflexion == data.index[0]:
+        if inflexion == (0 if index is None else index[0]):
             inflexion = 0
 
         # Set all instances after the inflexion point to 1
@@ -3,6 +3,7 @@
 import importlib
 import sys
 import warnings
+from collections import OrderedDict
 from collections import abc
 
 
@@ -52,6 +53,131 @@ def deep_merge(a, b, path=None, update=True):
     return a
 
 
+class ObservedDict(dict):
+    """
+    A dictionary which calls a function whenever its contents change.
+
+    Parameters
+    ----------
+    on_change : callable
+        Function called without arguments after each change.
+
+    """
+    def __init__(self, *args, on_change=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.on_change = on_change
+
+    def _changed(self):
+        # not yet set while unpickling
+        on_change = getattr(self, "on_change", None)
+        if on_change is not None:
+            on_change()
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._changed()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._changed()
+
+    def clear(self):
+        super().clear()
+        self._changed()
+
+    def pop(self, *args):
+        value = super().pop(*args)
+        self._changed()
+        return value
+
+    def popitem(self):
+        item = super().popitem()
+        self._changed()
+        return item
+
+    def setdefault(self, key, default=None):
+        value = super().setdefault(key, default)
+        self._changed()
+        return value
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._changed()
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+
+class LRUCache():
+    """
+    A bounded mapping which discards the least recently used items.
+
+    Lookups through ``get`` are counted as hits or misses,
+    which can be used to monitor the effectiveness of the cache.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of items to store. If ``None``, the cache is unbounded.
+
+    """
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __setitem__(self, key, value):
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if self.maxsize is not None:
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get(self, key, default=None):
+        """Return a stored item, or the default if it is not stored."""
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def values(self):
+        """Return all stored items, without counting them as lookups."""
+        return list(self._data.values())
+
+    def items(self):
+        """Return all stored keys and items, from least to most recently used."""
+        return list(self._data.items())
+
+    def pop(self, key, default=None):
+        """Remove a stored item and return it, or the default if it is not stored."""
+        return self._data.pop(key, default)
+
+    def clear(self):
+        """Remove all items, while keeping the hit/miss counters."""
+        self._data.clear()
+
+    def info(self) -> dict:
+        """Return the cache statistics."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+        }
+
+
 class SimpleWarning():
     """
     Context manager overrides warning formatter to remove unneeded info.
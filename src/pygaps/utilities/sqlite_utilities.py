@@ -41,6 +41,43 @@ def db_execute_general(
         raise ParsingError from e_info
 
 
+def db_query(
+    pth: str,
+    query: str,
+    parameters: "tuple | list" = (),
+) -> list:
+    """
+    Execute a parametrised SQL query and return all resulting rows.
+
+    Each query uses its own connection, so it can be called from
+    several threads or processes, and is committed if it succeeds.
+
+    Parameters
+    ----------
+    pth : str
+        Path where the database is located.
+    query : str
+        SQL query to execute.
+    parameters : tuple or list
+        Parameters of the query. With a list of tuples,
+        the query is executed once for each.
+
+    Returns
+    -------
+    list
+        Rows returned by the query.
+
+    """
+    conn = sqlite3.connect(pth, timeout=30)
+    try:
+        with conn:
+            if isinstance(parameters, list):
+                return conn.executemany(query, parameters).fetchall()
+            return conn.execute(query, parameters).fetchall()
+    finally:
+        conn.close()
+
+
 def build_update(
     table: str,
     to_set: list,
@@ -107,6 +107,46 @@ class TestAreaBET():
         err_absolute = 0.1  # 0.1 m2
         assert isclose(area, sample['bet_area_des'], err_relative, err_absolute)
 
+    def test_area_BET_windows_raw(self):
+        """Test fits of every pressure range against single fits."""
+        P = [0.001, 0.004, 0.009, 0.042, 0.093, 0.124, 0.156, 0.186]
+        L = [118, 135, 146, 172, 189, 195, 200, 203]
+
+        with pytest.raises(pgEx.ParameterError):
+            ab.area_BET_windows_raw(P, L, 1, min_points=2)
+        with pytest.raises(pgEx.CalculationError):
+            ab.area_BET_windows_raw(P[:2], L[:2], 1)
+
+        candidates, chosen = ab.area_BET_windows_raw(P, L, 1)
+        assert len(candidates) == 21  # ranges of 3 to 8 points
+        for _, window in candidates.iterrows():
+            result = ab.area_BET_raw(P, L, 1, p_limits=[window['p_min'], window['p_max'] + 1e-6])
+            assert isclose(result[0], window['area'])
+            assert isclose(result[8], window['corr_coef'])
+
+        chosen = candidates.loc[chosen]
+        valid = candidates[candidates['valid']]
+        assert chosen['valid']
+        assert chosen['points'] == valid['points'].max()
+        assert (valid['c_const'] > 0).all()
+
+        # a flat Rouquerol transform is accepted, as in single fits
+        candidates, _ = ab.area_BET_windows_raw([0.05, 0.25, 0.5, 0.75], [20, 40, 100, 200], 1)
+        assert candidates['rouquerol'].all()
+
+    @pytest.mark.parametrize('sample', DATA.values())
+    def test_area_BET_windows(self, sample, data_char_path):
+        """Test calculation on every range with several model isotherms."""
+        if 'bet_area' not in sample:
+            return
+
+        filepath = data_char_path / sample['file']
+        isotherm = pgpj.isotherm_from_json(filepath)
+
+        result = ab.area_BET_windows(isotherm)
+        assert isclose(result['area'], sample['bet_area'], 0.1, 0.1)
+        assert len(result['area_distribution']) == result['candidates']['valid'].sum()
+
     @mpl_cleanup
     def test_area_BET_output(self, data_char_path):
         """Test verbosity."""
@@ -114,3 +154,4 @@ class TestAreaBET():
         filepath = data_char_path / sample['file']
         isotherm = pgpj.isotherm_from_json(filepath)
         ab.area_BET(isotherm, verbose=True)
+        ab.area_BET_windows(isotherm, verbose=True)
@@ -26,6 +26,22 @@ def pytest_runtest_setup(item):
             pytest.xfail("previous test failed (%s)" % previousfailed.name)
 
 
+# Benchmarks
+def pytest_addoption(parser):
+    """Add an option to run benchmarks."""
+    parser.addoption("--benchmark", action="store_true", default=False, help="run timing benchmarks")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip benchmarks unless requested."""
+    if config.getoption("--benchmark"):
+        return
+    skip = pytest.mark.skip(reason="needs --benchmark to run")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
 DATA_PATH = Path(__file__).parent / 'test_data'
 
 
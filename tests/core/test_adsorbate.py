@@ -1,5 +1,6 @@
 """Tests relating to the Adsorbate class."""
 
+import pickle
 import warnings
 
 import pytest
@@ -37,6 +38,14 @@ class TestAdsorbate():
         assert ads == 'test2'
         assert ads == 'Test2'
 
+    def test_adsorbate_pickle(self):
+        """Check adsorbates with a thermodynamic backend can be pickled."""
+        ads = pygaps.Adsorbate.find('nitrogen')
+        assert ads.backend is not None
+        copy = pickle.loads(pickle.dumps(ads))
+        assert copy == ads
+        assert copy.backend.molar_mass() == ads.backend.molar_mass()
+
     def test_adsorbate_create(self, adsorbate_data, basic_adsorbate):
         """Check adsorbate can be created from test data."""
         assert adsorbate_data == basic_adsorbate.to_dict()
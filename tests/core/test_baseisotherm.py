@@ -1,5 +1,6 @@
 """Tests relating to the Isotherm class."""
 
+import numpy
 import pytest
 
 import pygaps
@@ -30,6 +31,42 @@ class TestBaseIsotherm():
         basic_isotherm.temperature = 0
         assert iso_id != basic_isotherm.iso_id
 
+    def test_isotherm_id_cached(self, basic_isotherm, monkeypatch):
+        """Check isotherm id is computed once and invalidated on change."""
+        calls = []
+        hash_func = pygaps.core.baseisotherm.isotherm_to_hash
+
+        def counted_hash(isotherm):
+            calls.append(1)
+            return hash_func(isotherm)
+
+        monkeypatch.setattr(pygaps.core.baseisotherm, "isotherm_to_hash", counted_hash)
+
+        iso_id = basic_isotherm.iso_id
+        for _ in range(100):
+            assert basic_isotherm.iso_id == iso_id
+        assert len(calls) == 1
+
+        basic_isotherm.properties['new_param'] = 'changed'
+        assert iso_id != basic_isotherm.iso_id
+        assert len(calls) == 2
+
+        iso_id = basic_isotherm.iso_id
+        basic_isotherm.convert_temperature(unit_to="°C")
+        assert iso_id != basic_isotherm.iso_id
+
+        iso_id = basic_isotherm.iso_id
+        basic_isotherm.material.properties['new_param'] = 'changed'
+        assert iso_id != basic_isotherm.iso_id
+        assert len(calls) == 4
+
+        # arrays in properties are hashed
+        basic_isotherm.properties['array'] = numpy.arange(3)
+        iso_id = basic_isotherm.iso_id
+        assert basic_isotherm.iso_id == iso_id
+        basic_isotherm.properties.update(array=numpy.arange(4))
+        assert iso_id != basic_isotherm.iso_id
+
     @pytest.mark.parametrize('missing_param', BaseIsotherm._required_params)
     def test_isotherm_miss_param(self, isotherm_parameters, missing_param):
         """Test exception throw for missing required attributes."""
@@ -0,0 +1,136 @@
+"""Tests relating to the IsothermCollection class."""
+
+import numpy
+import pytest
+
+import pygaps
+import pygaps.utilities.exceptions as pgEx
+from pygaps.core.isothermcollection import IsothermCollection
+
+
+@pytest.fixture()
+def isotherm_list(isotherm_parameters, use_adsorbate, use_material):
+    """A list of isotherms on different materials and temperatures."""
+    isotherms = []
+    for index in range(6):
+        params = dict(isotherm_parameters)
+        params['material'] = 'TEST' if index % 2 else f'other{index}'
+        params['temperature'] = 77 + index
+        params['index'] = index
+        pressure = numpy.linspace(0.1, 10, 10 + index)
+        loading = (index + 1) * pressure / (1 + pressure)
+        isotherms.append(
+            pygaps.PointIsotherm(
+                pressure=numpy.concatenate((pressure, pressure[-2::-1])),
+                loading=numpy.concatenate((loading, loading[-2::-1] * 1.1)),
+                storage='array' if index % 3 else 'pandas',
+                **params,
+            )
+        )
+    return isotherms
+
+
+@pytest.mark.core
+class TestIsothermCollection():
+    """Test the IsothermCollection class."""
+    def test_collection_create(self, isotherm_list):
+        """Check collection stores the data as ragged arrays."""
+        collection = IsothermCollection(isotherm_list)
+        assert len(collection) == len(isotherm_list)
+        assert list(collection.lengths) == [len(iso.pressure()) for iso in isotherm_list]
+        assert collection.offsets[-1] == len(collection.columns['pressure'])
+        assert len(collection.materials) == 4
+        assert len(collection.adsorbates) == 1
+        repr(collection)
+
+        with pytest.raises(pgEx.ParameterError):
+            IsothermCollection([isotherm_list[0], "not an isotherm"])
+
+    def test_collection_view(self, isotherm_list):
+        """Check single isotherms are views on the collection."""
+        collection = IsothermCollection(isotherm_list)
+        for isotherm, view in zip(isotherm_list, collection):
+            assert view == isotherm
+            assert numpy.shares_memory(view.pressure(), collection.columns['pressure'])
+            assert numpy.array_equal(view.loading(branch='des'), isotherm.loading(branch='des'))
+        assert collection[-1] == isotherm_list[-1]
+
+    def test_collection_filter(self, isotherm_list):
+        """Check filtering by material, adsorbate and temperature."""
+        collection = IsothermCollection(isotherm_list)
+        assert len(collection.filter(material='TEST')) == 3
+        assert len(collection.filter(material=['TEST', 'other0'])) == 4
+        assert len(collection.filter(adsorbate='ta1')) == 6
+        assert len(collection.filter(adsorbate='nitrogen')) == 0
+        assert len(collection.filter(temperature=78)) == 1
+        selected = collection.filter(material='TEST', temperature=(78, 80))
+        assert len(selected) == 2
+        assert selected[1] == isotherm_list[3]
+        assert list(selected.materials) == ['TEST']
+
+    def test_collection_convert(self, isotherm_list):
+        """Check batch conversion is the same as single conversion."""
+        collection = IsothermCollection(isotherm_list).filter(material='TEST')
+        units = {
+            'pressure_unit': 'Pa',
+            'loading_basis': 'mass',
+            'loading_unit': 'g',
+            'material_basis': 'volume',
+            'material_unit': 'cm3',
+        }
+        collection.convert(**units)
+        for view, isotherm in zip(collection, isotherm_list[1::2]):
+            isotherm.convert(**units)
+            assert view == isotherm
+            assert view.loading() == pytest.approx(isotherm.loading())
+
+        collection.convert_pressure(mode_to='relative')
+        assert all(collection.metadata['pressure_unit'].isna())
+        assert collection[0].pressure_mode == 'relative'
+
+    @pytest.mark.parametrize('fill', [None, 4, (0, 20), 'extrapolate'])
+    def test_collection_loading_at(self, isotherm_list, fill):
+        """Check batch loading interpolation."""
+        collection = IsothermCollection(isotherm_list)
+        pressure = [0.5, 3, 9] if fill is None else [0.01, 3, 12]
+        loading = collection.loading_at(pressure, interp_fill=fill)
+        assert loading.shape == (6, 3)
+        for index, isotherm in enumerate(isotherm_list):
+            assert loading[index] == pytest.approx(isotherm.loading_at(pressure, interp_fill=fill))
+
+        # a value per isotherm
+        loading = collection.loading_at(numpy.arange(1, 7)[:, None], branch='des')
+        assert loading.shape == (6, 1)
+        assert loading[2, 0] == pytest.approx(isotherm_list[2].loading_at(3, branch='des'))
+        assert collection.loading_at(5).shape == (6, )
+
+        if fill is None:
+            with pytest.raises(pgEx.CalculationError):
+                collection.loading_at(12)
+
+    def test_collection_pressure_at(self, isotherm_list):
+        """Check batch pressure interpolation."""
+        collection = IsothermCollection(isotherm_list)
+        pressure = collection.pressure_at([0.7, 0.9], branch='des')
+        for index, isotherm in enumerate(isotherm_list):
+            assert pressure[index] == pytest.approx(isotherm.pressure_at([0.7, 0.9], branch='des'))
+
+        with pytest.raises(pgEx.CalculationError):
+            collection.pressure_at(3)
+        with pytest.raises(pgEx.ParameterError):
+            collection.pressure_at(3, interp_fill='something')
+        with pytest.raises(pgEx.ParameterError):
+            collection.pressure_at(numpy.ones((3, 3)))
+
+    def test_collection_spreading_pressure_at(self, isotherm_list):
+        """Check batch spreading pressure calculation."""
+        collection = IsothermCollection(isotherm_list)
+        pressure = [0.05, 0.1, 2.5, 10, 15]
+        spreading = collection.spreading_pressure_at(pressure, interp_fill=5)
+        for index, isotherm in enumerate(isotherm_list):
+            assert spreading[index] == pytest.approx(
+                isotherm.spreading_pressure_at(pressure, interp_fill=5)
+            )
+
+        with pytest.raises(pgEx.CalculationError):
+            collection.spreading_pressure_at(15)
@@ -1,5 +1,8 @@
 """Tests relating to the ModelIsotherm class."""
 
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy
 import pandas
 import pytest
 from pandas.testing import assert_series_equal
@@ -125,8 +128,23 @@ class TestModelIsotherm():
             model='Henry',
         )
 
+    def test_isotherm_id_model(self, basic_modelisotherm):
+        """Check the isotherm id changes with the model parameters."""
+        iso_id = basic_modelisotherm.iso_id
+        basic_modelisotherm.model.params['K'] = 100
+        assert basic_modelisotherm.iso_id != iso_id
+
+        iso_id = basic_modelisotherm.iso_id
+        basic_modelisotherm.model.params = {'K': 10}
+        assert basic_modelisotherm.iso_id != iso_id
+
+        iso_id = basic_modelisotherm.iso_id
+        basic_modelisotherm.model = pygaps.modelling.get_isotherm_model('Henry', parameters={'K': 10})
+        assert basic_modelisotherm.iso_id != iso_id
+        assert basic_modelisotherm.iso_id == basic_modelisotherm.iso_id
+
     @mpl_cleanup
-    @pytest.mark.parametrize('file, ', [(data['file']) for data in list(DATA.values())])
+    @pytest.mark.parametrize('file', [data['file'] for data in DATA.values()])
     def test_isotherm_create_guess(self, file, data_char_path):
         """Check isotherm can be guessed from PointIsotherm."""
 
@@ -142,6 +160,54 @@ class TestModelIsotherm():
                 isotherm, model=['Henry', 'DummyModel'], verbose=True
             )
 
+    def test_isotherm_guess_parallel(self, data_char_path):
+        """Check models guessed concurrently give the same best fit."""
+        isotherm = pgp.isotherm_from_json(data_char_path / DATA['MCM-41']['file'])
+        models = ['Henry', 'Langmuir', 'DSLangmuir', 'Henry', 'Quadratic']
+
+        serial = pygaps.ModelIsotherm.from_pointisotherm(isotherm, model=models)
+        processes = pygaps.ModelIsotherm.from_pointisotherm(isotherm, model=models, n_jobs=2)
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            threads = pgm.model_iso(isotherm, model=models, executor=executor)
+
+        assert serial.model.name == processes.model.name == threads.model.name
+        assert serial.model.params == processes.model.params == threads.model.params
+
+        # ties are resolved by model order
+        best = pygaps.ModelIsotherm.from_pointisotherm(isotherm, model=['Henry', 'Henry'], n_jobs=2)
+        assert best.model.name == 'Henry'
+
+    def test_isotherm_guess_threshold(self, data_char_path):
+        """Check guessing stops at the first model below the RMSE threshold."""
+        isotherm = pgp.isotherm_from_json(data_char_path / DATA['MCM-41']['file'])
+        models = ['Henry', 'Langmuir', 'DSLangmuir']
+
+        best = pygaps.ModelIsotherm.from_pointisotherm(isotherm, model=models)
+        assert best.model.name == 'DSLangmuir'
+        assert best.model.pressure_range == pytest.approx(
+            (min(isotherm.pressure()), max(isotherm.pressure()))
+        )
+        assert best.material == isotherm.material
+
+        first = pgm.model_iso(isotherm, model=models, rmse_threshold=numpy.inf)
+        assert first.model.name == 'Henry'
+        threshold = pgm.model_iso(isotherm, model=models, rmse_threshold=best.model.rmse, n_jobs=2)
+        assert threshold.model.name == 'DSLangmuir'
+
+    @pytest.mark.parametrize('model', ['Langmuir', 'DSLangmuir', 'BET', 'GAB', 'Freundlich', 'Quadratic'])
+    def test_isotherm_fit_jacobian(self, data_char_path, model):
+        """Check analytic and finite difference jacobians give the same fit."""
+        isotherm = pgp.isotherm_from_json(data_char_path / DATA['MCM-41']['file'])
+
+        analytic = pygaps.ModelIsotherm.from_pointisotherm(isotherm, model=model)
+        finite = pygaps.ModelIsotherm.from_pointisotherm(
+            isotherm, model=model, optimization_params={"jac": "2-point"}
+        )
+        assert analytic.model.rmse == pytest.approx(finite.model.rmse, rel=1e-3)
+        assert list(analytic.model.params.values()) == pytest.approx(
+            list(finite.model.params.values()), rel=1e-3
+        )
+
     ##########################
 
     @pytest.mark.parametrize(
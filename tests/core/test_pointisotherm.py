@@ -1,11 +1,13 @@
 """Tests relating to the PointIsotherm class."""
 
+import numpy
 import pandas
 import pytest
 from pandas.testing import assert_series_equal
 
 import pygaps
 import pygaps.utilities.exceptions as pgEx
+from pygaps.utilities.isotherm_interpolator import IsothermInterpolator
 
 from ..test_utils import mpl_cleanup
 from .conftest import LOADING_AT_PARAM
@@ -75,6 +77,12 @@ class TestPointIsotherm():
         assert iso_id != basic_pointisotherm.iso_id
         basic_pointisotherm.data_raw = basic_pointisotherm.data_raw[:5]
         assert iso_id != basic_pointisotherm.iso_id
+        iso_id = basic_pointisotherm.iso_id
+        basic_pointisotherm.convert_pressure(unit_to='Pa')
+        assert iso_id != basic_pointisotherm.iso_id
+        iso_id = basic_pointisotherm.iso_id
+        basic_pointisotherm.loading_at(100000)
+        assert iso_id == basic_pointisotherm.iso_id
 
     @pytest.mark.parametrize('missing_key', ['loading_key', 'pressure_key'])
     def test_isotherm_miss_key(
@@ -192,6 +200,62 @@ class TestPointIsotherm():
         )
         assert isotherm.loading_at(3) == pytest.approx(basic_modelisotherm.loading_at(3))
 
+    def test_isotherm_array_storage(
+        self,
+        use_adsorbate,
+        use_material,
+        isotherm_data,
+        isotherm_parameters,
+        basic_pointisotherm,
+    ):
+        """Check array-backed isotherms behave like DataFrame-backed ones."""
+        isotherm = pygaps.PointIsotherm(
+            isotherm_data=isotherm_data,
+            loading_key='loading',
+            pressure_key='pressure',
+            storage='array',
+            **isotherm_parameters
+        )
+        assert isotherm == basic_pointisotherm
+        assert isotherm.other_keys == basic_pointisotherm.other_keys
+        assert isotherm.to_dict() == basic_pointisotherm.to_dict()
+        for branch in [None, 'ads', 'des']:
+            assert isotherm.has_branch(branch)
+            assert isotherm.data(branch).equals(basic_pointisotherm.data(branch))
+        for _, parameters in PRESSURE_PARAM:
+            assert numpy.allclose(
+                isotherm.pressure(**parameters), basic_pointisotherm.pressure(**parameters)
+            )
+        for _, parameters in LOADING_PARAM:
+            assert numpy.allclose(
+                isotherm.loading(**parameters), basic_pointisotherm.loading(**parameters)
+            )
+        assert_series_equal(
+            isotherm.pressure(branch='des', limits=(3, None), indexed=True),
+            basic_pointisotherm.pressure(branch='des', limits=(3, None), indexed=True),
+        )
+        assert_series_equal(
+            isotherm.other_data('enthalpy', indexed=True),
+            basic_pointisotherm.other_data('enthalpy', indexed=True),
+        )
+        assert isotherm.loading_at(3.5) == basic_pointisotherm.loading_at(3.5)
+
+        isotherm.convert(pressure_unit='Pa', loading_unit='mol')
+        basic_pointisotherm.convert(pressure_unit='Pa', loading_unit='mol')
+        assert isotherm == basic_pointisotherm
+
+        isotherm.data_raw = isotherm.data_raw[:5]
+        assert not isotherm.has_branch('des')
+        assert isotherm != basic_pointisotherm
+
+        with pytest.raises(pgEx.ParameterError):
+            pygaps.PointIsotherm(
+                pressure=[1, 2, 3],
+                loading=[1, 2, 3],
+                storage='random',
+                **isotherm_parameters,
+            )
+
     ##########################
 
     def test_isotherm_ret_has_branch(
@@ -399,6 +463,72 @@ class TestPointIsotherm():
         assert basic_pointisotherm.spreading_pressure_at(inp, **parameters
                                                          ) == pytest.approx(expected, 1e-5)
 
+    def test_isotherm_interpolator_cache(self, basic_pointisotherm):
+        """Check interpolators are reused between branches and options."""
+        cache = basic_pointisotherm.interpolator_cache
+        for _ in range(5):
+            basic_pointisotherm.loading_at(3, branch='ads')
+            basic_pointisotherm.loading_at(3, branch='des')
+            basic_pointisotherm.loading_at(3, interp_fill=6)
+            basic_pointisotherm.pressure_at(3)
+        assert cache.misses == 4
+        assert cache.hits == 16
+
+        # the last interpolators used are still available
+        assert basic_pointisotherm.l_interpolator.interp_fill == 6
+        assert basic_pointisotherm.p_interpolator.interp_branch == 'ads'
+
+        # assigned interpolators are used with the same options
+        interpolator = IsothermInterpolator([1, 6], [2, 12], interp_branch='ads')
+        basic_pointisotherm.l_interpolator = interpolator
+        assert basic_pointisotherm.l_interpolator is interpolator
+        assert basic_pointisotherm.loading_at(3) == pytest.approx(6)
+        basic_pointisotherm.l_interpolator = None
+        assert basic_pointisotherm.l_interpolator is None
+        assert basic_pointisotherm.loading_at(3) == pytest.approx(3)
+        assert basic_pointisotherm.p_interpolator is not None
+
+        basic_pointisotherm.convert_pressure(unit_to='Pa')
+        assert len(cache) == 0
+        assert basic_pointisotherm.l_interpolator is None
+        assert basic_pointisotherm.loading_at(3e5) == pytest.approx(3)
+        assert cache.misses == 6
+
+    def test_isotherm_spreading_pressure_at_array(self, basic_pointisotherm):
+        """Check the vectorised PointIsotherm spreading pressure calculation."""
+        pressures = [0.5, 1, 2.5, 6, 7]
+        # values of the previous scalar trapezoid integration,
+        # with the loading filled as 6 above the data
+        expected = [0.5, 1.0, 2.5, 6.0, 6 + 6 * numpy.log(7 / 6)]
+        assert basic_pointisotherm.spreading_pressure_at(
+            pressures, interp_fill=6
+        ) == pytest.approx(expected)
+        assert basic_pointisotherm.spreading_pressure_at(0.5) == pytest.approx(0.5)
+
+        # no extrapolation by default
+        with pytest.raises(pgEx.CalculationError):
+            basic_pointisotherm.spreading_pressure_at(pressures)
+
+        # integration table is invalidated on conversion
+        basic_pointisotherm.convert_pressure(unit_to='Pa')
+        assert basic_pointisotherm.spreading_pressure_at(
+            [p * 1e5 for p in pressures], interp_fill=6
+        ) == pytest.approx(expected)
+
+    def test_isotherm_spreading_pressure_at_des(self):
+        """Check the desorption branch is integrated in order of pressure."""
+        isotherm = pygaps.PointIsotherm(
+            pressure=[1.0, 2.0, 3.0, 4.0, 5.0, 4.0, 2.0, 1.0],
+            loading=[1.0, 1.6, 2.0, 2.3, 2.5, 2.4, 2.0, 1.5],
+            material='TEST',
+            adsorbate='TA',
+            temperature=77,
+        )
+        # integral of the desorption points (1, 1.5), (2, 2), (4, 2.4)
+        # previously 0.3, 1.73971 and 2.4
+        expected = [0.75, 2 + numpy.log(2) + 0.2 + 1.6 * numpy.log(1.5), 2.4 + numpy.log(2) + 1.6 * numpy.log(2)]
+        assert isotherm.spreading_pressure_at([0.5, 3, 4], branch='des') == pytest.approx(expected)
+
     ##########################
 
     @pytest.mark.parametrize(
@@ -331,8 +331,8 @@ MODEL_DATA = {
         'test_values': {
             'pressure': [0.0, 0.040008193, 0.080033799, 0.120078938, 0.200240144, 0.40128205],
             'loading': [0.0, 0.2, 0.4, 0.6, 1.0, 2.0],
-            'spreading_pressure': [0.0, 15.77393361, 18.77393361, 20.77393361, 25.0, 30.62232981],
-            'spreading_pressure_mark': pytest.mark.xfail,
+            'spreading_pressure': [0.0, 0.20002065, 0.40008619, 0.60020412, 1.00064167, 2.00373333],
+            'spreading_pressure_mark': pytest.mark.okay,
         }
     },
     'FHVST': {
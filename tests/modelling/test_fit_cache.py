@@ -0,0 +1,114 @@
+"""Tests the cache of isotherm model fits."""
+
+import numpy
+import pytest
+
+import pygaps
+import pygaps.modelling as pgm
+import pygaps.utilities.exceptions as pgEx
+from pygaps.modelling import FitCache
+
+
+@pytest.fixture()
+def langmuir_isotherm(isotherm_parameters):
+    """A Langmuir-shaped isotherm."""
+    def create(temperature=77, scale=1.0):
+        pressure = numpy.linspace(0.1, 10, 20)
+        params = dict(isotherm_parameters, temperature=temperature)
+        return pygaps.PointIsotherm(
+            pressure=pressure,
+            loading=scale * 5 * pressure / (1 + pressure),
+            **params,
+        )
+
+    return create
+
+
+@pytest.mark.modelling
+class TestFitCache():
+    """Test caching of fits."""
+    def test_fit_cache_memory(self, langmuir_isotherm):
+        """Check repeated fits are taken from the cache."""
+        cache = FitCache(maxsize=2)
+        isotherm = langmuir_isotherm()
+
+        first = pgm.model_iso(isotherm, model="Langmuir", fit_cache=cache)
+        assert cache.info()["misses"] == 1
+        second = pgm.model_iso(isotherm, model="Langmuir", fit_cache=cache)
+        assert cache.info()["hits"] == 1
+        assert second.model.params == pytest.approx(first.model.params)
+        assert second.model.rmse == pytest.approx(first.model.rmse)
+        assert second.model.pressure_range == first.model.pressure_range
+
+        # a different branch, bounds or data is a different fit
+        pgm.model_iso(
+            isotherm, model="Langmuir", param_bounds={"K": (0, 100)}, fit_cache=cache
+        )
+        pgm.model_iso(langmuir_isotherm(scale=2), model="Langmuir", fit_cache=cache)
+        assert cache.info()["misses"] == 3
+        assert len(cache) == 2
+
+    def test_fit_cache_disk(self, langmuir_isotherm, tmp_path):
+        """Check fits persist on disk."""
+        path = tmp_path / "fits.db"
+        isotherm = langmuir_isotherm()
+        first = pgm.model_iso(isotherm, model="Langmuir", fit_cache=FitCache(path=path))
+
+        cache = FitCache(path=path)
+        second = pgm.model_iso(isotherm, model="Langmuir", fit_cache=cache)
+        assert cache.info()["hits"] == 0
+        assert len(cache) == 1
+        assert second.model.params == pytest.approx(first.model.params)
+
+        cache.clear(disk=True)
+        assert FitCache(path=path).get(cache.key("Langmuir", [0.1], [1])) is None
+
+    def test_fit_cache_guess(self, langmuir_isotherm, tmp_path):
+        """Check guessing stores successful and failed fits."""
+        cache = FitCache(path=tmp_path / "fits.db")
+        isotherm = langmuir_isotherm()
+        models = ["Henry", "Langmuir", "BET"]
+
+        first = pgm.model_iso(isotherm, model=models, fit_cache=cache)
+        assert len(cache) == 3
+        second = pgm.model_iso(isotherm, model=models, fit_cache=cache, n_jobs=2)
+        assert cache.info()["hits"] == 3
+        assert second.model.name == first.model.name == "Langmuir"
+
+        # failed fits are kept in memory, but not on disk
+        failed = {"error": "could not fit"}
+        key = cache.key("Henry", [1], [1], temperature=77)
+        cache.set(key, "Henry", failed)
+        assert cache.get(key)["fit"] == failed
+        assert FitCache(path=cache.path).get(key) is None
+        with pytest.raises(pgEx.CalculationError):
+            pygaps.ModelIsotherm(
+                pressure=[1], loading=[1], model="Henry", fit_cache=cache,
+                material="TEST", adsorbate="TA", temperature=77
+            )
+
+    def test_fit_cache_warm_start(self, langmuir_isotherm, tmp_path):
+        """Check fits start from those at nearby temperatures."""
+        cache = FitCache(path=tmp_path / "fits.db", warm_start=10)
+        fitted = pgm.model_iso(langmuir_isotherm(77), model="Langmuir", fit_cache=cache)
+
+        assert cache.nearest("Langmuir", "TEST", "TA", 85) == pytest.approx(fitted.model.params)
+        assert cache.nearest("langmuir", "TEST", "TA", 95) is None
+        assert cache.nearest("Langmuir", "other", "TA", 85) is None
+        assert FitCache(path=cache.path, warm_start=10).nearest("Langmuir", "TEST", "TA", 85)
+
+        # fits at the same temperature are not a warm start
+        assert cache.nearest("Langmuir", "TEST", "TA", 77) is None
+        pgm.model_iso(langmuir_isotherm(77), model="Langmuir", fit_cache=cache)
+        assert cache.info()["hits"] == 1
+
+        # the warm start is not part of the key, so fits are found in any order
+        warm = pgm.model_iso(langmuir_isotherm(85), model="Langmuir", fit_cache=cache)
+        assert warm.model.params == pytest.approx(fitted.model.params)
+        pgm.model_iso(langmuir_isotherm(77), model="Langmuir", fit_cache=cache)
+        assert cache.info()["hits"] == 2
+        assert len(cache) == 2
+        isotherm = langmuir_isotherm(85)
+        assert FitCache(path=cache.path).get(
+            cache.key("Langmuir", isotherm.pressure(), isotherm.loading(), temperature=85)
+        )
@@ -0,0 +1,163 @@
+"""Tests the evaluation of one model with many sets of parameters."""
+
+import numpy
+import pytest
+
+import pygaps
+import pygaps.modelling as pgm
+import pygaps.utilities.exceptions as pgEx
+
+from .conftest import MODEL_DATA
+
+
+def batch_parameters(m_name, size=4):
+    """Scaled copies of the test parameters of a model."""
+    params = MODEL_DATA[m_name]['test_parameters']
+    scales = numpy.linspace(0.9, 1.1, size)
+    return [{key: val * scale for key, val in params.items()} for scale in scales]
+
+
+@pytest.mark.modelling
+class TestModelBatch():
+    """Test batches of model parameters."""
+    @pytest.mark.parametrize(
+        "m_name", ["Henry", "Langmuir", "DSLangmuir", "BET", "Toth", "DR", "TSLangmuir", "Virial"]
+    )
+    def test_batch_evaluation(self, m_name):
+        """Check the batch matches each model evaluated on its own."""
+        parameters = batch_parameters(m_name)
+        batch = pgm.ModelBatch(m_name, parameters, temperature=[77, 87, 77, 87])
+        pressure = numpy.array([0.01, 0.1, 0.5, 0.9])
+
+        functions = ["loading", "pressure"]
+        if pgm.is_model_iast(m_name):
+            functions.append("spreading_pressure")
+        for function in functions:
+            result = getattr(batch, function)(pressure)
+            assert result.shape == (len(parameters), len(pressure))
+            for index, params in enumerate(parameters):
+                model = pgm.get_isotherm_model(m_name, parameters=params)
+                model.__init_parameters__({"temperature": [77, 87, 77, 87][index]})
+                assert result[index] == pytest.approx(getattr(model, function)(pressure))
+                assert batch[index].params == pytest.approx(params)
+
+    def test_batch_shapes(self):
+        """Check how values are broadcast to the parameter sets."""
+        batch = pgm.ModelBatch("Langmuir", {"n_m": [1, 2, 3], "K": [10, 1, 0.1]})
+        assert len(batch) == 3
+        assert batch.loading(1) == pytest.approx([10 / 11, 1, 0.3 / 1.1])
+        assert batch.loading([[1], [2], [3]])[:, 0] == pytest.approx([10 / 11, 4 / 3, 0.9 / 1.3])
+        assert batch.toth_correction([1, 2]).shape == (3, 2)
+
+        with pytest.raises(pgEx.ParameterError):
+            batch.loading([[1, 2], [3, 4]])
+        with pytest.raises(pgEx.ParameterError):
+            pgm.ModelBatch("Langmuir", {"n_m": [1, 2, 3], "K": [10, 1]})
+        with pytest.raises(pgEx.ParameterError):
+            pgm.ModelBatch("Langmuir", [{"n_m": 1}])
+        with pytest.raises(IndexError):
+            batch[3]
+
+    def test_batch_from_isotherms(self, basic_modelisotherm):
+        """Check a batch can be created from ModelIsotherms."""
+        batch = pgm.ModelBatch.from_isotherms([basic_modelisotherm, basic_modelisotherm])
+        pressure = [1, 2, 3]
+        assert batch.loading(pressure)[1] == pytest.approx(
+            basic_modelisotherm.loading_at(pressure)
+        )
+
+        other = pygaps.ModelIsotherm(
+            pressure=[1, 2, 3], loading=[1, 1.5, 1.8], model="Langmuir",
+            material="TEST", adsorbate="TA", temperature=77
+        )
+        with pytest.raises(pgEx.ParameterError):
+            pgm.ModelBatch.from_isotherms([basic_modelisotherm, other])
+
+
+@pytest.fixture()
+def isotherm_points():
+    """Noisy Toth-shaped isotherms with different numbers of points."""
+    rng = numpy.random.default_rng(0)
+    pressures, loadings = [], []
+    for size in [8, 12, 20, 15, 10]:
+        pressure = numpy.sort(rng.uniform(0.01, 10, size))
+        n_m, K, t = rng.uniform(1, 10), rng.uniform(0.1, 10), rng.uniform(0.5, 1)
+        loading = n_m * K * pressure / (1 + (K * pressure)**t)**(1 / t)
+        pressures.append(pressure)
+        loadings.append(loading * (1 + 0.01 * rng.standard_normal(size)))
+    return pressures, loadings
+
+
+@pytest.mark.modelling
+class TestFitBatch():
+    """Test fitting many isotherms at once."""
+    @pytest.mark.parametrize("m_name", ["Langmuir", "Toth", "DR", "JensenSeaton", "Virial"])
+    def test_fit_batch(self, m_name, isotherm_points):
+        """Check batch fits match individual fits."""
+        pressures, loadings = isotherm_points
+        batch = pgm.fit_batch(m_name, pressures, loadings, temperature=77)
+
+        for index, (pressure, loading) in enumerate(zip(pressures, loadings)):
+            model = pgm.get_isotherm_model(
+                m_name,
+                pressure_range=(min(pressure), max(pressure)),
+                loading_range=(min(loading), max(loading)),
+            )
+            model.__init_parameters__({"temperature": 77})
+            try:
+                model.fit(pressure, loading, model.initial_guess(pressure, loading))
+            except pgEx.CalculationError:
+                assert not batch.converged[index]
+                continue
+            assert batch.converged[index]
+            assert batch.rmse[index] == pytest.approx(model.rmse, rel=1e-3)
+            assert batch[index].loading(pressure) == pytest.approx(
+                model.loading(pressure), rel=1e-3
+            )
+
+    def test_fit_batch_failures(self, isotherm_points):
+        """Check failures are flagged and retried."""
+        pressures, loadings = isotherm_points
+        pressures, loadings = pressures + [[0, 0]], loadings + [[0, 0]]
+        batch = pgm.fit_batch("Langmuir", pressures, loadings)
+        assert batch.converged.tolist() == [True] * 5 + [False]
+        assert numpy.isnan(batch.params["n_m"][-1])
+
+        # too few iterations to converge
+        batch = pgm.fit_batch(
+            "Toth", pressures[:5], loadings[:5], optimization_params={"max_nfev": 1}, retry=False
+        )
+        assert not batch.converged.any()
+        assert (batch.iterations == 1).all()
+
+        with pytest.raises(pgEx.ParameterError):
+            pgm.fit_batch("Langmuir", pressures, loadings[:2])
+        with pytest.raises(pgEx.ParameterError):
+            pgm.fit_batch("Langmuir", [[1, 2]], [[1]])
+        with pytest.raises(pgEx.ParameterError):
+            pgm.fit_batch("Langmuir", pressures, loadings, param_guess={"bad": 1})
+
+    def test_model_iso_batch(self, isotherm_points, isotherm_parameters):
+        """Check many isotherms can be modelled at once."""
+        isotherms = [
+            pygaps.PointIsotherm(pressure=pressure, loading=loading, **isotherm_parameters)
+            for pressure, loading in zip(*isotherm_points)
+        ]
+        isotherms.append(
+            pygaps.PointIsotherm(pressure=[1, 2], loading=[0, 0], **isotherm_parameters)
+        )
+        cache = pgm.FitCache()
+
+        models = pgm.model_iso(isotherms, model="Toth", fit_cache=cache)
+        assert len(models) == 6 and models[-1] is None
+        for isotherm, model in zip(isotherms, models[:-1]):
+            single = pgm.model_iso(isotherm, model="Toth")
+            assert model.model.rmse == pytest.approx(single.model.rmse, rel=1e-3)
+            assert model.material == isotherm.material
+
+        cached = pgm.model_iso(isotherms, model="Toth", fit_cache=cache)
+        assert cache.info()["hits"] == 6
+        assert cached[0].model.params == pytest.approx(models[0].model.params)
+
+        guessed = pgm.model_iso(isotherms[:2], model=["Henry", "Langmuir"])
+        assert [model.model.name for model in guessed] == ["Langmuir", "Langmuir"]
@@ -124,3 +124,110 @@ class TestIsothermModels():
         )
         # for param in param_real:
         #     assert numpy.isclose(model.params[param], param_real[param], 0.01)
+
+    @pytest.mark.parametrize(
+        "m_name", [
+            "DSToth",
+            "TSLangmuir",
+            "JensenSeaton",
+            "TemkinApprox",
+            "ChemiPhysisorption",
+            "FHVST",
+            "WVST",
+            "Virial",
+        ]
+    )
+    def test_models_inverse_array(self, m_name):
+        """Test numerical inversion of each element of an array."""
+
+        model = models.get_isotherm_model(m_name)
+        model.params = MODEL_DATA[m_name]['test_parameters']
+        pressure = numpy.logspace(-3, 1, 10000)
+
+        loading = model.loading(pressure)
+        assert numpy.allclose(model.pressure(loading), pressure, rtol=1e-6)
+        assert numpy.ndim(model.loading(pressure[5])) == 0
+        assert numpy.ndim(model.pressure(loading[5])) == 0
+
+    @pytest.mark.parametrize(
+        'm_name', [
+            "Toth",
+            "DSToth",
+            "DR",
+            "DA",
+            "JensenSeaton",
+            "ChemiPhysisorption",
+        ]
+    )
+    def test_models_s_pressure_array(self, m_name):
+        """Test numerical spreading pressure of each element of an array."""
+
+        model = models.get_isotherm_model(m_name)
+        model.params = MODEL_DATA[m_name]['test_parameters']
+        pressure = numpy.logspace(-3, 0, 1000)
+
+        spreading = model.spreading_pressure(pressure)
+        assert spreading.shape == pressure.shape
+        assert numpy.all(numpy.diff(spreading) > 0)
+        assert spreading[::100] == pytest.approx(
+            [model.spreading_pressure(p) for p in pressure[::100]], rel=1e-10
+        )
+        assert numpy.ndim(model.spreading_pressure(pressure[5])) == 0
+
+        # a change of parameters is reflected
+        model.params = {key: val * 1.1 for key, val in model.params.items()}
+        assert model.spreading_pressure(pressure[-1]) != pytest.approx(spreading[-1])
+
+    @pytest.mark.parametrize(
+        'm_name', [
+            "Henry",
+            "Langmuir",
+            "DSLangmuir",
+            "Quadratic",
+            "Freundlich",
+            "Toth",
+            "Virial",
+        ]
+    )
+    def test_models_s_pressure_inverse(self, m_name):
+        """Test spreading pressure inversion of each element of an array."""
+
+        model = models.get_isotherm_model(m_name)
+        model.params = MODEL_DATA[m_name]['test_parameters']
+        pressure = numpy.logspace(-3, 0, 100)
+
+        spreading = model.spreading_pressure(pressure)
+        assert model.spreading_pressure_inverse(spreading) == pytest.approx(pressure, rel=1e-8)
+        assert numpy.ndim(model.spreading_pressure_inverse(spreading[5])) == 0
+
+    def test_models_virial_non_monotonic(self):
+        """Test the Virial model is not inverted where its pressure decreases."""
+
+        model = models.get_isotherm_model('Virial', parameters={'K': 10, 'A': -3, 'B': 0.5, 'C': 0})
+        # the pressure increases up to a loading of 0.382 and again above 2.618
+        assert model.loading(model.pressure(0.01)) == pytest.approx(0.01)
+        with pytest.raises(pgEx.CalculationError):
+            model.loading(model.pressure(2.0))
+        with pytest.raises(pgEx.CalculationError):
+            model.loading(model.pressure(0.1))
+        assert numpy.isnan(model.spreading_pressure_inverse(model._loading_spreading_pressure(2.0)))
+
+    @pytest.mark.parametrize("m_name", MODEL_DATA.keys())
+    def test_models_param_derivatives(self, m_name):
+        """Test analytic parameter derivatives against finite differences."""
+
+        model = models.get_isotherm_model(m_name)
+        if type(model).param_derivatives is models.base_model.IsothermBaseModel.param_derivatives:
+            pytest.skip("Model has no analytic derivatives.")
+        model.params = dict(MODEL_DATA[m_name]['test_parameters'])
+        pressure = numpy.array([0.01, 0.1, 0.5, 0.9])
+        derivatives = model.param_derivatives(pressure)
+
+        for param, value in model.params.items():
+            step = 1e-5 * abs(value)
+            model.params[param] = value + step
+            upper = model.loading(pressure)
+            model.params[param] = value - step
+            lower = model.loading(pressure)
+            model.params[param] = value
+            assert derivatives[param] == pytest.approx((upper - lower) / (2 * step), rel=1e-5)
@@ -0,0 +1,59 @@
+"""Tests the numerical solvers used by isotherm models."""
+
+import numpy
+import pytest
+from scipy import integrate
+
+from pygaps.modelling.solvers import LogPressureIntegral
+from pygaps.modelling.solvers import invert_monotonic
+from pygaps.modelling.solvers import spreading_pressure_quadrature
+
+
+@pytest.mark.modelling
+def test_invert_monotonic():
+    """Check element-wise inversion, with unbounded and bounded domains."""
+    def langmuir(pressure):
+        return 5 * pressure / (1 + pressure)
+
+    values = numpy.array([0, 1e-8, 0.5, 4.99, 6, -1])
+    root, converged = invert_monotonic(langmuir, values)
+    assert list(converged) == [True, True, True, True, False, False]
+    assert langmuir(root[:4]) == pytest.approx(values[:4], rel=1e-10)
+    assert numpy.isnan(root[4:]).all()
+
+    root, converged = invert_monotonic(langmuir, 2.5)
+    assert converged
+    assert root == pytest.approx(1)
+
+    # asymptote at the upper limit of the domain
+    def vacancy(loading):
+        return loading / (3 - loading)
+
+    values = numpy.array([[1e-3, 1], [1e3, 1e6]])
+    root, converged = invert_monotonic(vacancy, values, upper=3, x0=1)
+    assert root.shape == values.shape
+    assert converged.all()
+    assert vacancy(root) == pytest.approx(values, rel=1e-4)
+
+
+@pytest.mark.modelling
+@pytest.mark.parametrize('tabulated', [False, True])
+def test_spreading_pressure_integral(tabulated):
+    """Check numerical spreading pressure against adaptive quadrature."""
+    def toth(pressure):
+        return 5 * pressure / (1 + (3 * pressure)**0.5)**2
+
+    pressure = numpy.array([[0, 1e-6, 0.1], [1, 100, 1e5]])
+    if tabulated:
+        spreading = LogPressureIntegral(toth)(pressure)
+    else:
+        spreading = spreading_pressure_quadrature(toth, pressure)
+
+    def reference(p):
+        if not p:
+            return 0
+        return integrate.quad(lambda x: toth(x) / x, 0, p, epsrel=1e-12, limit=200)[0]
+
+    assert spreading.shape == pressure.shape
+    assert spreading == pytest.approx(numpy.vectorize(reference, otypes=[float])(pressure), rel=1e-7)
+    assert numpy.isnan(spreading_pressure_quadrature(toth, [numpy.nan])).all()
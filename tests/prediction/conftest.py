@@ -3,6 +3,11 @@ This configuration file contains data required for testing
 scientific pygaps functions on real or model data.
 """
 
+import pytest
+
+import pygaps
+import pygaps.parsing as pgp
+
 from ..conftest import DATA_PATH
 
 DATA_WHITTAKER_PATH = DATA_PATH / 'enth_whittaker'
@@ -33,3 +38,22 @@ DATA_WHITTAKER = {
         'ref_enth': 16.08745,
     }
 }
+
+
+@pytest.fixture()
+def load_iast():
+    """A fixture which loads files from the disk."""
+    filepath = DATA_IAST_PATH / DATA_IAST['CH4']['file']
+    ch4 = pgp.isotherm_from_json(filepath)
+    filepath = DATA_IAST_PATH / DATA_IAST['C2H6']['file']
+    c2h6 = pgp.isotherm_from_json(filepath)
+    return ch4, c2h6
+
+
+@pytest.fixture()
+def load_iast_models(load_iast):
+    """Create models from the disk files."""
+    ch4, c2h6 = load_iast
+    ch4_m = pygaps.ModelIsotherm.from_pointisotherm(ch4, model='Langmuir')
+    c2h6_m = pygaps.ModelIsotherm.from_pointisotherm(c2h6, model='Langmuir')
+    return ch4_m, c2h6_m
@@ -0,0 +1,87 @@
+"""
+Tests relating to fixed-bed breakthrough simulations.
+
+All functions in /prediction/breakthrough.py are tested here.
+The lookup tables are compared against the vectorised IAST functions,
+and the simulations checked for mass balance.
+"""
+
+import numpy
+import pytest
+from scipy import constants
+from scipy.integrate import trapezoid
+
+import pygaps
+import pygaps.prediction.iast as pgi
+import pygaps.utilities.exceptions as pgEx
+from pygaps.prediction.breakthrough import IASTTable
+from pygaps.prediction.breakthrough import breakthrough_curve
+
+BED = {
+    "bed_length": 0.1,
+    "velocity": 0.01,
+    "bed_voidage": 0.4,
+    "bed_density": 700,
+    "mass_transfer_coefficients": 0.1,
+    "axial_dispersion": 1e-5,
+}
+
+
+@pytest.mark.modelling
+class TestBreakthrough():
+    """Test IAST lookup tables and breakthrough curves."""
+    def test_iast_table(self, load_iast):
+        """The interpolated loadings are close to IAST."""
+        partial_pressures = numpy.random.default_rng(0).uniform(0, 1, (50, 2))
+        table = IASTTable(load_iast, 2)
+        expected = pgi.iast_binary_raw(load_iast, partial_pressures)["loading"]
+        assert numpy.allclose(table(partial_pressures), expected, atol=0.01 * expected.max())
+        assert numpy.allclose(table([[0, 0]]), 0)
+
+        ternary = [pygaps.ModelIsotherm.from_pointisotherm(iso, model='Langmuir') for iso in load_iast]
+        ternary.append(ternary[0])
+        partial_pressures = numpy.random.default_rng(0).uniform(0, 1, (50, 3))
+        table = IASTTable(ternary, 2)
+        expected = pgi.iast_fast_raw(ternary, partial_pressures)["loading"]
+        assert numpy.allclose(table(partial_pressures), expected, atol=0.02 * expected.max())
+
+    def test_breakthrough_checks(self, load_iast):
+        """Checks for built-in safeguards."""
+        times = [0, 10]
+        with pytest.raises(pgEx.ParameterError):
+            breakthrough_curve(load_iast, [0.5], times, **BED)
+        with pytest.raises(pgEx.ParameterError):
+            breakthrough_curve(load_iast, [0.5, 0.5], [10, 0], **BED)
+        with pytest.raises(pgEx.ParameterError):
+            breakthrough_curve(load_iast, [0.5, 0.5], times, **{**BED, "bed_voidage": 1})
+        with pytest.raises(pgEx.ParameterError):
+            breakthrough_curve(load_iast, [0.5, 0.5], times, **{**BED, "mass_transfer_coefficients": [1, 0]})
+        with pytest.raises(pgEx.CalculationError):
+            breakthrough_curve(load_iast, [250, 250], times, **BED)
+
+    def test_breakthrough_curve(self, load_iast):
+        """Methane breaks through first, and adsorbed amounts balance the flows."""
+        feed = numpy.array([0.5, 0.5])
+        isotherms = [pygaps.ModelIsotherm.from_pointisotherm(iso, model='Langmuir') for iso in load_iast]
+        result = breakthrough_curve(isotherms, feed, numpy.linspace(0, 4000, 401), **BED)
+        assert result["success"]
+
+        outlet = result["outlet_relative"]
+        assert numpy.allclose(outlet[0], 0)
+        assert numpy.allclose(outlet[-1], 1, atol=1e-2)
+        assert numpy.argmax(outlet[:, 0] > 0.5) < numpy.argmax(outlet[:, 1] > 0.5)
+        # methane is displaced by ethane
+        assert outlet[:, 0].max() > 1
+        assert numpy.allclose(result["loading"][-1, 0], result["table"](feed)[0], rtol=1e-3)
+
+        # in - out = held in the gas and adsorbed
+        time = result["time"]
+        flow = BED["velocity"] * (feed * time[-1] - trapezoid(result["outlet_partial_pressure"], time, axis=0))
+        capacity = BED["bed_density"] * constants.gas_constant * isotherms[0].temperature / (BED["bed_voidage"] * 1e5)
+        dz = BED["bed_length"] / len(result["position"])
+        held = dz * (result["partial_pressure"][-1] + capacity * result["loading"][-1]).sum(axis=0)
+        assert numpy.allclose(flow, held, rtol=1e-3)
+
+        # tables can be reused
+        again = breakthrough_curve(result["table"], feed, time, **BED)
+        assert numpy.allclose(again["outlet_relative"], outlet)
@@ -20,32 +20,10 @@ import numpy
 import pytest
 
 import pygaps
-import pygaps.parsing as pgp
 import pygaps.prediction.iast as pgi
 import pygaps.utilities.exceptions as pgEx
 
 from ..test_utils import mpl_cleanup
-from .conftest import DATA_IAST
-from .conftest import DATA_IAST_PATH
-
-
-@pytest.fixture()
-def load_iast():
-    """A fixture which loads files from the disk."""
-    filepath = DATA_IAST_PATH / DATA_IAST['CH4']['file']
-    ch4 = pgp.isotherm_from_json(filepath)
-    filepath = DATA_IAST_PATH / DATA_IAST['C2H6']['file']
-    c2h6 = pgp.isotherm_from_json(filepath)
-    return ch4, c2h6
-
-
-@pytest.fixture()
-def load_iast_models(load_iast):
-    """Create models from the disk files."""
-    ch4, c2h6 = load_iast
-    ch4_m = pygaps.ModelIsotherm.from_pointisotherm(ch4, model='Langmuir')
-    c2h6_m = pygaps.ModelIsotherm.from_pointisotherm(c2h6, model='Langmuir')
-    return ch4_m, c2h6_m
 
 
 @pytest.mark.prediction
@@ -65,7 +43,7 @@ class TestIAST():
             pgi.iast_point_fraction([ch4, c2h6], [0.1], 1)
 
         # Raises "model cannot be used with IAST"
-        ch4_m = pygaps.ModelIsotherm.from_pointisotherm(ch4, model='Virial')
+        ch4_m = pygaps.ModelIsotherm.from_pointisotherm(ch4, model='Freundlich')
         with pytest.raises(pgEx.ParameterError):
             pgi.iast_point_fraction([ch4_m, c2h6], [0.6, 0.4], 1)
 
@@ -94,6 +72,34 @@ class TestIAST():
 
         assert numpy.isclose(adsorbed_fractions[0], loadings[0], 0.001)
 
+    def test_iast_virial(self, load_iast):
+        """Test with Virial models, integrated in loading space."""
+
+        isotherms = [
+            pygaps.ModelIsotherm.from_pointisotherm(
+                iso, model='Virial', optimization_params={'add_point': True}
+            ) for iso in load_iast
+        ]
+        loadings = pgi.iast_point_fraction(isotherms, [0.5, 0.5], 1)
+        assert numpy.isclose(0.2306, loadings[0], 0.05)
+
+    def test_iast_reverse_roundtrip(self, load_iast, load_iast_models):
+        """Reverse IAST of a ternary IAST result gives back the gas fractions."""
+        ch4, _ = load_iast
+        isotherms = list(load_iast_models) + [
+            pygaps.ModelIsotherm.from_pointisotherm(ch4, model='Toth')
+        ]
+        gas_fraction = numpy.array([0.2, 0.5, 0.3])
+
+        loadings = pgi.iast_point_fraction(isotherms, gas_fraction, 2, warningoff=True)
+        adsorbed_fraction = loadings / numpy.sum(loadings)
+        gas_back, loadings_back = pgi.reverse_iast(
+            isotherms, adsorbed_fraction / numpy.sum(adsorbed_fraction), 2, warningoff=True
+        )
+
+        assert numpy.allclose(gas_back, gas_fraction, atol=1e-6)
+        assert numpy.allclose(loadings_back, loadings, rtol=1e-6)
+
     @mpl_cleanup
     def test_iast_verbose(self, load_iast):
         """Test verbosity."""
@@ -121,7 +127,7 @@ class TestReverseIAST():
             pgi.reverse_iast([ch4, c2h6], [0.1, 0.4], 1)
 
         # Raises "model cannot be used with IAST"
-        ch4_m = pygaps.ModelIsotherm.from_pointisotherm(ch4, model='Virial')
+        ch4_m = pygaps.ModelIsotherm.from_pointisotherm(ch4, model='Freundlich')
         with pytest.raises(pgEx.ParameterError):
             pgi.reverse_iast([ch4_m, c2h6], [0.6, 0.4], 1)
 
@@ -162,6 +168,127 @@ class TestReverseIAST():
         pgi.reverse_iast(load_iast, [0.23064, 0.76936], 1, verbose=True)
 
 
+@pytest.mark.modelling
+class TestReverseIASTRaw():
+    """Test vectorised reverse IAST."""
+    @pytest.mark.parametrize('models', [False, True])
+    def test_reverse_iast_raw(self, load_iast, load_iast_models, models):
+        """Compare with single point reverse IAST, and with IAST."""
+        isotherms = load_iast_models if models else load_iast
+        fractions = numpy.linspace(0.05, 0.95, 10)
+        adsorbed = numpy.stack((fractions, 1 - fractions), axis=1)
+        pressures = numpy.linspace(0.5, 2, 10)
+
+        result = pgi.reverse_iast_raw(isotherms, adsorbed, pressures)
+        assert result['converged'].all()
+        expected = pgi.reverse_iast(isotherms, adsorbed[3], pressures[3], warningoff=True)
+        assert numpy.allclose(result['gas_mole_fraction'][3], expected[0])
+        assert numpy.allclose(result['loading'][3], expected[1])
+
+        forward = pgi.iast_binary_raw(isotherms, result['gas_mole_fraction'] * pressures[:, None])
+        assert numpy.allclose(forward['adsorbed_mole_fraction'], adsorbed)
+
+        # started from the solution
+        warm = pgi.reverse_iast_raw(
+            isotherms, adsorbed, pressures, gas_mole_fraction_guess=result['gas_mole_fraction']
+        )
+        assert numpy.allclose(warm['gas_mole_fraction'], result['gas_mole_fraction'])
+        assert (warm['iterations'] <= 2).all()
+
+    def test_reverse_iast_raw_limits(self, load_iast):
+        """Pure components are solved, and points outside the data fail."""
+        result = pgi.reverse_iast_raw(load_iast, [[1, 0], [0.5, 0.5]], [1, 500])
+
+        assert numpy.allclose(result['gas_mole_fraction'][0], [1, 0])
+        assert numpy.isclose(result['loading'][0, 0], load_iast[0].loading_at(1))
+        assert result['converged'].tolist() == [True, False]
+        assert numpy.isnan(result['gas_mole_fraction'][1]).all()
+
+
+@pytest.mark.modelling
+class TestIASTBinaryRaw():
+    """Test vectorised binary IAST."""
+    @pytest.mark.parametrize('models', [False, True])
+    def test_iast_binary_raw(self, load_iast, load_iast_models, models):
+        """Compare with single point IAST at all compositions."""
+        isotherms = load_iast_models if models else load_iast
+        fractions = numpy.linspace(0.01, 0.99, 10)
+        partial_pressures = numpy.stack((fractions, 1 - fractions), axis=1)
+
+        result = pgi.iast_binary_raw(isotherms, partial_pressures)
+        expected = [pgi.iast_point(isotherms, p, warningoff=True) for p in partial_pressures]
+
+        assert result['converged'].all()
+        assert numpy.allclose(result['loading'], expected, rtol=1e-6)
+
+    def test_iast_binary_raw_limits(self, load_iast):
+        """Pure components are solved, and points outside the data fail."""
+        ch4, c2h6 = load_iast
+        result = pgi.iast_binary_raw(load_iast, [[1, 0], [0, 1], [500, 500]])
+
+        assert numpy.allclose(result['adsorbed_mole_fraction'][:2], [[1, 0], [0, 1]])
+        assert numpy.isclose(result['loading'][0, 0], ch4.loading_at(1))
+        assert numpy.isclose(result['loading'][1, 1], c2h6.loading_at(1))
+        assert result['converged'].tolist() == [True, True, False]
+        assert numpy.isnan(result['loading'][2]).all()
+
+
+@pytest.mark.modelling
+class TestIASTSweep():
+    """Test IAST sweeps with continuation."""
+    @pytest.mark.parametrize('models', [False, True])
+    def test_iast_sweep(self, load_iast, load_iast_models, models):
+        """Compare with vectorised binary IAST."""
+        isotherms = load_iast_models if models else load_iast
+        fractions = numpy.linspace(0.001, 0.999, 20)
+        partial_pressures = numpy.stack((fractions, 1 - fractions), axis=1) * 2
+
+        result = pgi.iast_sweep(isotherms, partial_pressures)
+        expected = pgi.iast_binary_raw(isotherms, partial_pressures)
+
+        assert result['converged'].all()
+        assert numpy.allclose(result['loading'], expected['loading'], rtol=1e-6)
+        assert (result['iterations'] > 0).all()
+        assert (result['nfev'] >= result['iterations']).all()
+
+    def test_iast_sweep_failures(self, load_iast):
+        """Points which cannot be solved are recorded."""
+        partial_pressures = [[0.5, 0.5], [500, 500], [1, 1]]
+        result = pgi.iast_sweep(load_iast, partial_pressures, max_refinements=2)
+
+        assert result['converged'].tolist() == [True, False, True]
+        assert numpy.isnan(result['loading'][1]).all()
+
+
+@pytest.mark.modelling
+class TestIASTFast():
+    """Test IAST solved in the spreading pressure."""
+    @pytest.mark.parametrize('models', [False, True])
+    def test_iast_fast_raw(self, load_iast, load_iast_models, models):
+        """Compare with single point IAST."""
+        isotherms = load_iast_models if models else load_iast
+        partial_pressures = numpy.random.default_rng(0).uniform(0.01, 2, (20, 2))
+
+        result = pgi.iast_fast_raw(isotherms, partial_pressures)
+        expected = [pgi.iast_point(isotherms, p, warningoff=True) for p in partial_pressures]
+
+        assert result['converged'].all()
+        assert numpy.allclose(result['loading'], expected, rtol=1e-8)
+        assert numpy.allclose(result['adsorbed_mole_fraction'].sum(axis=1), 1)
+
+    def test_iast_fast_method(self, load_iast):
+        """The method can be selected in single point IAST."""
+        loadings = pgi.iast_point(load_iast, [1, 1], method="fastiast", warningoff=True)
+        assert numpy.allclose(loadings, pgi.iast_point(load_iast, [1, 1], warningoff=True))
+
+        result = pgi.iast_fast_raw(load_iast, [[500, 500]])
+        assert not result['converged'][0]
+        assert numpy.isnan(result['loading'][0]).all()
+
+        with pytest.raises(pgEx.ParameterError):
+            pgi.iast_point(load_iast, [1, 1], method="bad_method")
+
+
 @pytest.mark.modelling
 class TestIASTVLE():
     """Test IAST VLE function."""
@@ -174,6 +301,11 @@ class TestIASTVLE():
         with pytest.raises(pgEx.ParameterError):
             pgi.iast_binary_vle([ch4], 1)
 
+        # Raises "model cannot be used with IAST"
+        ch4_m = pygaps.ModelIsotherm.from_pointisotherm(ch4, model='Freundlich')
+        with pytest.raises(pgEx.ParameterError):
+            pgi.iast_binary_vle([ch4_m, c2h6], 1)
+
     def test_iast_vle(self, load_iast):
         """Tests the vle-pressure graph"""
 
@@ -222,6 +354,11 @@ class TestIASTSVP():
         with pytest.raises(pgEx.ParameterError):
             pgi.iast_binary_svp([ch4, c2h6], [0.1, 0.4], [1, 2])
 
+        # Raises "model cannot be used with IAST"
+        ch4_m = pygaps.ModelIsotherm.from_pointisotherm(ch4, model='Freundlich')
+        with pytest.raises(pgEx.ParameterError):
+            pgi.iast_binary_svp([ch4_m, c2h6], [0.5, 0.5], [1, 2])
+
     def test_iast_svp(self, load_iast):
         """Test the selectivity-pressure graph with point."""
 
@@ -0,0 +1,69 @@
+"""Tests the cache of IAST results."""
+
+import numpy
+import pytest
+
+import pygaps
+import pygaps.prediction.iast as pgi
+from pygaps.prediction import IASTCache
+
+
+@pytest.mark.modelling
+class TestIASTCache():
+    """Test caching of IAST results."""
+    def test_iast_cache_memory(self, load_iast, load_iast_models):
+        """Check repeated calculations are taken from the cache."""
+        cache = IASTCache(maxsize=2)
+
+        first = pgi.iast_point_fraction(load_iast_models, [0.5, 0.5], 1, cache=cache)
+        assert cache.info()["misses"] == 1
+        second = pgi.iast_point_fraction(load_iast_models, [0.5, 0.5], 1 + 1e-14, cache=cache)
+        assert cache.info()["hits"] == 1
+        assert numpy.allclose(second, first)
+
+        # returned results are copies
+        second[0] = 0
+        third = pgi.iast_point_fraction(load_iast_models, [0.5, 0.5], 1, cache=cache)
+        assert numpy.allclose(third, first)
+        assert cache.info()["hits"] == 2
+
+        # a different pressure or model is a different result
+        pgi.iast_point_fraction(load_iast_models, [0.5, 0.5], 2, cache=cache)
+        henry = pygaps.ModelIsotherm.from_pointisotherm(load_iast[1], model='Henry')
+        pgi.iast_point_fraction([load_iast_models[0], henry], [0.5, 0.5], 1, cache=cache)
+        assert cache.info()["misses"] == 3
+        assert len(cache) == 2
+
+    def test_iast_cache_model_change(self, load_iast_models):
+        """Check results are recalculated after the model parameters change."""
+        cache = IASTCache()
+        first = pgi.iast_point_fraction(load_iast_models, [0.5, 0.5], 1, cache=cache)
+        load_iast_models[0].model.params['K'] *= 100
+        second = pgi.iast_point_fraction(load_iast_models, [0.5, 0.5], 1, cache=cache)
+        assert cache.info()["misses"] == 2
+        assert numpy.allclose(second, pgi.iast_point_fraction(load_iast_models, [0.5, 0.5], 1))
+        assert not numpy.allclose(second, first)
+
+    def test_iast_cache_disabled(self, load_iast_models):
+        """Check a disabled cache is not used."""
+        cache = IASTCache(enabled=False)
+        pgi.iast_point(load_iast_models, [0.5, 0.5], cache=cache)
+        assert len(cache) == 0
+        assert cache.info()["enabled"] is False
+
+        cache.enabled = True
+        pgi.iast_point(load_iast_models, [0.5, 0.5], cache=cache)
+        assert len(cache) == 1
+
+    def test_iast_cache_disk(self, load_iast_models, tmp_path):
+        """Check results persist on disk."""
+        path = tmp_path / "iast.db"
+        first = pgi.iast_point(load_iast_models, [0.5, 0.5], cache=IASTCache(path=path))
+
+        cache = IASTCache(path=path)
+        second = pgi.iast_point(load_iast_models, [0.5, 0.5], cache=cache)
+        assert cache.info()["disk_hits"] == 1
+        assert numpy.allclose(second, first)
+
+        cache.clear(disk=True)
+        assert IASTCache(path=path).get(cache.key(load_iast_models, [0.5, 0.5])) is None
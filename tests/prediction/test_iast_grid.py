@@ -0,0 +1,70 @@
+"""
+Tests relating to IAST calculations over grids.
+
+All functions in /prediction/iast_grid.py are tested here.
+The results are compared against the vectorised IAST functions.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy
+import pytest
+
+import pygaps
+import pygaps.prediction.iast as pgi
+import pygaps.utilities.exceptions as pgEx
+from pygaps.prediction.iast_grid import iast_grid
+
+
+@pytest.mark.modelling
+class TestIASTGrid():
+    """Test IAST over grids."""
+    def test_iast_grid_checks(self, load_iast):
+        """Checks for built-in safeguards."""
+        with pytest.raises(pgEx.ParameterError):
+            iast_grid(load_iast[:1], [1], [1])
+        with pytest.raises(pgEx.ParameterError):
+            iast_grid(load_iast, [1], [[0.5, 0.5, 0]])
+        with pytest.raises(pgEx.ParameterError):
+            iast_grid(load_iast, [1], [[0.6, 0.6]])
+        with pytest.raises(pgEx.ParameterError):
+            iast_grid({298: load_iast, 313: load_iast[:1]}, [1], [0.5])
+
+    def test_iast_grid(self, load_iast):
+        """Compare with vectorised binary IAST, including failed points."""
+        fractions = numpy.linspace(0.1, 0.9, 5)
+        result = iast_grid(load_iast, [0.5, 2, 500], fractions, warningoff=True)
+
+        assert result.index.names == ["temperature", "total_pressure", "composition"]
+        assert len(result) == 15
+        assert not result.loc[(298, 500)]["converged"].any()
+        assert numpy.isnan(result.loc[(298, 500)]["loading_methane"]).all()
+
+        expected = pgi.iast_binary_raw(
+            load_iast, 2 * numpy.stack((fractions, 1 - fractions), axis=1)
+        )
+        solved = result.loc[(298, 2)]
+        assert solved["converged"].all()
+        assert numpy.allclose(solved[["loading_methane", "loading_ethane"]], expected["loading"])
+        x, y = expected["adsorbed_mole_fraction"][:, 0], fractions
+        assert numpy.allclose(solved["selectivity"], (x / y) / ((1 - x) / (1 - y)))
+
+    @pytest.mark.parametrize('parallel', ["n_jobs", "executor"])
+    def test_iast_grid_parallel(self, load_iast, parallel):
+        """Parallel grids are the same as sequential ones."""
+        isotherms = [
+            pygaps.ModelIsotherm.from_pointisotherm(iso, model='Langmuir') for iso in load_iast
+        ]
+        isotherms = {298: isotherms, 313: isotherms}
+        pressures = [0.5, 1, 5]
+        fractions = numpy.linspace(0.1, 0.9, 7)
+
+        expected = iast_grid(isotherms, pressures, fractions)
+        if parallel == "n_jobs":
+            result = iast_grid(isotherms, pressures, fractions, n_jobs=2, chunksize=5)
+        else:
+            with ThreadPoolExecutor(2) as executor:
+                result = iast_grid(isotherms, pressures, fractions, executor=executor, chunksize=5)
+
+        assert result.index.equals(expected.index)
+        assert numpy.allclose(result.to_numpy(dtype=float), expected.to_numpy(dtype=float))
@@ -0,0 +1,128 @@
+"""
+Tests relating to IAST screening of isotherm databases.
+
+All functions in /prediction/iast_screening.py are tested here.
+A temporary database is filled with isotherms made from the IAST
+test isotherms, and the screening compared to IAST on each material.
+"""
+
+import numpy
+import pytest
+
+import pygaps
+import pygaps.parsing as pgp
+import pygaps.prediction.iast as pgi
+import pygaps.utilities.exceptions as pgEx
+from pygaps.modelling import FitCache
+from pygaps.parsing import sqlite as pgsql
+from pygaps.prediction.iast_screening import iast_screen
+from pygaps.utilities.sqlite_db_creator import db_create
+
+from .conftest import DATA_IAST
+from .conftest import DATA_IAST_PATH
+
+
+@pytest.fixture(scope='module')
+def screening_db(tmp_path_factory):
+    """A database with methane and ethane isotherms on several materials."""
+    db_path = tmp_path_factory.mktemp('screening') / 'screening.db'
+    db_create(db_path)
+    ch4 = pgp.isotherm_from_json(DATA_IAST_PATH / DATA_IAST['CH4']['file'])
+    c2h6 = pgp.isotherm_from_json(DATA_IAST_PATH / DATA_IAST['C2H6']['file'])
+
+    isotherms = {}
+    for index in range(4):
+        isotherms[f"M{index}"] = []
+        for isotherm, factor in ((ch4, 1 + 0.2 * index), (c2h6, 1)):
+            # the last material only has a methane isotherm
+            if index == 3 and isotherm is c2h6:
+                continue
+            new = pygaps.PointIsotherm(
+                pressure=isotherm.pressure(),
+                loading=isotherm.loading() * factor,
+                material=f"M{index}",
+                adsorbate=isotherm.adsorbate,
+                temperature=isotherm.temperature,
+                **isotherm.units,
+            )
+            pgsql.isotherm_to_db(new, db_path=db_path, verbose=False)
+            isotherms[f"M{index}"].append(new)
+    return db_path, isotherms
+
+
+@pytest.mark.modelling
+class TestIASTScreening():
+    """Test IAST screening of databases."""
+    def test_iast_screen_checks(self, screening_db):
+        """Checks for built-in safeguards."""
+        db_path, _ = screening_db
+        with pytest.raises(pgEx.ParameterError):
+            iast_screen(["methane"], [1], 1, db_path=db_path)
+        with pytest.raises(pgEx.ParameterError):
+            iast_screen(["methane", "ethane"], [0.5, 0.6], 1, db_path=db_path)
+        with pytest.raises(pgEx.ParameterError):
+            iast_screen(["methane", "ethane"], [0.5, 0.5], 1, desorption_pressure=2, db_path=db_path)
+        with pytest.raises(pgEx.ParameterError):
+            iast_screen(["methane", "ethane"], [0.5, 0.5], 1, criteria={"material": "M0"})
+        with pytest.raises(pgEx.ParameterError):
+            iast_screen(["methane", "ethane"], [0.5, 0.5], 1, rank_by="bad", db_path=db_path)
+
+    def test_iast_screen(self, screening_db):
+        """Materials are ranked, and compared with single point IAST."""
+        db_path, isotherms = screening_db
+        result = iast_screen(
+            ["methane", "ethane"],
+            [0.5, 0.5],
+            1,
+            desorption_pressure=0.1,
+            db_path=db_path,
+        )
+        ranking = result["ranking"]
+
+        assert ranking["material"].tolist() == ["M2", "M1", "M0"]
+        assert ranking["error"].isna().all()
+        assert result["statistics"]["materials"] == 3
+        assert result["statistics"]["solved"] == 3
+
+        for _, row in ranking.iterrows():
+            isos = isotherms[row["material"]]
+            feed = pgi.iast_point_fraction(isos, [0.5, 0.5], 1, warningoff=True)
+            desorption = pgi.iast_point_fraction(isos, [0.5, 0.5], 0.1, warningoff=True)
+            assert numpy.allclose(row[["loading_methane", "loading_ethane"]], feed)
+            assert row["working_capacity"] == pytest.approx(feed[0] - desorption[0])
+
+    def test_iast_screen_failures(self, screening_db):
+        """Materials which fail are recorded and ranked last."""
+        db_path, _ = screening_db
+        result = iast_screen(["methane", "ethane"], [0.5, 0.5], 500, db_path=db_path)
+
+        assert result["ranking"]["error"].notna().all()
+        assert result["statistics"]["failed"] == 3
+
+    def test_iast_screen_resume(self, screening_db, tmp_path):
+        """Fitted models are cached, and screened materials are not screened again."""
+        db_path, _ = screening_db
+        fit_cache = FitCache()
+        args = (["methane", "ethane"], [0.5, 0.5], 1)
+        kwargs = {
+            "db_path": db_path,
+            "model": "Langmuir",
+            "fit_cache": fit_cache,
+            "resume_path": tmp_path / "resume.db",
+            "batch_size": 2,
+        }
+        result = iast_screen(*args, **kwargs)
+        assert result["statistics"]["resumed"] == 0
+        # the ethane isotherms have the same data
+        assert len(fit_cache) == 4
+        assert (result["ranking"]["model_methane"] == "Langmuir").all()
+
+        resumed = iast_screen(*args, **kwargs)
+        assert resumed["statistics"]["resumed"] == 3
+        assert resumed["statistics"]["fit_time"] == 0
+        assert resumed["ranking"].drop(columns="time").equals(result["ranking"].drop(columns="time"))
+
+        # other conditions are not resumed
+        other = iast_screen(["methane", "ethane"], [0.2, 0.8], 1, **kwargs)
+        assert other["statistics"]["resumed"] == 0
+        assert len(fit_cache) == 4
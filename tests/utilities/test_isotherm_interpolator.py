@@ -0,0 +1,93 @@
+"""Tests the isotherm interpolator."""
+
+import timeit
+
+import numpy
+import pytest
+from scipy.interpolate import PchipInterpolator
+from scipy.interpolate import interp1d
+
+from pygaps.utilities.isotherm_interpolator import IsothermInterpolator
+
+KNOWN = numpy.array([0.1, 0.5, 0.3, 1.0, 2.0, 4.0])
+INTERP = numpy.array([1.0, 3.0, 2.0, 4.0, 4.5, 4.8])
+
+
+@pytest.mark.utilities
+@pytest.mark.parametrize('kind', ['linear', 'cubic'])
+@pytest.mark.parametrize('fill', [None, 5, (0.5, 6), 'extrapolate'])
+def test_interpolator_as_interp1d(kind, fill):
+    """Check stored-coefficient interpolation behaves like interp1d."""
+    interpolator = IsothermInterpolator(KNOWN, INTERP, interp_kind=kind, interp_fill=fill)
+    if fill is None:
+        reference = interp1d(KNOWN, INTERP, kind=kind)
+        points = numpy.linspace(0.1, 4, 50)
+    else:
+        reference = interp1d(KNOWN, INTERP, kind=kind, fill_value=fill, bounds_error=False)
+        points = numpy.linspace(0, 5, 50)
+
+    assert interpolator(points) == pytest.approx(reference(points))
+    assert interpolator(0.7) == pytest.approx(reference(0.7))
+    assert interpolator(0.7).shape == ()
+
+
+@pytest.mark.utilities
+def test_interpolator_bounds():
+    """Check values outside bounds raise like interp1d."""
+    interpolator = IsothermInterpolator(KNOWN, INTERP)
+    with pytest.raises(ValueError):
+        interpolator(0.05)
+    with pytest.raises(ValueError):
+        interpolator([1, 5])
+    with pytest.raises(ValueError):
+        IsothermInterpolator(KNOWN, INTERP, interp_fill='random')
+
+
+@pytest.mark.utilities
+def test_interpolator_pchip():
+    """Check monotone interpolation."""
+    interpolator = IsothermInterpolator(KNOWN, INTERP, interp_kind='pchip', interp_fill=(0, 5))
+    order = numpy.argsort(KNOWN)
+    reference = PchipInterpolator(KNOWN[order], INTERP[order])
+    points = numpy.linspace(0.1, 4, 50)
+    assert interpolator(points) == pytest.approx(reference(points))
+    assert numpy.all(numpy.diff(interpolator(points)) >= 0)
+    assert interpolator([0, 10]) == pytest.approx([0, 5])
+
+
+@pytest.mark.utilities
+def test_interpolator_edges():
+    """Check values at the known points, the bounds and on either side of them."""
+    interpolator = IsothermInterpolator(KNOWN, INTERP, interp_fill=(0.5, 6))
+    assert interpolator(KNOWN) == pytest.approx(INTERP)
+    assert interpolator([KNOWN.min(), KNOWN.max()]) == pytest.approx([1.0, 4.8])
+    assert interpolator([0.05, 0, 4.01, 10]) == pytest.approx([0.5, 0.5, 6, 6])
+    assert interpolator(numpy.array([])).shape == (0, )
+
+    single = IsothermInterpolator(KNOWN, INTERP, interp_fill=5)
+    assert single([0.05, 10]) == pytest.approx([5, 5])
+
+    extrapolate = IsothermInterpolator(KNOWN, INTERP, interp_fill='extrapolate')
+    # linear extrapolation from the first and last segments
+    assert extrapolate([0, 5]) == pytest.approx([0.5, 4.95])
+
+
+@pytest.mark.utilities
+@pytest.mark.benchmark
+def test_interpolator_benchmark():
+    """Compare the linear engine with interp1d on a typical isotherm."""
+    known = numpy.linspace(0.01, 1, 40)
+    interp = known / (1 + known)
+
+    def create_and_call(engine):
+        engine(known, interp)(0.5)
+
+    engines = {
+        "interp1d": lambda x, y: interp1d(x, y, fill_value=1, bounds_error=False),
+        "pygaps": lambda x, y: IsothermInterpolator(x, y, interp_fill=1),
+    }
+    timings = {
+        name: min(timeit.repeat(lambda: create_and_call(engine), number=200, repeat=3))
+        for name, engine in engines.items()
+    }
+    assert timings["pygaps"] < timings["interp1d"]
@@ -24,3 +24,21 @@ def test_deep_merge(source, overrides, res):
     util.python_utilities.deep_merge(source, overrides)
     assert source == res
 # yapf: enable
+
+
+@pytest.mark.utilities
+def test_lru_cache():
+    cache = util.python_utilities.LRUCache(maxsize=2)
+    cache['a'] = 1
+    cache['b'] = 2
+    assert cache.get('a') == 1  # 'a' is now most recently used
+    cache['c'] = 3  # evicts 'b'
+    assert 'b' not in cache
+    assert cache.get('b') is None
+    assert cache.get('c') == 3
+    assert cache.info() == {'hits': 2, 'misses': 1, 'size': 2, 'maxsize': 2}
+    assert cache.pop('a') == 1
+    assert cache.pop('a') is None
+    assert 'a' not in cache
+    cache.clear()
+    assert len(cache) == 0
@@ -45,3 +45,12 @@ def test_select_unnamed():
 def test_delete():
     delete = r'DELETE FROM "table" WHERE a = :a AND b = :b'
     assert delete == squ.build_delete(tb, s1)
+
+
+@pytest.mark.utilities
+def test_query(tmp_path):
+    path = tmp_path / 'query.db'
+    squ.db_query(path, 'CREATE TABLE "table" (a TEXT, b REAL)')
+    squ.db_query(path, 'INSERT INTO "table" VALUES (?, ?)', ('x', 1))
+    squ.db_query(path, 'INSERT INTO "table" VALUES (?, ?)', [('y', 2), ('z', 3)])
+    assert squ.db_query(path, 'SELECT a, b FROM "table" WHERE b > ?', (1, )) == [('y', 2), ('z', 3)]